@@ -11,6 +11,45 @@ an URL pattern tree.
 from abc import ABCMeta, abstractmethod
 
 
+def _get_dependent_stores(entity):
+    """Return the entity stores whose caches depend on an entity (or on an
+    entity store) : the entity stores where it is registered, the
+    entity stores whose redirect attributes lead to it (see
+    :func:`django_crucrudile.routers.Router.get_redirect_graph`), and
+    recursively, the entity stores that depend on them. Each entity
+    store is returned once, even if the dependencies make a cycle.
+
+    :argument entity: Entity (or entity store)
+
+    :returns: Dependent entity stores
+    :rtype: list
+
+    >>> from mock import Mock
+    >>>
+    >>> parent = Mock(_parent_stores=None, _dependent_stores=None)
+    >>> child = Mock(_parent_stores=[parent], _dependent_stores=None)
+    >>> entity = Mock(_parent_stores=[child], _dependent_stores=[parent])
+    >>> parent._dependent_stores = [child]
+    >>>
+    >>> _get_dependent_stores(entity) == [child, parent]
+    True
+
+    """
+    stores = []
+    seen = {id(entity)}
+    pending = [entity]
+    while pending:
+        current = pending.pop(0)
+        for linked in current._parent_stores, current._dependent_stores:
+            if linked:
+                for store in tuple(linked):
+                    if id(store) not in seen:
+                        seen.add(id(store))
+                        stores.append(store)
+                        pending.append(store)
+    return stores
+
+
 class Entity(metaclass=ABCMeta):
     """An entity is an abstract class of objects that can be used to make
 an URL pattern tree.
@@ -38,6 +77,21 @@ an URL pattern tree.
                       it should be registered as index.
     :type index: bool
     """
+    _parent_stores = None
+    """
+    :attribute _parent_stores: Entity stores where this entity is
+                               registered (set by
+                               :func:`django_crucrudile.entities.store.EntityStore.store_added`)
+    :type _parent_stores: :class:`weakref.WeakSet`
+    """
+    _dependent_stores = None
+    """
+    :attribute _dependent_stores: Entity stores whose redirect
+                                  attributes lead to this entity
+                                  (set by
+                                  :func:`django_crucrudile.routers.Router.get_redirect_graph`)
+    :type _dependent_stores: :class:`weakref.WeakSet`
+    """
     def __init__(self, index=None):
         """Initialize entity, allow setting :attr:`index` from arguments, and
         add ``redirect`` instance attribute
@@ -48,6 +102,34 @@ an URL pattern tree.
             self.index = index
         self.redirect = None
 
+    def entity_changed(self):
+        """Invalidate the caches of the entity stores where this entity is
+        registered, or whose redirect attributes lead to it (see
+        :func:`django_crucrudile.entities.store.EntityStore.store_changed`),
+        as they may depend on the attributes of this entity.
+
+        This should be called when an attribute used to build the URL
+        patterns of the entity changes.
+
+        >>> from django_crucrudile.entities.store import EntityStore
+        >>>
+        >>> class Entity_(Entity):
+        ...   def patterns(self):
+        ...     pass
+        >>>
+        >>> entity, store = Entity_(), EntityStore()
+        >>> store.register(entity) is entity
+        True
+        >>> version = store._store_version
+        >>>
+        >>> entity.entity_changed()
+        >>> store._store_version == version + 1
+        True
+
+        """
+        for store in _get_dependent_stores(self):
+            store._bump_store_version()
+
     @abstractmethod
     def patterns(self, parents=None,
                  add_redirect=None,
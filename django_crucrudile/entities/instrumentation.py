@@ -0,0 +1,216 @@
+"""Registration statistics, recorded by entity stores when
+registration instrumentation is enabled (see
+:attr:`django_crucrudile.entities.store.EntityStore.instrument_registrations`).
+
+Each entity store class gets its own :class:`RegistrationStats`
+instance (see
+:func:`django_crucrudile.entities.store.EntityStore.get_registration_stats`),
+that also sends the signals defined in
+:mod:`django_crucrudile.entities.signals`.
+
+:func:`get_registration_report` returns the statistics of all the
+instrumented entity store classes.
+
+"""
+from collections import Counter
+from weakref import WeakSet
+
+__all__ = ['RegistrationStats', 'get_registration_report']
+
+
+_instrumented_stats = WeakSet()
+"""Statistics of all the instrumented entity store classes"""
+
+
+def get_key_name(key):
+    """Return a readable name for a register mapping key
+
+    :argument key: Register mapping key
+    :type key: class, tuple of classes or None
+
+    :returns: Key name
+    :rtype: str
+
+    >>> get_key_name(int)
+    'int'
+    >>> get_key_name((int, str))
+    'int, str'
+    >>> get_key_name(None)
+    'None'
+
+    """
+    if key is None:
+        return 'None'
+    elif isinstance(key, (list, tuple)):
+        return ', '.join(get_key_name(item) for item in key)
+    return getattr(key, '__name__', repr(key))
+
+
+class RegistrationStats:
+    """Registration statistics of an entity store class
+
+    :attribute store_class: Entity store class
+    :type store_class: class
+    :attribute registrations: Number of registered entities
+    :type registrations: int
+    :attribute class_registrations: Number of entities registered in
+                                    the base store
+    :type class_registrations: int
+    :attribute apply_map_calls: Number of register map applications
+    :type apply_map_calls: int
+    :attribute apply_map_time: Time spent applying register maps (in
+                               seconds)
+    :type apply_map_time: float
+    :attribute matches: Number of matches for each register mapping
+                        key
+    :type matches: :class:`collections.Counter`
+    :attribute passthroughs: Number of entities that did not match any
+                             register mapping key
+    :type passthroughs: int
+    :attribute misses: Number of entities that did not match any
+                       register mapping key, when a match was required
+                       (``LookupError`` raised)
+    :type misses: int
+
+    >>> stats = RegistrationStats(int)
+    >>> stats.record_registration('entity')
+    >>> stats.record_match('entity', str, 0.5)
+    >>> stats.record_passthrough('entity', 0.25)
+    >>> stats.record_miss('entity', 0.25)
+    >>>
+    >>> sorted(stats.as_dict().items())
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('apply_map_calls', 3),
+     ('apply_map_time', 1.0),
+     ('class_registrations', 1),
+     ('matches', {'str': 1}),
+     ('misses', 1),
+     ('passthroughs', 1),
+     ('registrations', 0),
+     ('store', 'int')]
+
+    """
+    def __init__(self, store_class):
+        """Initialize statistics
+
+        :argument store_class: Entity store class
+        :type store_class: class
+        """
+        self.store_class = store_class
+        self.registrations = 0
+        self.class_registrations = 0
+        self.apply_map_calls = 0
+        self.apply_map_time = 0.0
+        self.matches = Counter()
+        self.passthroughs = 0
+        self.misses = 0
+        _instrumented_stats.add(self)
+        # imported here, so that entity stores do not import Django
+        # signals when instrumentation is disabled
+        from . import signals
+        self._signals = signals
+
+    def record_registration(self, entity, store=None):
+        """Record a registration, and send
+        :data:`django_crucrudile.entities.signals.entity_registered`
+
+        :argument entity: Registered entity
+        :argument store: Entity store instance, or ``None`` for
+                         class-level registrations
+        :type store: :class:`django_crucrudile.entities.store.EntityStore`
+        """
+        if store is None:
+            self.class_registrations += 1
+        else:
+            self.registrations += 1
+        self._signals.entity_registered.send(
+            sender=self.store_class, entity=entity, store=store
+        )
+
+    def record_match(self, entity, key, elapsed):
+        """Record a register mapping match, and send
+        :data:`django_crucrudile.entities.signals.register_map_applied`
+
+        :argument entity: Original entity
+        :argument key: Matching register mapping key
+        :argument elapsed: Time spent applying the register map
+        :type elapsed: float
+        """
+        self.apply_map_calls += 1
+        self.apply_map_time += elapsed
+        self.matches[key] += 1
+        self._signals.register_map_applied.send(
+            sender=self.store_class, entity=entity, key=key, elapsed=elapsed
+        )
+
+    def record_passthrough(self, entity, elapsed):
+        """Record an entity that did not match any register mapping key,
+        and send
+        :data:`django_crucrudile.entities.signals.register_map_passthrough`
+
+        :argument entity: Original entity
+        :argument elapsed: Time spent applying the register map
+        :type elapsed: float
+        """
+        self.apply_map_calls += 1
+        self.apply_map_time += elapsed
+        self.passthroughs += 1
+        self._signals.register_map_passthrough.send(
+            sender=self.store_class, entity=entity, elapsed=elapsed
+        )
+
+    def record_miss(self, entity, elapsed):
+        """Record an entity that did not match any register mapping key
+        when a match was required, and send
+        :data:`django_crucrudile.entities.signals.register_map_missed`
+
+        :argument entity: Original entity
+        :argument elapsed: Time spent applying the register map
+        :type elapsed: float
+        """
+        self.apply_map_calls += 1
+        self.apply_map_time += elapsed
+        self.misses += 1
+        self._signals.register_map_missed.send(
+            sender=self.store_class, entity=entity, elapsed=elapsed
+        )
+
+    def as_dict(self):
+        """Return the statistics as a dictionary (register mapping keys
+        are replaced by their names, see :func:`get_key_name`)
+
+        :returns: Statistics
+        :rtype: dict
+        """
+        matches = Counter()
+        for key, count in self.matches.items():
+            matches[get_key_name(key)] += count
+        return {
+            'store': self.store_class.__name__,
+            'registrations': self.registrations,
+            'class_registrations': self.class_registrations,
+            'apply_map_calls': self.apply_map_calls,
+            'apply_map_time': self.apply_map_time,
+            'matches': dict(matches),
+            'passthroughs': self.passthroughs,
+            'misses': self.misses,
+        }
+
+
+def get_registration_report():
+    """Return the statistics of all instrumented entity store classes,
+    sorted by store class name
+
+    :returns: Statistics (see :func:`RegistrationStats.as_dict`)
+    :rtype: list of dict
+
+    >>> stats = RegistrationStats(type('ReportedStore', (), {}))
+    >>> [report for report in get_registration_report()
+    ...  if report['store'] == 'ReportedStore'] == [stats.as_dict()]
+    True
+
+    """
+    return sorted(
+        (stats.as_dict() for stats in list(_instrumented_stats)),
+        key=lambda report: report['store']
+    )
@@ -0,0 +1,37 @@
+"""Signals sent by entity stores when registration instrumentation is
+enabled (see
+:attr:`django_crucrudile.entities.store.EntityStore.instrument_registrations`).
+
+The sender is always the entity store class. These signals are not
+sent when instrumentation is disabled.
+
+"""
+from django.dispatch import Signal
+
+__all__ = [
+    'entity_registered',
+    'register_map_applied',
+    'register_map_passthrough',
+    'register_map_missed',
+]
+
+
+entity_registered = Signal(providing_args=['entity', 'store'])
+"""Sent when an entity is registered. ``store`` is the entity store
+instance, or ``None`` if the entity was registered in the base store
+(class-level registration)."""
+
+register_map_applied = Signal(providing_args=['entity', 'key', 'elapsed'])
+"""Sent when a register mapping key matched ``entity``. ``elapsed`` is
+the time spent in
+:func:`django_crucrudile.entities.store.EntityStore.register_apply_map`
+(in seconds)."""
+
+register_map_passthrough = Signal(providing_args=['entity', 'elapsed'])
+"""Sent when no register mapping key matched ``entity``, which was
+registered as is."""
+
+register_map_missed = Signal(providing_args=['entity', 'elapsed'])
+"""Sent when no register mapping key matched ``entity``, and
+:func:`django_crucrudile.entities.store.EntityStore.register_apply_map`
+raised ``LookupError``."""
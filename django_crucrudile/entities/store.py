@@ -18,13 +18,31 @@ in which case the register functions will compare their argument to
 any of the elements in the mapping key, and match even if only a
 single item in the mapping key matches the argument.
 
-The base store is copied on each class definition, using a metaclass,
-so that using register functions that class-level won't alter the base
-store of other class definitions.
+The base store and base register maps are shared with the parent
+class on each class definition (using a metaclass), and only copied
+on the first class-level mutation, so that using register functions
+at class-level won't alter the base store of other class definitions,
+without copying them for each subclass.
 
 This module also contains a :func:`provides` decorator, that
 decorates a entity store class, adding an object to its base store.
 
+Registrations (and other entity store mutations) are serialized using
+a lock for each entity store, and entity store readers can use an
+immutable snapshot of the entity store (see
+:func:`EntityStore.get_store_snapshot`), that is replaced after each
+mutation.
+
+Entity stores can be frozen (see :func:`EntityStore.freeze_store`),
+their entities are then stored in a tuple, and they can not be changed
+anymore.
+
+Registrations can be instrumented (see
+:attr:`EntityStore.instrument_registrations`), to record statistics
+and send signals (see
+:mod:`django_crucrudile.entities.instrumentation` and
+:mod:`django_crucrudile.entities.signals`).
+
 Doctests that use functionality in :class:`EntityStore` can be seen in
 other classes (in particular
 :class:`django_crucrudile.routers.Router`). They may help to get a
@@ -34,19 +52,149 @@ mean.
 """
 from collections import OrderedDict
 from abc import ABCMeta
+from threading import RLock
+from time import perf_counter
+from types import MappingProxyType
+from weakref import WeakKeyDictionary, WeakSet
+
+from . import _get_dependent_stores
+from .instrumentation import RegistrationStats
 
 __all__ = ['provides', 'EntityStoreMetaclass', 'EntityStore']
 
 
+_NO_MATCH = object()
+"""Sentinel stored in dispatch caches when no register mapping key
+matched the tested type (``None`` can't be used, as it is a valid
+mapping key)."""
+
+
+_class_registration_lock = RLock()
+"""Lock used to serialize class-level registrations (see
+:func:`EntityStore.register_class`)."""
+
+
+def _share_class_store(cls, name):
+    """Make the new class ``cls`` reference the ``name`` container of
+    its parent, without copying it. The class that owned the container
+    (if any) loses its ownership, so that the next class-level
+    mutation of either class copies it first (see
+    :func:`_own_class_store`).
+
+    :argument cls: New class
+    :type cls: class
+    :argument name: Container attribute name
+    :type name: str
+
+    >>> class Store:
+    ...   _store = []
+    >>> store = _own_class_store(Store, '_store')
+    >>>
+    >>> class NewStore(Store):
+    ...   pass
+    >>> _share_class_store(NewStore, '_store')
+    >>> NewStore._store is Store._store
+    True
+    >>> _own_class_store(Store, '_store') is store
+    False
+    >>> _own_class_store(Store, '_store').append(1)
+    >>> Store._store, NewStore._store
+    ([1], [])
+
+    """
+    flag = name + '_owned'
+    for base in cls.__mro__[1:]:
+        if name in vars(base):
+            if vars(base).get(flag):
+                setattr(base, flag, False)
+            break
+    setattr(cls, name, getattr(cls, name))
+
+
+def _own_class_store(cls, name):
+    """Return the ``name`` container of ``cls``, after replacing it by a
+    copy of itself if ``cls`` does not own it yet (if it is shared with
+    other classes, see :func:`_share_class_store`).
+
+    :argument cls: Class to get container from
+    :type cls: class
+    :argument name: Container attribute name
+    :type name: str
+
+    :returns: Container owned by ``cls``, that can be mutated
+    :rtype: list or dict
+
+    >>> class Store:
+    ...   _store = []
+    >>> store = _own_class_store(Store, '_store')
+    >>> _own_class_store(Store, '_store') is store
+    True
+
+    """
+    flag = name + '_owned'
+    if not vars(cls).get(flag):
+        setattr(cls, name, getattr(cls, name).copy())
+        setattr(cls, flag, True)
+    return getattr(cls, name)
+
+
+def _links_parent_stores(entity):
+    """Return True if the entity can be linked to the entity stores
+    where it is registered (see :func:`EntityStore.store_added`), that
+    is, if its class defines ``_parent_stores`` (entity stores, and
+    :class:`django_crucrudile.entities.Entity` subclasses).
+
+    :argument entity: Registered entity
+
+    :returns: True if the entity can be linked to its entity stores
+    :rtype: bool
+
+    >>> from mock import Mock
+    >>>
+    >>> _links_parent_stores(EntityStore())
+    True
+    >>> _links_parent_stores(Mock())
+    False
+
+    """
+    return getattr(type(entity), '_parent_stores', False) is None
+
+
 def provides(provided, **kwargs):
-    """Return a decorator that uses :func:`EntityStore.register_class` to
-    register the given object in the base store.
+    """Return a decorator that uses
+    :func:`EntityStore.defer_register_class` to register the given
+    object in the base store.
+
+    The registrations are resolved in a single batch (see
+    :func:`EntityStore.register_deferred_classes`), in the order the
+    decorators were applied (bottom to top), when the base store of
+    the decorated class is first read, or when the class is
+    instantiated or subclassed for the first time.
 
     :argument provided: Class (or object) to register in the base store. This
                         can be an object since it may be transformed
                         by :func:`EntityStore.register_apply_map`
     :type provided: object
 
+    >>> class A:
+    ...   pass
+    >>> class B:
+    ...   pass
+    >>>
+    >>> @provides(A)
+    ... @provides(B)
+    ... class Store(EntityStore):
+    ...   pass
+    >>>
+    >>> Store._base_store == [B, A]
+    True
+    >>>
+    >>> class NewStore(Store):
+    ...   pass
+    >>>
+    >>> Store._base_store == NewStore._base_store == [B, A]
+    True
+
     """
 
     def register_obj_in_store(router):
@@ -54,7 +202,7 @@ def provides(provided, **kwargs):
 
         :argument route: Router to register provided object to
         :type router: :class:`EntityStore`"""
-        router.register_class(provided, **kwargs)
+        router.defer_register_class(provided, **kwargs)
         return router
     return register_obj_in_store
 
@@ -68,7 +216,12 @@ class BaseStoreMetaclassMixin(type):
     .. inheritance-diagram:: BaseStoreMetaclassMixin
 
     >>> class Store(metaclass=BaseStoreMetaclassMixin):
-    ...   pass
+    ...   set_register_mapping = classmethod(
+    ...     EntityStore.set_register_mapping.__func__
+    ...   )
+    ...   set_register_class_mapping = classmethod(
+    ...     EntityStore.set_register_class_mapping.__func__
+    ...   )
     >>>
     >>> class FailStore:
     ...   _fail_store = []
@@ -79,12 +232,27 @@ class BaseStoreMetaclassMixin(type):
     >>> class FailNewStore(FailStore):
     ...   pass
 
+    The mappings are shared with the parent class until one of the
+    classes sets a mapping (copy-on-write) :
+
+    >>> (NewStore._base_register_map is
+    ...  Store._base_register_map)
+    True
+    >>> NewStore.set_register_mapping(int, None)
     >>> (NewStore._base_register_map is
     ...  Store._base_register_map)
     False
+    >>> dict(Store._base_register_map), dict(NewStore._base_register_map)
+    ({}, {<class 'int'>: None})
+    >>>
+    >>> Store.set_register_class_mapping(str, None)
     >>> (NewStore._base_register_class_map is
     ...  Store._base_register_class_map)
     False
+    >>> dict(Store._base_register_class_map)
+    {<class 'str'>: None}
+    >>> dict(NewStore._base_register_class_map)
+    {}
 
     >>> (FailNewStore._fail_store is
     ...  FailStore._fail_store)
@@ -111,10 +279,36 @@ class BaseStoreMetaclassMixin(type):
                                          the order they are added (as
                                          multiple mappings may match).
     :type _base_register_class_map: dict
+    :attribute _register_map_version: Incremented when the base
+                                      register map is mutated. Used
+                                      to invalidate the cached
+                                      register maps (see
+                                      :func:`EntityStore.get_cached_register_map`).
+    :type _register_map_version: int
+    :attribute _register_class_map_version: Incremented when the base
+                                            register class map is
+                                            mutated. Used to
+                                            invalidate the cached
+                                            register class map (see
+                                            :func:`EntityStore.get_cached_register_class_map`).
+    :type _register_class_map_version: int
+    :attribute register_map_builds: Number of times the register map
+                                    was computed for this class (using
+                                    :func:`EntityStore.get_register_map`).
+    :type register_map_builds: int
+    :attribute register_class_map_builds: Number of times the register
+                                          class map was computed for
+                                          this class (using
+                                          :func:`EntityStore.get_register_class_map`).
+    :type register_class_map_builds: int
     """
     def __init__(cls, name, bases, attrs):
-        """Replace :attr:`_base_store`, :attr:`_base_register_map` and
-        :attr:`_base_register_class_map` by copies of themselves
+        """Make :attr:`_base_register_map` and
+        :attr:`_base_register_class_map` reference the mappings of
+        the parent class (they get copied on the first mutation, see
+        :func:`EntityStore.set_register_mapping` and
+        :func:`EntityStore.set_register_class_mapping`), and create
+        empty dispatch and register map caches
 
         :argument name: New class name
         :type name: str
@@ -130,8 +324,14 @@ class BaseStoreMetaclassMixin(type):
 
         """
         super().__init__(name, bases, attrs)
-        cls._base_register_map = cls._base_register_map.copy()
-        cls._base_register_class_map = cls._base_register_class_map.copy()
+        _share_class_store(cls, '_base_register_map')
+        _share_class_store(cls, '_base_register_class_map')
+        cls._register_map_version = 0
+        cls._register_class_map_version = 0
+        cls._register_map_cache = {}
+        cls._register_class_map_cache = None
+        cls.register_map_builds = 0
+        cls.register_class_map_builds = 0
 
 
 class EntityStoreMetaclassMixin(type):
@@ -153,24 +353,52 @@ class EntityStoreMetaclassMixin(type):
     >>> class FailNewStore(FailStore):
     ...   pass
 
+    The store is shared with the parent class until one of the
+    classes registers a class (copy-on-write) :
+
+    >>> (NewStore._base_store is
+    ...  Store._base_store)
+    True
+    >>> _own_class_store(NewStore, '_base_store_list').append(int)
     >>> (NewStore._base_store is
     ...  Store._base_store)
     False
+    >>> Store._base_store, NewStore._base_store
+    ([], [<class 'int'>])
 
     >>> (FailNewStore._fail_store is
     ...  FailStore._fail_store)
     True
 
     """
-    _base_store = []
+    _base_store_list = []
     """
-    :attribute _base_store: Routed entity class store, instantiated
-                               upon Router instantiation.
-    :type _base_store: list
+    :attribute _base_store_list: Routed entity class store,
+                                 instantiated upon Router
+                                 instantiation (read it using
+                                 :attr:`_base_store`).
+    :type _base_store_list: list
     """
+    @property
+    def _base_store(cls):
+        """Routed entity class store. Class registrations deferred
+        using :func:`EntityStore.defer_register_class` are resolved
+        before the store is returned.
+
+        :returns: Routed entity class store
+        :rtype: list
+
+        """
+        if vars(cls).get('_deferred_classes'):
+            cls.register_deferred_classes()
+        return cls._base_store_list
+
     def __init__(cls, name, bases, attrs):
-        """Replace :attr:`_base_store`, :attr:`_base_register_map` and
-        :attr:`_base_register_class_map` by copies of themselves
+        """Make :attr:`_base_store` reference the base store of the
+        parent class (it gets copied on the first mutation, see
+        :func:`EntityStore.register_class`). Deferred class
+        registrations of the parent classes are resolved first (see
+        :func:`EntityStore.register_deferred_classes`).
 
         :argument name: New class name
         :type name: str
@@ -186,7 +414,10 @@ class EntityStoreMetaclassMixin(type):
 
         """
         super().__init__(name, bases, attrs)
-        cls._base_store = cls._base_store.copy()
+        for base in cls.__mro__[1:]:
+            if vars(base).get('_deferred_classes'):
+                base.register_deferred_classes()
+        _share_class_store(cls, '_base_store_list')
 
 
 class EntityStoreMetaclass(EntityStoreMetaclassMixin,
@@ -218,20 +449,208 @@ class EntityStore(metaclass=EntityStoreMetaclass):
 
     .. inheritance-diagram:: EntityStore
     """
-    def __init__(self):
+    lazy_base_store = False
+    """
+    :attribute lazy_base_store: If True, the entity classes in the base
+                                store are not instantiated in
+                                :func:`__init__`, but when the entity
+                                store is first accessed (see
+                                :func:`register_base_store`).
+    :type lazy_base_store: bool
+    """
+    instrument_registrations = False
+    """
+    :attribute instrument_registrations: If True, registrations record
+                                         statistics and send signals
+                                         (see
+                                         :func:`get_registration_stats`).
+    :type instrument_registrations: bool
+    """
+    frozen = False
+    """
+    :attribute frozen: If True, the entity store was frozen (see
+                       :func:`freeze_store`), and entities can not be
+                       registered or removed anymore.
+    :type frozen: bool
+    """
+    _parent_stores = None
+    """
+    :attribute _parent_stores: Entity stores where this entity store
+                               is registered (see :func:`store_added`)
+    :type _parent_stores: :class:`weakref.WeakSet`
+    """
+    _dependent_stores = None
+    """
+    :attribute _dependent_stores: Entity stores whose redirect
+                                  attributes lead to this entity
+                                  store (see
+                                  :func:`django_crucrudile.routers.Router.get_redirect_graph`)
+    :type _dependent_stores: :class:`weakref.WeakSet`
+    """
+    def __init__(self, lazy_base_store=None):
         """Initialize router (create empty store and register base
-        store)
+        store, or keep it pending if :attr:`lazy_base_store` is True)
+
+        :argument lazy_base_store: See :attr:`lazy_base_store`
         """
+        if lazy_base_store is not None:
+            self.lazy_base_store = lazy_base_store
+        if vars(type(self)).get('_deferred_classes'):
+            self.register_deferred_classes()
+        self._lock = RLock()
+        self._entities = []
+        self._snapshot = None
+        self._pending_base_store = None
+        self._store_version = 0
+        self._store_index = None
+        self._tree_index = None
+        self._parent_stores = None
         super().__init__()
-        self._store = []
-        self.register_base_store()
+        if self.lazy_base_store:
+            self._pending_base_store = (
+                tuple(type(self)._base_store),
+                self.get_base_store_kwargs()
+            )
+        else:
+            self.register_base_store()
+
+    @property
+    def _store(self):
+        """Entity store (list of registered entities). If the base store
+        is still pending (see :attr:`lazy_base_store`), it gets
+        registered first.
+
+        :returns: Registered entities
+        :rtype: list
+        """
+        if self._pending_base_store is not None:
+            with self._lock:
+                if self._pending_base_store is not None:
+                    self.register_base_store()
+        return self._entities
+
+    def get_store_snapshot(self):
+        """Return an immutable snapshot of the entity store, that can be
+        iterated while other threads register entities.
+
+        The snapshot is built on first use, and replaced after each
+        mutation of the entity store (see :func:`store_added` and
+        :func:`store_removed`). Registrations are serialized using a
+        lock, that is only used here when the snapshot needs to be
+        built.
+
+        :returns: Registered entities
+        :rtype: tuple
+
+        >>> store = EntityStore()
+        >>> store.register(1)
+        1
+        >>> snapshot = store.get_store_snapshot()
+        >>> snapshot
+        (1,)
+        >>> store.get_store_snapshot() is snapshot
+        True
+        >>>
+        >>> store.register(2)
+        2
+        >>> snapshot, store.get_store_snapshot()
+        ((1,), (1, 2))
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._store)
+        return snapshot
+
+    @classmethod
+    def get_registration_stats(cls):
+        """Return the registration statistics of this class, created on
+        first use. They are only recorded when
+        :attr:`instrument_registrations` is True.
+
+        :returns: Registration statistics
+        :rtype: :class:`RegistrationStats
+                <django_crucrudile.entities.instrumentation.RegistrationStats>`
+
+        >>> from mock import Mock
+        >>> from django_crucrudile.entities.signals import (
+        ...   register_map_applied
+        ... )
+        >>>
+        >>> class Class:
+        ...   pass
+        >>> mock_mapping_func = Mock()
+        >>>
+        >>> class Store(EntityStore):
+        ...   instrument_registrations = True
+        ...   @classmethod
+        ...   def get_register_map(self):
+        ...     return {Class: mock_mapping_func}
+        >>>
+        >>> receiver = Mock()
+        >>> register_map_applied.connect(receiver, sender=Store)
+        >>>
+        >>> store = Store()
+        >>> store.register_many([Class(), Class()]) is not None
+        True
+        >>> store.register(1)
+        1
+        >>> store.replace(1, 2)
+        2
+        >>> Store.register_class(Class)
+        <class 'django_crucrudile.entities.store.Class'>
+        >>>
+        >>> stats = Store.get_registration_stats()
+        >>> Store.get_registration_stats() is stats
+        True
+        >>> report = stats.as_dict()
+        >>> report['registrations'], report['class_registrations']
+        (4, 1)
+        >>> report['matches'], report['passthroughs']
+        ({'Class': 2}, 2)
+        >>> report['apply_map_time'] > 0
+        True
+        >>> receiver.call_count
+        2
+        >>> register_map_applied.disconnect(receiver, sender=Store)
+
+        Entities that did not match any key when a match was required
+        are also recorded :
+
+        >>> EntityStore.register_apply_map(
+        ...   1, {Class: None}, silent=False, stats=stats
+        ... )
+        ... # doctest: +NORMALIZE_WHITESPACE
+        Traceback (most recent call last):
+          ...
+        LookupError: Could not find matching key in register
+        mapping. Used test 'isinstance', register mapping bases are
+        'Class', tested against 'int'
+        >>> stats.misses
+        1
+
+        """
+        stats = vars(cls).get('_registration_stats')
+        if stats is None:
+            stats = cls._registration_stats = RegistrationStats(cls)
+        return stats
 
     @staticmethod
     def register_apply_map(entity, mapping,
-                           transform_kwargs=None, silent=True):
+                           transform_kwargs=None, silent=True,
+                           dispatch_cache=None, stats=None):
         """Apply mapping of value in ``mapping`` if ``entity`` is
         subclass (:func:`issubclass`) or instance (:func:`isinstance`) of key
 
+        The first matching key (in the mapping order) is used. If
+        ``dispatch_cache`` is given, the matching key found for a
+        class (or for the type of an instance) is stored in it, along
+        with the mapping it was found in, so that the mapping keys are
+        only tested once for each type and mapping.
+
         :argument entity: Object to pass to found mappings
         :type entity: object or class
         :argument mapping: Register mapping, used to get callable to
@@ -243,6 +662,20 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         :type transform_kwargs: dict
         :argument silent: If set to ``False``, will fail if not
                           matching mapping was found.
+        :argument dispatch_cache: Optional. Cache of matching mapping
+                                  keys, indexed by tested class
+                                  (weakly referenced, so that the
+                                  cache does not keep classes alive)
+                                  and test. The matching keys are only
+                                  used for the mapping they were found
+                                  in, that must not be mutated.
+        :type dispatch_cache: :class:`weakref.WeakKeyDictionary`
+        :argument stats: Optional. Registration statistics, used to
+                         record the matching key (or the lack of
+                         matching key) and the time spent in this
+                         function.
+        :type stats: :class:`RegistrationStats
+                     <django_crucrudile.entities.instrumentation.RegistrationStats>`
 
         :raises LookupError: If ``silent`` is ``False``, and no
                              matching mapping was found
@@ -364,7 +797,69 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         mapping. Used test 'issubclass', register mapping bases are
         '', tested against 'SubClass'
 
+        With a dispatch cache, the mapping keys are not tested again
+        for the same type :
+
+        >>> class_mock = Mock()
+        >>> mapping = {OtherClass: None, Class: class_mock}
+        >>> dispatch_cache = WeakKeyDictionary()
+        >>> applied = EntityStore.register_apply_map(
+        ...   instance,
+        ...   mapping,
+        ...   dispatch_cache=dispatch_cache
+        ... )
+        >>> dispatch_cache[SubClass] == {isinstance: (mapping, Class)}
+        True
+        >>> # the cached key is used for the same mapping, even if it
+        >>> # does not match
+        >>> other_mock = Mock()
+        >>> mapping = {Class: class_mock, OtherClass: other_mock}
+        >>> dispatch_cache[SubClass][isinstance] = mapping, OtherClass
+        >>> applied = EntityStore.register_apply_map(
+        ...   SubClass(), mapping, dispatch_cache=dispatch_cache
+        ... )
+        >>> applied is other_mock.return_value
+        True
+        >>> # but not for another mapping
+        >>> applied = EntityStore.register_apply_map(
+        ...   SubClass(), {Class: class_mock}, dispatch_cache=dispatch_cache
+        ... )
+        >>> applied is class_mock.return_value
+        True
+
+        The tested classes are weakly referenced :
+
+        >>> import gc
+        >>>
+        >>> TemporaryClass = type('TemporaryClass', (Class,), {})
+        >>> EntityStore.register_apply_map(
+        ...   TemporaryClass(), {Class: lambda entity: None},
+        ...   dispatch_cache=dispatch_cache
+        ... )
+        >>> TemporaryClass in dispatch_cache
+        True
+        >>> del TemporaryClass
+        >>> _ = gc.collect()
+        >>> list(dispatch_cache) == [SubClass]
+        True
+
+        Objects whose ``__class__`` is not their type (such as mocks
+        using ``spec``) are not cached :
+
+        >>> dispatch_cache = WeakKeyDictionary()
+        >>> applied = EntityStore.register_apply_map(
+        ...   Mock(spec=SubClass),
+        ...   {Class: class_mock},
+        ...   dispatch_cache=dispatch_cache
+        ... )
+        >>> applied is class_mock.return_value
+        True
+        >>> len(dispatch_cache)
+        0
+
         """
+        if stats is not None:
+            start = perf_counter()
         if transform_kwargs is None:
             transform_kwargs = {}
 
@@ -390,6 +885,38 @@ class EntityStore(metaclass=EntityStoreMetaclass):
                 **transform_kwargs
             )
 
+        def _find_base(test):
+            """Return the first key of the register map matching the
+            entity with the given test (or :data:`_NO_MATCH`)
+
+            """
+            for base in mapping:
+                if _match_entity(base, test):
+                    return base
+            return _NO_MATCH
+
+        def _find_cached_base(test):
+            """Return the first matching key of the register map, using
+            the dispatch cache if possible.
+
+            """
+            if isinstance(entity, type):
+                target = entity
+            elif getattr(entity, '__class__', None) is type(entity):
+                target = type(entity)
+            else:
+                # entity lies about its class (mocks may do that),
+                # isinstance may not give the same result for other
+                # instances of this type
+                return _find_base(test)
+            cached = dispatch_cache.get(target)
+            if cached is None:
+                cached = dispatch_cache.setdefault(target, {})
+            found = cached.get(test)
+            if found is None or found[0] is not mapping:
+                found = cached[test] = mapping, _find_base(test)
+            return found[1]
+
         def _find_entity(test):
             """Find an entity matching the given test in register_map keys, then,
             with the matching value, return :func:`_make_entity(value)`.
@@ -398,15 +925,29 @@ class EntityStore(metaclass=EntityStoreMetaclass):
             ``LookupError`` if silent is False.
 
             """
-            for base, func in mapping.items():
-                if _match_entity(base, test):
-                    # matching key, use value to make entity
-                    return _make_entity(func)
+            if dispatch_cache is None:
+                base = _find_base(test)
+            else:
+                base = _find_cached_base(test)
+
+            if base is not _NO_MATCH:
+                # matching key, use value to make entity
+                made_entity = _make_entity(mapping[base])
+                if stats is not None:
+                    stats.record_match(entity, base, perf_counter() - start)
+                return made_entity
             else:
-                # not returned, so no match found
+                # no match found
                 if silent:
+                    if stats is not None:
+                        stats.record_passthrough(
+                            entity, perf_counter() - start
+                        )
                     return entity
                 else:
+                    if stats is not None:
+                        stats.record_miss(entity, perf_counter() - start)
+
                     def _get_base_names():
                         for base, key in mapping.items():
                             if isinstance(base, tuple):
@@ -445,6 +986,9 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         The base implementation returns a copy of the stored mapping,
         so overriding implementations may append to the return value.
 
+        This method is only called when the mapping cached by
+        :func:`get_cached_register_class_map` needs to be computed.
+
         .. warning::
 
            The matching mapping will be used. This is why this method
@@ -484,6 +1028,11 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         The base implementation returns a copy of the stored mapping,
         so overriding implementations may append to the return value.
 
+        This method is only called when the mapping cached by
+        :func:`get_cached_register_map` needs to be computed. If the
+        returned mapping depends on instance attributes, they must be
+        returned by :func:`get_register_map_cache_key`.
+
         .. warning::
 
            The matching mapping will be used. This is why this method
@@ -509,6 +1058,174 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         """
         return self.get_register_class_map_kwargs()
 
+    @classmethod
+    def get_cached_register_class_map(cls):
+        """Return the register class map returned by
+        :func:`get_register_class_map`, as an immutable mapping.
+
+        The mapping is only computed once for each class, and then
+        again after each call to :func:`set_register_class_mapping`
+        (:attr:`BaseStoreMetaclassMixin.register_class_map_builds` is
+        incremented each time it is computed).
+
+        :returns: Register class mappings
+        :rtype: :class:`types.MappingProxyType`
+
+        >>> from mock import Mock
+        >>>
+        >>> class Class:
+        ...   pass
+        >>> class Store(EntityStore):
+        ...   pass
+        >>>
+        >>> mapping = Store.get_cached_register_class_map()
+        >>> Store.get_cached_register_class_map() is mapping
+        True
+        >>> Store.register_class_map_builds
+        1
+        >>>
+        >>> mapping[Class] = Mock()
+        Traceback (most recent call last):
+          ...
+        TypeError: 'mappingproxy' object does not support item assignment
+
+        >>> mock_mapping_func = Mock()
+        >>> Store.set_register_class_mapping(Class, mock_mapping_func)
+        >>>
+        >>> Store.get_cached_register_class_map() == (
+        ...   {Class: mock_mapping_func}
+        ... )
+        True
+        >>> Store.register_class_map_builds
+        2
+
+        """
+        return cls._get_register_class_map_entry()[0]
+
+    @classmethod
+    def _get_register_class_map_entry(cls):
+        """Return the register class map returned by
+        :func:`get_cached_register_class_map`, and the dispatch cache
+        to use with it (see :func:`register_apply_map`), that is
+        cached along with the mapping.
+
+        :returns: Register class mappings, and dispatch cache
+        :rtype: tuple
+
+        """
+        version = cls._register_class_map_version
+        cached = cls._register_class_map_cache
+        if cached is None or cached[0] != version:
+            mapping = MappingProxyType(
+                OrderedDict(cls.get_register_class_map())
+            )
+            cached = cls._register_class_map_cache = (
+                version, mapping, WeakKeyDictionary()
+            )
+            cls.register_class_map_builds += 1
+        return cached[1:]
+
+    def get_register_map_cache_key(self):
+        """Return a value identifying the instance state used by
+        :func:`get_register_map`. Instances returning the same value
+        share the same cached register map (see
+        :func:`get_cached_register_map`).
+
+        Overriding implementations that use instance attributes in
+        :func:`get_register_map` *MUST* add these attributes to the
+        returned value.
+
+        :returns: Register map cache key
+        :rtype: hashable
+
+        >>> EntityStore().get_register_map_cache_key()
+        ()
+
+        Instances of the same class may use different register maps :
+
+        >>> class Class:
+        ...   pass
+        >>> class SubClass(Class):
+        ...   pass
+        >>>
+        >>> class Store(EntityStore):
+        ...   def __init__(self, base):
+        ...     self.base = base
+        ...     super().__init__()
+        ...   def get_register_map(self):
+        ...     return {self.base: lambda entity: self.base.__name__}
+        ...   def get_register_map_cache_key(self):
+        ...     return (self.base,)
+        >>>
+        >>> Store(Class).register(SubClass())
+        'Class'
+        >>> Store(SubClass).register(SubClass())
+        'SubClass'
+
+        """
+        return ()
+
+    def get_cached_register_map(self):
+        """Return the register map returned by :func:`get_register_map`, as
+        an immutable mapping.
+
+        The mapping is computed once for each class and register map
+        cache key (see :func:`get_register_map_cache_key`), and then
+        again after each call to :func:`set_register_mapping`
+        (:attr:`BaseStoreMetaclassMixin.register_map_builds` is
+        incremented each time it is computed).
+
+        :returns: Register mappings
+        :rtype: :class:`types.MappingProxyType`
+
+        >>> from mock import Mock
+        >>>
+        >>> class Class:
+        ...   pass
+        >>> class Store(EntityStore):
+        ...   pass
+        >>>
+        >>> mapping = Store().get_cached_register_map()
+        >>> Store().get_cached_register_map() is mapping
+        True
+        >>> Store.register_map_builds
+        1
+
+        >>> mock_mapping_func = Mock()
+        >>> Store.set_register_mapping(Class, mock_mapping_func)
+        >>>
+        >>> Store().get_cached_register_map() == (
+        ...   {Class: mock_mapping_func}
+        ... )
+        True
+        >>> Store.register_map_builds
+        2
+
+        """
+        return self._get_register_map_entry()[0]
+
+    def _get_register_map_entry(self):
+        """Return the register map returned by
+        :func:`get_cached_register_map`, and the dispatch cache to use
+        with it (see :func:`register_apply_map`), that is cached along
+        with the mapping (so that they share the same cache key).
+
+        :returns: Register mappings, and dispatch cache
+        :rtype: tuple
+
+        """
+        cls = type(self)
+        key = cls._register_map_version, self.get_register_map_cache_key()
+        try:
+            return cls._register_map_cache[key]
+        except KeyError:
+            entry = cls._register_map_cache[key] = (
+                MappingProxyType(OrderedDict(self.get_register_map())),
+                WeakKeyDictionary()
+            )
+            cls.register_map_builds += 1
+            return entry
+
     @classmethod
     def set_register_class_mapping(self, key, value):
         """Set a base register class mapping, that will be returned (possibly
@@ -535,8 +1252,19 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         ...   {Class: mock_mapping_func}
         ... )
         True
+
+        Deferred class registrations (see :func:`defer_register_class`)
+        are resolved first, using the previous mappings :
+
+        >>> Store.defer_register_class(Class)
+        >>> Store.set_register_class_mapping(Class, Mock())
+        >>> Store._base_store == [mock_mapping_func.return_value]
+        True
         """
-        self._base_register_class_map[key] = value
+        if vars(self).get('_deferred_classes'):
+            self.register_deferred_classes()
+        _own_class_store(self, '_base_register_class_map')[key] = value
+        self._register_class_map_version += 1
 
     @classmethod
     def set_register_mapping(self, key, value):
@@ -564,16 +1292,38 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         ...   {Class: mock_mapping_func}
         ... )
         True
+
+        Setting a mapping clears the cached register maps, along with
+        their dispatch caches, as the previously matching keys may not
+        be the first matching keys anymore :
+
+        >>> class SubClass(Class):
+        ...   pass
+        >>>
+        >>> Store().register(SubClass()) is mock_mapping_func.return_value
+        True
+        >>> _, dispatch_cache = Store()._get_register_map_entry()
+        >>> dispatch_cache[SubClass][isinstance][1] is Class
+        True
+        >>>
+        >>> other_mock = Mock()
+        >>> Store.set_register_mapping(Class, other_mock)
+        >>> Store().register(SubClass()) is other_mock.return_value
+        True
+        >>> Store()._get_register_map_entry()[1] is dispatch_cache
+        False
         """
-        self._base_register_map[key] = value
+        _own_class_store(self, '_base_register_map')[key] = value
+        self._register_map_cache.clear()
+        self._register_map_version += 1
 
     @classmethod
     def register_class(cls, register_cls, map_kwargs=None):
         """Add a route class to :attr:`_base_store`, appling mapping from
-        :func:`get_register_class_map` where required. This route class will
-        be instantiated (with kwargs from :func:`get_base_store_kwargs`)
-        when the Router is itself instiated, using
-        :func:`register_base_store`.
+        :func:`get_cached_register_class_map` where required. This
+        route class will be instantiated (with kwargs from
+        :func:`get_base_store_kwargs`) when the Router is itself
+        instiated, using :func:`register_base_store`.
 
         :argument register_cls: Object to register (usually Route or
                                 Router classes, but could be anything
@@ -612,26 +1362,144 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         >>> store._store == [mock_entity_instance]
         True
         """
-        register_class_map = cls.get_register_class_map()
-        if register_class_map:
-            if map_kwargs is None:
-                map_kwargs = {}
-            map_kwargs = dict(
-                cls.get_register_class_map_kwargs(),
-                **map_kwargs
-            )
+        with _class_registration_lock:
+            cls.defer_register_class(register_cls, map_kwargs)
+            return cls.register_deferred_classes()[-1]
 
-            register_cls = cls.register_apply_map(
-                register_cls,
-                register_class_map,
-                map_kwargs
-            )
-        cls._base_store.append(register_cls)
-        return register_cls
+    @classmethod
+    def defer_register_class(cls, register_cls, map_kwargs=None):
+        """Record a class to add to :attr:`_base_store`. The class will be
+        registered (with the other deferred classes) by
+        :func:`register_deferred_classes`, called when
+        :attr:`_base_store` is read, when the class gets instantiated
+        or subclassed, or when another class is registered using
+        :func:`register_class`.
+
+        :argument register_cls: Object to register (see
+                                :func:`register_class`)
+        :argument map_kwargs: Argument to pass to mapping value if
+                              entity gets transformed.
+        :type map_kwargs: dict
+
+        >>> class Store(EntityStore):
+        ...   pass
+        >>>
+        >>> Store.defer_register_class(int)
+        >>> Store._deferred_classes
+        [(<class 'int'>, None)]
+        >>> Store._base_store
+        [<class 'int'>]
+        >>> Store._deferred_classes is None
+        True
+        >>> Store.register_class(str)
+        <class 'str'>
+        >>> Store._base_store
+        [<class 'int'>, <class 'str'>]
+
+        Subclassing also resolves the deferred registrations :
+
+        >>> Store.defer_register_class(float)
+        >>> class NewStore(Store):
+        ...   pass
+        >>> Store._deferred_classes is None
+        True
+        >>> NewStore._base_store
+        [<class 'int'>, <class 'str'>, <class 'float'>]
+
+        """
+        with _class_registration_lock:
+            deferred = vars(cls).get('_deferred_classes')
+            if deferred is None:
+                deferred = cls._deferred_classes = []
+            deferred.append((register_cls, map_kwargs))
+
+    @classmethod
+    def register_deferred_classes(cls):
+        """Add the classes recorded by :func:`defer_register_class` to
+        :attr:`_base_store`, in the order they were recorded, appling
+        mapping from :func:`get_cached_register_class_map` where
+        required.
+
+        The register class map and its arguments are only computed
+        once for all the deferred classes.
+
+        :returns: The registered classes, transformed by class
+                  register mappings if there was a matching mapping
+        :rtype: list
+
+        >>> from mock import Mock
+        >>> mock_mapping_func = Mock()
+        >>>
+        >>> class Store(EntityStore):
+        ...   @classmethod
+        ...   def get_register_class_map(self):
+        ...     return {str: mock_mapping_func}
+        ...   @classmethod
+        ...   def get_register_class_map_kwargs(self):
+        ...     return {'x': 1}
+        >>>
+        >>> Store.defer_register_class(int)
+        >>> Store.defer_register_class(str, {'y': 2})
+        >>> Store.register_deferred_classes() == [
+        ...   int, mock_mapping_func.return_value
+        ... ]
+        True
+        >>> mock_mapping_func.call_args
+        call(<class 'str'>, x=1, y=2)
+        >>>
+        >>> Store.register_deferred_classes()
+        []
+
+        """
+        with _class_registration_lock:
+            deferred = vars(cls).get('_deferred_classes')
+            if not deferred:
+                return []
+            cls._deferred_classes = None
+            return cls._register_classes(deferred)
+
+    @classmethod
+    def _register_classes(cls, deferred):
+        """Add the given classes to :attr:`_base_store` (see
+        :func:`register_deferred_classes`)
+
+        :argument deferred: Classes to register, and keyword arguments
+                            to pass to mapping values
+        :type deferred: list of 2-tuple
+
+        :returns: The registered classes
+        :rtype: list
+
+        """
+        stats = (cls.get_registration_stats()
+                 if cls.instrument_registrations else None)
+        register_class_map, dispatch_cache = (
+            cls._get_register_class_map_entry()
+        )
+        if register_class_map:
+            base_kwargs = cls.get_register_class_map_kwargs()
+            registered = [
+                cls.register_apply_map(
+                    register_cls,
+                    register_class_map,
+                    dict(base_kwargs, **map_kwargs) if map_kwargs
+                    else base_kwargs,
+                    dispatch_cache=dispatch_cache,
+                    stats=stats
+                )
+                for register_cls, map_kwargs in deferred
+            ]
+        else:
+            registered = [register_cls for register_cls, _ in deferred]
+        _own_class_store(cls, '_base_store_list').extend(registered)
+        if stats is not None:
+            for register_cls in registered:
+                stats.record_registration(register_cls)
+        return registered
 
     def register(self, entity, map_kwargs=None):
         """Register routed entity, applying mapping from
-        :func:`get_register_map` where required
+        :func:`get_cached_register_map` where required
 
         :argument entity: Entity to register
         :type entity: :class:`django_crucrudile.entities.Entity`
@@ -663,22 +1531,667 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         >>> store._store == [mock_entity_instance]
         True
         """
-        register_map = self.get_register_map()
-        if register_map:
-            if map_kwargs is None:
-                map_kwargs = {}
-            map_kwargs = dict(
-                self.get_register_map_kwargs(),
-                **map_kwargs
+        with self._lock:
+            self._check_not_frozen()
+            stats = (self.get_registration_stats()
+                     if self.instrument_registrations else None)
+            register_map, dispatch_cache = self._get_register_map_entry()
+            if register_map:
+                if map_kwargs is None:
+                    map_kwargs = {}
+                map_kwargs = dict(
+                    self.get_register_map_kwargs(),
+                    **map_kwargs
+                )
+
+                entity = self.register_apply_map(
+                    entity,
+                    register_map,
+                    map_kwargs,
+                    dispatch_cache=dispatch_cache,
+                    stats=stats
+                )
+            self._store.append(entity)
+            self.store_added((entity,))
+            if stats is not None:
+                stats.record_registration(entity, self)
+            return entity
+
+    def register_many(self, entities, map_kwargs=None):
+        """Register several routed entities, applying mapping from
+        :func:`get_cached_register_map` where required.
+
+        This gives the same result as calling :func:`register` for each
+        entity (in the same order), but the register map and the
+        mapping keyword arguments are only resolved once, the mapping
+        keys are only tested once for each type of entity (using the
+        dispatch cache), and the entity store is extended once.
+
+        .. note::
+
+           As :func:`register` is not called, overriding implementations
+           of :func:`register` should also override this method.
+
+        :argument entities: Entities to register
+        :type entities: iterable of :class:`django_crucrudile.entities.Entity`
+        :argument map_kwargs: Argument to pass to mapping value if
+                              entities get transformed.
+        :type map_kwargs: dict
+
+        :returns: The registered entities, transformed by register
+                  mappings if there was a matching mapping
+        :rtype: list of :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> mock_mapping_func = Mock()
+        >>> mock_mapping_func.side_effect = lambda entity, **kwargs: (
+        ...   (entity, kwargs)
+        ... )
+        >>>
+        >>> class Class:
+        ...  pass
+        >>> class OtherClass:
+        ...  pass
+        >>> instances = [Class(), OtherClass(), Class()]
+        >>>
+        >>> class Store(EntityStore):
+        ...   @classmethod
+        ...   def get_register_map(self):
+        ...     return {Class: mock_mapping_func}
+        >>>
+        >>> store = Store()
+        >>> registered = store.register_many(instances, map_kwargs={'x': 1})
+        >>> registered == [
+        ...   (instances[0], {'x': 1}),
+        ...   instances[1],
+        ...   (instances[2], {'x': 1})
+        ... ]
+        True
+        >>> store._store == registered
+        True
+
+        Without register mappings :
+
+        >>> store = EntityStore()
+        >>> store.register_many(iter(instances)) == instances
+        True
+
+        """
+        with self._lock:
+            self._check_not_frozen()
+            stats = (self.get_registration_stats()
+                     if self.instrument_registrations else None)
+            register_map, dispatch_cache = self._get_register_map_entry()
+            if register_map:
+                if map_kwargs is None:
+                    map_kwargs = {}
+                map_kwargs = dict(
+                    self.get_register_map_kwargs(),
+                    **map_kwargs
+                )
+
+                entities = [
+                    self.register_apply_map(
+                        entity,
+                        register_map,
+                        map_kwargs,
+                        dispatch_cache=dispatch_cache,
+                        stats=stats
+                    )
+                    for entity in entities
+                ]
+            else:
+                entities = list(entities)
+            self._store.extend(entities)
+            self.store_added(entities)
+            if stats is not None:
+                for entity in entities:
+                    stats.record_registration(entity, self)
+            return entities
+
+    def store_added(self, entities):
+        """Update the store index (if it was built) with entities that were
+        just added to the entity store, link the added entity stores and
+        entities to this store (so that they can notify it when they
+        change, see
+        :func:`django_crucrudile.entities.Entity.entity_changed`), and
+        call :func:`store_changed`.
+
+        :argument entities: Added entities
+        :type entities: iterable of :class:`django_crucrudile.entities.Entity`
+
+        """
+        self._snapshot = None
+        index = self._store_index
+        for entity in entities:
+            if index is not None:
+                self._index_entity(index, entity)
+            if _links_parent_stores(entity):
+                if entity._parent_stores is None:
+                    entity._parent_stores = WeakSet()
+                entity._parent_stores.add(self)
+        self.store_changed()
+
+    def _get_store_position(self, entity):
+        """Return the position of an entity in the entity store (comparing
+        identities).
+
+        :raises ValueError: If the entity is not registered
+
+        """
+        for position, stored in enumerate(self._store):
+            if stored is entity:
+                return position
+        raise ValueError(
+            "{} is not registered in {}".format(entity, self)
+        )
+
+    def store_removed(self, entities):
+        """Update the store index (if it was built) with entities that
+        were just removed from the entity store, unlink the removed
+        entity stores and entities from this store, and call
+        :func:`store_changed`.
+
+        :argument entities: Removed entities
+        :type entities: iterable of :class:`django_crucrudile.entities.Entity`
+
+        """
+        self._snapshot = None
+        index = self._store_index
+        for entity in entities:
+            if index is not None and not self._unindex_entity(index, entity):
+                # index values changed since the entity was indexed,
+                # rebuild the index on next lookup
+                index = self._store_index = None
+            if (_links_parent_stores(entity) and
+                    entity._parent_stores is not None and
+                    not any(stored is entity for stored in self._store)):
+                entity._parent_stores.discard(self)
+        self.store_changed()
+
+    def unregister(self, entity):
+        """Remove a registered entity from the entity store.
+
+        Only the caches of this store, and of the stores where it is
+        registered, are invalidated (see :func:`store_changed`).
+
+        :argument entity: Entity to remove (the registered entity, as
+                          returned by :func:`register`)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: The removed entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If the entity is not registered
+
+        >>> class Entity:
+        ...   def __init__(self, name):
+        ...     self.name = name
+        >>>
+        >>> entities = [Entity('a'), Entity('b')]
+        >>> store = EntityStore()
+        >>> store.register_many(entities) == entities
+        True
+        >>> store.find(name='a') == [entities[0]]
+        True
+        >>>
+        >>> store.unregister(entities[0]) is entities[0]
+        True
+        >>> store._store == [entities[1]]
+        True
+        >>> store.find(name='a')
+        []
+        >>>
+        >>> store.unregister(entities[0])
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: <...Entity object at ...> is not registered in ...
+
+        If the index values of the removed entity changed, the store
+        index is rebuilt :
+
+        >>> entities = [Entity('c'), Entity(['unhashable'])]
+        >>> store.register_many(entities) == entities
+        True
+        >>> entities[0].name = 'b'
+        >>>
+        >>> store.unregister(entities[1]) is entities[1]
+        True
+        >>> store.unregister(entities[0]) is entities[0]
+        True
+        >>> store.find(name='c'), len(store.find(name='b'))
+        ([], 1)
+
+        """
+        with self._lock:
+            self._check_not_frozen()
+            del self._store[self._get_store_position(entity)]
+            self.store_removed((entity,))
+            return entity
+
+    def replace(self, old, new, map_kwargs=None):
+        """Replace a registered entity by another one (at the same position
+        in the entity store), applying mapping from
+        :func:`get_cached_register_map` to the new entity where
+        required.
+
+        Only the caches of this store, and of the stores where it is
+        registered, are invalidated (see :func:`store_changed`).
+
+        :argument old: Entity to replace (the registered entity, as
+                       returned by :func:`register`)
+        :type old: :class:`django_crucrudile.entities.Entity`
+        :argument new: Entity to register in place of ``old``
+        :type new: :class:`django_crucrudile.entities.Entity`
+        :argument map_kwargs: Argument to pass to mapping value if
+                              the new entity gets transformed.
+        :type map_kwargs: dict
+
+        :returns: The registered entity, transformed by register
+                  mappings if there was a matching mapping
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If ``old`` is not registered
+
+        >>> class Entity:
+        ...   def __init__(self, name):
+        ...     self.name = name
+        >>>
+        >>> entities = [Entity('a'), Entity('b')]
+        >>> store = EntityStore()
+        >>> store.register_many(entities) == entities
+        True
+        >>> store.find(name='a') == [entities[0]]
+        True
+        >>>
+        >>> entity = Entity('c')
+        >>> store.replace(entities[0], entity) is entity
+        True
+        >>> store._store == [entity, entities[1]]
+        True
+        >>> store.find(name='a'), store.find(name='c') == [entity]
+        ([], True)
+
+        If the index values of the replaced entity changed, the store
+        index is rebuilt :
+
+        >>> entity.name = 'd'
+        >>> store.replace(entity, entities[0]) is entities[0]
+        True
+        >>> store.find(name='a') == [entities[0]]
+        True
+        >>> store.find(name='c')
+        []
+
+        """
+        with self._lock:
+            self._check_not_frozen()
+            position = self._get_store_position(old)
+
+            stats = (self.get_registration_stats()
+                     if self.instrument_registrations else None)
+            register_map, dispatch_cache = self._get_register_map_entry()
+            if register_map:
+                if map_kwargs is None:
+                    map_kwargs = {}
+                map_kwargs = dict(
+                    self.get_register_map_kwargs(),
+                    **map_kwargs
+                )
+
+                new = self.register_apply_map(
+                    new,
+                    register_map,
+                    map_kwargs,
+                    dispatch_cache=dispatch_cache,
+                    stats=stats
+                )
+            self._store[position] = new
+            self.store_removed((old,))
+            self.store_added((new,))
+            if stats is not None:
+                stats.record_registration(new, self)
+            return new
+
+    def _check_not_frozen(self):
+        """Check that the entity store is not frozen (see
+        :func:`freeze_store`).
+
+        :raises ValueError: If the entity store is frozen
+
+        """
+        if self.frozen:
+            raise ValueError(
+                "{} is frozen, entities can not be registered or "
+                "removed".format(self)
             )
 
-            entity = self.register_apply_map(
-                entity,
-                register_map,
-                map_kwargs
+    def freeze_store(self, recursive=True):
+        """Freeze the entity store : the entities are stored in a tuple
+        (also used as snapshot, see :func:`get_store_snapshot`), the
+        store index is built (see :func:`get_store_index`), and
+        registering or removing entities raises :class:`ValueError`.
+
+        Frozen entity stores do not change anymore, so that the memory
+        pages they use can be shared by forked processes.
+
+        :argument recursive: If True, also freeze the entity stores
+                             registered in this store
+        :type recursive: bool
+
+        >>> parent, child = EntityStore(), EntityStore()
+        >>> parent.register(child) is child
+        True
+        >>> parent.freeze_store()
+        >>> parent._store == parent.get_store_snapshot() == (child,)
+        True
+        >>> child.frozen
+        True
+        >>> parent.register(1)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: <...EntityStore object at ...> is frozen, ...
+        >>> child.unregister(1)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: <...EntityStore object at ...> is frozen, ...
+
+        """
+        with self._lock:
+            if not self.frozen:
+                self._entities = self._snapshot = tuple(self._store)
+                self.get_store_index()
+                self.frozen = True
+        if recursive:
+            for entity in self._entities:
+                if isinstance(entity, EntityStore):
+                    entity.freeze_store()
+
+    def store_changed(self):
+        """Invalidate the caches that depend on the entity store, in this
+        store and in the stores that depend on it (where it is
+        registered, or whose redirect attributes lead to it, see
+        :func:`django_crucrudile.entities._get_dependent_stores`).
+
+        This is called when registering entities, and may be called
+        manually after altering registered entities.
+
+        >>> parent, child = EntityStore(), EntityStore()
+        >>> parent.register(child) is child
+        True
+        >>> version = parent._store_version
+        >>>
+        >>> child.store_changed()
+        >>> parent._store_version == version + 1
+        True
+
+        """
+        self._bump_store_version()
+        for store in _get_dependent_stores(self):
+            store._bump_store_version()
+
+    def _bump_store_version(self):
+        """Increment the store version, that invalidates the caches of
+        this store (see :func:`store_changed`)
+
+        """
+        with self._lock:
+            self._store_version += 1
+
+    def get_index_values(self, entity):
+        """Yield the attributes of an entity that are used as lookups in
+        the store index (see :func:`find`) : ``name``, ``url_name``
+        (from ``get_url_name()``), ``model`` and ``view_class``.
+
+        :argument entity: Entity to get lookup values from
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: Lookup names and values
+        :rtype: iterable of 2-tuple
+
+        >>> from mock import Mock
+        >>>
+        >>> entity = Mock(spec=['name', 'model'])
+        >>> entity.name = 'name'
+        >>> entity.model = None
+        >>>
+        >>> list(EntityStore().get_index_values(entity))
+        [('name', 'name')]
+
+        >>> class Route:
+        ...   name = 'name'
+        ...   def get_url_name(self):
+        ...     return 'model-name'
+        >>>
+        >>> list(EntityStore().get_index_values(Route()))
+        [('name', 'name'), ('url_name', 'model-name')]
+
+        """
+        for attribute in 'name', 'model', 'view_class':
+            value = getattr(entity, attribute, None)
+            if value is not None:
+                yield attribute, value
+        get_url_name = getattr(entity, 'get_url_name', None)
+        if get_url_name is not None:
+            yield 'url_name', get_url_name()
+
+    def _index_entity(self, index, entity):
+        """Add an entity to an index, using lookup values from
+        :func:`get_index_values` (ignoring unhashable values).
+
+        """
+        for attribute, value in self.get_index_values(entity):
+            try:
+                entities = index.setdefault(attribute, {}).setdefault(
+                    value, []
+                )
+            except TypeError:
+                continue
+            entities.append(entity)
+
+    def _unindex_entity(self, index, entity):
+        """Remove an entity from an index, using lookup values from
+        :func:`get_index_values`.
+
+        :returns: False if the entity was not found in the index for
+                  one of its lookup values
+        :rtype: bool
+
+        """
+        for attribute, value in self.get_index_values(entity):
+            try:
+                entities = index[attribute][value]
+            except TypeError:
+                continue
+            except KeyError:
+                return False
+            for position, indexed in enumerate(entities):
+                if indexed is entity:
+                    del entities[position]
+                    break
+            else:
+                return False
+            if not entities:
+                del index[attribute][value]
+        return True
+
+    def get_store_index(self):
+        """Return the store index, that maps lookup names and values (from
+        :func:`get_index_values`) to entities in the entity store. The
+        index is built on first call, and then maintained when
+        registering entities.
+
+        :returns: Store index
+        :rtype: dict of dict of list
+
+        """
+        index = self._store_index
+        if index is None:
+            with self._lock:
+                index = self._store_index
+                if index is None:
+                    index = {}
+                    for entity in self._store:
+                        self._index_entity(index, entity)
+                    self._store_index = index
+        return index
+
+    def get_tree_index(self):
+        """Return the tree index, that maps lookup names and values (from
+        :func:`get_index_values`) to entities in the entity store and in
+        the entity stores registered in it (recursively), in the order
+        used when building URL patterns.
+
+        The index is cached until this store (or a store registered in
+        it) changes (see :func:`store_changed`).
+
+        :returns: Tree index
+        :rtype: dict of dict of list
+
+        """
+        cached = self._tree_index
+        if cached is not None and cached[0] == self._store_version:
+            return cached[1]
+
+        index = {}
+        for entity in self.get_store_snapshot():
+            self._index_entity(index, entity)
+            if isinstance(entity, EntityStore):
+                for attribute, values in entity.get_tree_index().items():
+                    _values = index.setdefault(attribute, {})
+                    for value, entities in values.items():
+                        _values.setdefault(value, []).extend(entities)
+
+        self._tree_index = self._store_version, index
+        return index
+
+    def find(self, recursive=False, **lookups):
+        """Return the registered entities matching all the given lookups
+        (see :func:`get_index_values`), using the store index (or the
+        tree index, if ``recursive`` is True).
+
+        :argument recursive: Also look in entity stores registered in
+                             this store (recursively)
+        :type recursive: bool
+
+        :returns: Matching entities, in registration order
+        :rtype: list
+
+        >>> from mock import Mock
+        >>>
+        >>> class Entity:
+        ...   def __init__(self, name, model=None):
+        ...     self.name, self.model = name, model
+        >>>
+        >>> model = Mock()
+        >>> entities = [Entity('a', model), Entity('b'), Entity('a')]
+        >>>
+        >>> store = EntityStore()
+        >>> store.register_many(entities) == entities
+        True
+        >>>
+        >>> store.find(name='a') == [entities[0], entities[2]]
+        True
+        >>> store.find(name='a', model=model) == [entities[0]]
+        True
+        >>> store.find(name='c')
+        []
+
+        With ``recursive`` set to ``True`` :
+
+        >>> parent = EntityStore()
+        >>> parent.register(store) is store
+        True
+        >>>
+        >>> parent.find(name='b')
+        []
+        >>> parent.find(recursive=True, name='b') == [entities[1]]
+        True
+        >>>
+        >>> entity = Entity('b')
+        >>> store.register(entity) is entity
+        True
+        >>> parent.find(recursive=True, name='b') == [entities[1], entity]
+        True
+        >>> parent.find(recursive=True, name='a') == [
+        ...   entities[0], entities[2]
+        ... ]
+        True
+
+        Unhashable lookup values (and attributes) are ignored, and
+        :func:`find` returns all the registered entities if no lookup
+        is given :
+
+        >>> store.register(Entity(['unhashable'])) is not None
+        True
+        >>> store.find(name=['unhashable'])
+        []
+        >>> store.find() == store._store
+        True
+
+        """
+        if recursive:
+            index = self.get_tree_index()
+        else:
+            index = self.get_store_index()
+
+        results = None
+        for attribute, value in lookups.items():
+            try:
+                entities = index.get(attribute, {}).get(value, [])
+            except TypeError:
+                entities = []
+            if results is None:
+                results = entities
+            else:
+                found = set(map(id, entities))
+                results = [
+                    entity for entity in results
+                    if id(entity) in found
+                ]
+        if results is None:
+            return list(self._store)
+        return list(results)
+
+    def get(self, recursive=False, **lookups):
+        """Return the only registered entity matching all the given lookups
+        (see :func:`find`).
+
+        :argument recursive: See :func:`find`
+        :type recursive: bool
+
+        :returns: Matching entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        :raises LookupError: If no entity, or more than one entity,
+                             matched the lookups
+
+        >>> from mock import Mock
+        >>>
+        >>> class Entity:
+        ...   def __init__(self, name):
+        ...     self.name = name
+        >>>
+        >>> store = EntityStore()
+        >>> entity = store.register(Entity('a'))
+        >>>
+        >>> store.get(name='a') is entity
+        True
+        >>> store.get(name='b')
+        Traceback (most recent call last):
+          ...
+        LookupError: Found 0 entities matching {'name': 'b'} (expected 1)
+
+        """
+        entities = self.find(recursive=recursive, **lookups)
+        if len(entities) != 1:
+            raise LookupError(
+                "Found {} entities matching {} (expected 1)".format(
+                    len(entities), lookups
+                )
             )
-        self._store.append(entity)
-        return entity
+        return entities[0]
 
     def get_base_store_kwargs(self):
         """Arguments passed when instantiating entity classes in
@@ -707,6 +2220,11 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         """Instantiate entity classes in _base_store, using arguments from
         :func:`get_base_store_kwargs`
 
+        If the base store is pending (:attr:`lazy_base_store` is True),
+        use the entity classes and arguments that were saved in
+        :func:`__init__`. This is done automatically on the first
+        access to the entity store.
+
         >>> class Store(EntityStore):
         ...   pass
         >>>
@@ -717,9 +2235,35 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         >>> store._store
         [None]
 
+        With :attr:`lazy_base_store` set to ``True`` :
+
+        >>> from mock import Mock
+        >>> entity_class = Mock()
+        >>>
+        >>> Store.register_class(entity_class) is entity_class
+        True
+        >>>
+        >>> store = Store(lazy_base_store=True)
+        >>> entity_class.called
+        False
+        >>>
+        >>> store._store == [None, entity_class.return_value]
+        True
+        >>> store._store == [None, entity_class.return_value]
+        True
+        >>> entity_class.call_count
+        1
+
         """
-        kwargs = self.get_base_store_kwargs()
-        for item in self._base_store:
-            self.register(
-                item(**kwargs),
-            )
+        with self._lock:
+            pending = self._pending_base_store
+            if pending is None:
+                items = type(self)._base_store
+                kwargs = self.get_base_store_kwargs()
+            else:
+                self._pending_base_store = None
+                items, kwargs = pending
+            for item in items:
+                self.register(
+                    item(**kwargs),
+                )
@@ -0,0 +1,74 @@
+"""This module contains the ``generate_urls`` management command, that
+writes the URL patterns of a router as the source of a static URLconf
+module (see :func:`django_crucrudile.routers.codegen.generate_urls_module`).
+
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routers.codegen import generate_urls_module
+from django_crucrudile.routers.snapshot import import_object
+
+
+class Command(BaseCommand):
+    """Write the URL patterns of a router (given by its import path,
+    as ``module.attribute``) as a static URLconf module
+
+    """
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '-o', '--output', dest='output', default=None,
+            help='File to write the URLconf module to (defaults to '
+                 'standard output).'
+        ),
+    )
+    help = ("Write the URL patterns of a router as a static URLconf "
+            "module, made of url() and include() calls.")
+    args = '<module.router>'
+
+    def handle(self, *args, **options):
+        """Generate the URLconf module of the router, and write it to
+        the output file (or to standard output)
+
+        :raises CommandError: If the router can not be imported, or if
+                              its URL patterns can not be written
+
+        """
+        if len(args) != 1:
+            raise CommandError(
+                "Expected one router path (as 'module.attribute')."
+            )
+        path = args[0]
+        module_name, _, name = path.rpartition('.')
+        try:
+            router = import_object([module_name, name])
+        except (ImportError, AttributeError, ValueError):
+            raise CommandError(
+                "Could not import router '{}'.".format(path)
+            )
+        if not isinstance(router, Router):
+            raise CommandError(
+                "'{}' is not a router.".format(path)
+            )
+
+        try:
+            source = generate_urls_module(
+                router,
+                header='Generated by django-crucrudile from {}, '
+                       'do not edit.'.format(path)
+            )
+        except ValueError as exc:
+            raise CommandError(
+                "Could not write the URL patterns of '{}': {}".format(
+                    path, exc
+                )
+            )
+
+        output = options.get('output')
+        if output is None:
+            self.stdout.write(source, ending='')
+        else:
+            with open(output, 'w') as output_file:
+                output_file.write(source)
@@ -0,0 +1,1182 @@
+"""This module contains URL resolvers that can be used by
+:class:`django_crucrudile.routers.Router` (see
+:func:`django_crucrudile.routers.Router.patterns`), to resolve paths
+with less regular expression matches than the nested resolvers
+Django builds from ``include()``.
+
+These resolvers keep the nested URL patterns (as
+:attr:`url_patterns`), so that reversing URLs (and namespaces) works
+as usual, and only change how paths are resolved. The resolver
+matches (view, arguments, URL name, application name and namespaces)
+are the same as the ones Django would return.
+
+"""
+import re
+from threading import Lock
+
+from django.core.urlresolvers import (
+    RegexURLResolver, ResolverMatch, Resolver404
+)
+from django.utils import six
+from django.utils.translation import get_language
+
+__all__ = [
+    'FlatPattern',
+    'flatten_patterns',
+    'get_dispatch_key',
+    'AlternationPattern',
+    'combine_patterns',
+    'BaseRegexURLResolver',
+    'FlatRegexURLResolver',
+    'PrefixDispatchRegexURLResolver',
+    'AlternationRegexURLResolver',
+    'LazyRegexURLResolver',
+    'warm_patterns',
+]
+
+
+_inline_flags_re = re.compile(r'\(\?[aiLmsux]+\)')
+"""Matches inline flags, that can't be used in the middle of a
+regular expression."""
+
+
+def get_flattenable_regex(pattern, prefix=False):
+    r"""Return the regular expression of an URL pattern (without its
+    leading ``^``), if it can be appended to the regular expressions
+    of its parents. Return ``None`` otherwise.
+
+    To be flattenable, the regular expression must be a string
+    (translatable regular expressions are not), be anchored (start
+    with ``^``), and not use inline flags or alternations (as an
+    alternative may not be anchored, and appending the regular
+    expression to another one would change what it matches). Prefix
+    regular expressions (of resolvers) must also not contain groups,
+    as Django ignores their positional arguments.
+
+    :argument pattern: URL pattern or resolver
+    :type pattern: :class:`django.core.urlresolvers.LocaleRegexProvider`
+    :argument prefix: Check as a prefix (resolver) regular expression
+    :type prefix: bool
+
+    :returns: Flattenable regular expression, or ``None``
+    :rtype: str
+
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> get_flattenable_regex(url('^list$', None))
+    'list$'
+    >>> get_flattenable_regex(url('list$', None)) is None
+    True
+    >>> get_flattenable_regex(url('^(?i)list$', None)) is None
+    True
+    >>> get_flattenable_regex(url('^b$|^c$', None)) is None
+    True
+    >>> get_flattenable_regex(url('^(?P<pk>\d+)/', include([])))
+    '(?P<pk>\\d+)/'
+    >>> get_flattenable_regex(
+    ...   url('^(?P<pk>\d+)/', include([])), prefix=True
+    ... ) is None
+    True
+
+    """
+    regex = pattern._regex
+    if (not isinstance(regex, six.string_types) or
+            not regex.startswith('^') or
+            '|' in regex or
+            _inline_flags_re.search(regex)):
+        return None
+    if prefix and pattern.regex.groups:
+        return None
+    return regex[1:]
+
+
+_backrefs_re = re.compile(r'\(\?P=|\(\?\(|\\[1-9]')
+"""Matches back references (and conditional groups), that would refer
+to other groups when the regular expression is combined with others."""
+
+_named_group_re = re.compile(r'(?<!\\)\(\?P<(\w+)>')
+"""Matches the start of named groups."""
+
+_regex_chars_re = re.compile(r'[\\.^$*+?{}\[\]|()]')
+"""Matches characters that have a special meaning in regular
+expressions."""
+
+_quantifier_chars = frozenset('*+?{')
+"""Characters that start a quantifier (of the preceding character)."""
+
+
+def get_dispatch_key(pattern):
+    r"""Return the first path segment required by the regular expression
+    of an URL pattern, if it starts with a static prefix that contains
+    a slash (as the regular expressions of routers that have a static
+    URL part). Return ``None`` otherwise.
+
+    :argument pattern: URL pattern or resolver
+    :type pattern: :class:`django.core.urlresolvers.LocaleRegexProvider`
+
+    :returns: First path segment, or ``None``
+    :rtype: str
+
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> get_dispatch_key(url('^documents/', include([])))
+    'documents'
+    >>> get_dispatch_key(url(r'^a/b/(?P<pk>\d+)$', None))
+    'a'
+    >>> get_dispatch_key(url('^list$', None)) is None
+    True
+    >>> get_dispatch_key(url('^(?i)a/', include([]))) is None
+    True
+    >>> get_dispatch_key(url('a/', include([]))) is None
+    True
+
+    The static prefix stops before a character that is repeated or
+    optional, and regular expressions that use alternations have no
+    dispatch key (see :func:`get_flattenable_regex`) :
+
+    >>> get_dispatch_key(url('^a/*b$', None)) is None
+    True
+    >>> get_dispatch_key(url('^a/b/?c$', None))
+    'a'
+    >>> get_dispatch_key(url('^a/b$|^c/d$', None)) is None
+    True
+
+    """
+    regex = get_flattenable_regex(pattern)
+    if regex is None:
+        return None
+    match = _regex_chars_re.search(regex)
+    static = regex
+    if match:
+        static = regex[:match.start()]
+        if match.group() in _quantifier_chars:
+            # the last static character is repeated or optional
+            static = static[:-1]
+    if '/' not in static:
+        return None
+    return static.split('/', 1)[0]
+
+
+class FlatPattern:
+    """An URL pattern of a flattened URL pattern tree (see
+    :func:`flatten_patterns`), with the data Django would get from its
+    parent resolvers when resolving it.
+
+    If :attr:`flat` is True, :attr:`regex` matches the whole path
+    handled by the URL pattern (parent prefixes included), and the
+    pattern is a :class:`django.core.urlresolvers.RegexURLPattern`
+    that is not used to resolve the path. Otherwise, :attr:`regex`
+    only matches the parent prefixes, and the remaining path is
+    resolved using the pattern.
+
+    :attribute regex: Compiled regular expression
+    :type regex: :class:`re.RegexObject`
+    :attribute pattern: URL pattern or resolver
+    :type pattern: :class:`django.core.urlresolvers.LocaleRegexProvider`
+    :attribute flat: True if :attr:`regex` matches the whole path
+    :type flat: bool
+    :attribute parents: Parent resolvers (outermost first)
+    :type parents: tuple
+    :attribute default_kwargs: Default keyword arguments of the parent
+                               resolvers
+    :type default_kwargs: dict
+    :attribute app_name: Application name of the outermost parent
+                         resolver that has one
+    :type app_name: str
+    :attribute namespaces: Namespaces of the parent resolvers
+                           (outermost first)
+    :type namespaces: list
+
+    """
+    def __init__(self, regex, pattern, flat,
+                 parents, default_kwargs, app_name, namespaces):
+        """Initialize flat pattern (see class documentation for
+        arguments)
+
+        """
+        self.regex = regex
+        self.pattern = pattern
+        self.flat = flat
+        self.parents = parents
+        self.default_kwargs = default_kwargs
+        self.app_name = app_name
+        self.namespaces = namespaces
+
+    def resolve(self, path):
+        r"""Resolve a path, as the parent resolvers of the URL pattern would
+
+        :argument path: Path to resolve (without the prefix of the
+                        resolver that contains the flattened tree)
+        :type path: str
+
+        :returns: Resolver match, or ``None`` if the path does not match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :raises Resolver404: If the path matches the parent prefixes
+                             but could not be resolved by a non-flat
+                             resolver
+
+        >>> from django.conf.urls import url, include
+        >>>
+        >>> view = lambda: None
+        >>> tree = [url(
+        ...   '^a/', include([url('^(\d+)$', view, name='b')], 'ns', 'ns')
+        ... )]
+        >>>
+        >>> flat_pattern, = flatten_patterns(tree)
+        >>> flat_pattern.regex.pattern, flat_pattern.flat
+        ('^a/(\\d+)$', True)
+        >>>
+        >>> match = flat_pattern.resolve('a/42')
+        >>> match.args, match.kwargs, match.view_name
+        (('42',), {}, 'ns:b')
+        >>> flat_pattern.resolve('a/b') is None
+        True
+
+        """
+        match = self.regex.search(path)
+        if not match:
+            return None
+        if self.flat:
+            kwargs = match.groupdict()
+            if kwargs:
+                args = ()
+            else:
+                args = match.groups()
+            kwargs.update(self.pattern.default_args)
+            sub_match = ResolverMatch(
+                self.pattern.callback, args, kwargs, self.pattern.name
+            )
+        else:
+            sub_match = self.pattern.resolve(path[match.end():])
+            if not sub_match:
+                return None
+        kwargs = dict(self.default_kwargs)
+        kwargs.update(sub_match.kwargs)
+        return ResolverMatch(
+            sub_match.func,
+            sub_match.args,
+            kwargs,
+            sub_match.url_name,
+            self.app_name or sub_match.app_name,
+            self.namespaces + sub_match.namespaces
+        )
+
+    def get_tried(self, sub_tried=None):
+        """Return the list of pattern chains tried when resolving this
+        pattern, in the format used by
+        :class:`django.core.urlresolvers.Resolver404`
+
+        :argument sub_tried: Pattern chains tried by a non-flat
+                             resolver, if any
+        :type sub_tried: list
+
+        :returns: Tried pattern chains
+        :rtype: list
+
+        """
+        chain = list(self.parents) + [self.pattern]
+        if sub_tried is None:
+            return [chain]
+        return [chain + tried for tried in sub_tried]
+
+
+def flatten_patterns(patterns, prefix='', parents=(),
+                     default_kwargs=None, app_name=None, namespaces=None):
+    r"""Yield a :class:`FlatPattern` for each URL pattern in an URL
+    pattern tree (in resolving order).
+
+    Resolvers are walked recursively when their regular expression
+    can be used as a prefix (see :func:`get_flattenable_regex`), and
+    URL patterns whose regular expression can be appended to the
+    prefix are flattened. Other resolvers and URL patterns are kept as
+    is (and are used to resolve the path that remains after the
+    prefix).
+
+    :argument patterns: URL patterns
+    :type patterns: list
+    :argument prefix: Regular expression of the parent resolvers
+                      (without leading ``^``)
+    :type prefix: str
+    :argument parents: Parent resolvers
+    :type parents: tuple
+    :argument default_kwargs: Default keyword arguments of the parent
+                              resolvers
+    :type default_kwargs: dict
+    :argument app_name: Application name of the parent resolvers
+    :type app_name: str
+    :argument namespaces: Namespaces of the parent resolvers
+    :type namespaces: list
+
+    :returns: Flat patterns
+    :rtype: iterable of :class:`FlatPattern`
+
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = lambda: None
+    >>> tree = [
+    ...   url('^a/', include([
+    ...     url('^b$', view),
+    ...     url('c$', view),
+    ...     url('^(?P<d>\d+)/', include([url('^e$', view)])),
+    ...   ], 'ns', 'ns')),
+    ...   url('^f$', view)
+    ... ]
+    >>>
+    >>> [(pattern.regex.pattern, pattern.flat, pattern.namespaces)
+    ...  for pattern in flatten_patterns(tree)]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('^a/b$', True, ['ns']),
+     ('^a/', False, ['ns']),
+     ('^a/', False, ['ns']),
+     ('^f$', True, [])]
+
+    """
+    if default_kwargs is None:
+        default_kwargs = {}
+    if namespaces is None:
+        namespaces = []
+    for pattern in patterns:
+        # lazy resolvers are kept as is, as flattening them would build
+        # their URL patterns
+        lazy = isinstance(pattern, LazyRegexURLResolver)
+        sub_patterns = (
+            None if lazy else getattr(pattern, 'url_patterns', None)
+        )
+        if sub_patterns is not None:
+            regex = get_flattenable_regex(pattern, prefix=True)
+            if regex is not None:
+                sub_kwargs = dict(default_kwargs)
+                sub_kwargs.update(pattern.default_kwargs)
+                for flat_pattern in flatten_patterns(
+                        sub_patterns,
+                        prefix + regex,
+                        parents + (pattern,),
+                        sub_kwargs,
+                        app_name or pattern.app_name,
+                        namespaces + [pattern.namespace]
+                ):
+                    yield flat_pattern
+                continue
+        elif not lazy:
+            regex = get_flattenable_regex(pattern)
+            if regex is not None:
+                yield FlatPattern(
+                    re.compile('^' + prefix + regex, re.UNICODE),
+                    pattern, True,
+                    parents, default_kwargs, app_name, namespaces
+                )
+                continue
+        yield FlatPattern(
+            re.compile('^' + prefix, re.UNICODE),
+            pattern, False,
+            parents, default_kwargs, app_name, namespaces
+        )
+
+
+class AlternationPattern:
+    r"""A group of URL patterns (that are not resolvers), resolved using
+    a single regular expression, that combines their regular
+    expressions in an alternation (see :func:`combine_patterns`).
+
+    Each alternative is wrapped in a group, so that the alternative
+    that matched (and thus the URL pattern) is found using the index of
+    the last matched group. The named groups of the alternatives are
+    renamed (so that group names are unique), and the arguments of the
+    URL pattern are read from the groups of its alternative.
+
+    :attribute patterns: URL patterns
+    :type patterns: tuple of
+                    :class:`django.core.urlresolvers.RegexURLPattern`
+    :attribute regex: Compiled alternation regular expression
+    :type regex: :class:`re.RegexObject`
+    :attribute alternatives: Alternatives (URL pattern, named groups
+                             as ``(name, renamed)`` pairs, and
+                             positional group indexes), by index of
+                             their wrapping group
+    :type alternatives: dict
+
+    >>> from django.conf.urls import url
+    >>>
+    >>> view = lambda: None
+    >>> alternation = AlternationPattern([
+    ...   url('^list$', view, name='list'),
+    ...   url(r'^(?P<pk>\d+)$', view, name='detail', kwargs={'a': 1}),
+    ...   url(r'^(\d+)/(\d+)$', view, name='range'),
+    ... ])
+    >>> alternation.regex.pattern
+    '^(?:(list$)|((?P<_1_pk>\\d+)$)|((\\d+)/(\\d+)$))'
+    >>>
+    >>> match = alternation.resolve('42')
+    >>> match.url_name, match.args, sorted(match.kwargs.items())
+    ('detail', (), [('a', 1), ('pk', '42')])
+    >>> match = alternation.resolve('4/2')
+    >>> match.url_name, match.args, match.kwargs
+    ('range', ('4', '2'), {})
+    >>> alternation.resolve('other') is None
+    True
+    >>> [pattern.name for [pattern] in alternation.get_tried()]
+    ['list', 'detail', 'range']
+
+    """
+    def __init__(self, patterns):
+        """Initialize alternation pattern, and compile its regular
+        expression
+
+        :argument patterns: URL patterns (see :func:`combine_patterns`)
+        :type patterns: list of
+                        :class:`django.core.urlresolvers.RegexURLPattern`
+
+        """
+        self.patterns = tuple(patterns)
+        self.alternatives = {}
+        alternatives = []
+        index = 0
+        for position, pattern in enumerate(self.patterns):
+            regex = get_flattenable_regex(pattern)
+            names = tuple(
+                (name, '_{}_{}'.format(position, name))
+                for name in _named_group_re.findall(regex)
+            )
+            regex = _named_group_re.sub(
+                lambda match: '(?P<_{}_{}>'.format(position, match.group(1)),
+                regex
+            )
+            index += 1
+            self.alternatives[index] = (
+                pattern,
+                names,
+                tuple(range(index + 1, index + 1 + pattern.regex.groups))
+            )
+            index += pattern.regex.groups
+            alternatives.append('({})'.format(regex))
+        self.regex = re.compile(
+            '^(?:{})'.format('|'.join(alternatives)), re.UNICODE
+        )
+
+    def resolve(self, path):
+        """Resolve a path, as the URL pattern of the alternative that
+        matches it would
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: Resolver match, or ``None`` if the path does not match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        """
+        match = self.regex.match(path)
+        if not match:
+            return None
+        pattern, names, indexes = self.alternatives[match.lastindex]
+        kwargs = {name: match.group(renamed) for name, renamed in names}
+        if kwargs:
+            args = ()
+        else:
+            args = tuple(match.group(index) for index in indexes)
+        kwargs.update(pattern.default_args)
+        return ResolverMatch(pattern.callback, args, kwargs, pattern.name)
+
+    def get_tried(self, sub_tried=None):
+        """Return the list of pattern chains tried when resolving this
+        pattern (one for each URL pattern), in the format used by
+        :class:`django.core.urlresolvers.Resolver404`
+
+        :argument sub_tried: Unused (the URL patterns are not resolvers)
+        :type sub_tried: list
+
+        :returns: Tried pattern chains
+        :rtype: list
+
+        """
+        return [[pattern] for pattern in self.patterns]
+
+
+def combine_patterns(patterns, max_groups=99):
+    r"""Yield the URL patterns, replacing the consecutive URL patterns
+    that can be combined by :class:`AlternationPattern` instances (so
+    that they are tried in the same order).
+
+    URL patterns can be combined if they are not resolvers, if their
+    regular expression is flattenable (see
+    :func:`get_flattenable_regex`), and if it does not use back
+    references or alternations (that may not be anchored). An
+    alternation pattern uses at most ``max_groups`` groups (as some
+    Python versions do not support more than 100 groups in a regular
+    expression).
+
+    :argument patterns: URL patterns
+    :type patterns: list
+    :argument max_groups: Maximum number of groups of an alternation
+                          pattern
+    :type max_groups: int
+
+    :returns: URL patterns and alternation patterns
+    :rtype: iterable
+
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = lambda: None
+    >>> patterns = [
+    ...   url('^a$', view),
+    ...   url('^b$', view),
+    ...   url('^c/', include([])),
+    ...   url(r'^(?P<d>\d+)$', view),
+    ...   url(r'^(?P<e>\w)(?P=e)$', view),
+    ...   url('^f$', view),
+    ...   url('^g$', view),
+    ...   url('^h$', view),
+    ...   url('^i|j$', view),
+    ... ]
+    >>> [getattr(pattern, 'regex').pattern
+    ...  for pattern in combine_patterns(patterns, max_groups=2)]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['^(?:(a$)|(b$))',
+     '^c/',
+     '^(?P<d>\\d+)$',
+     '^(?P<e>\\w)(?P=e)$',
+     '^(?:(f$)|(g$))',
+     '^h$',
+     '^i|j$']
+
+    """
+    group = []
+    group_size = 0
+
+    def make_pattern():
+        if len(group) > 1:
+            return AlternationPattern(group)
+        return group[0]
+
+    for pattern in patterns:
+        regex = None
+        if not isinstance(pattern, RegexURLResolver):
+            regex = get_flattenable_regex(pattern)
+            if regex is not None and _backrefs_re.search(regex):
+                regex = None
+        if regex is None:
+            if group:
+                yield make_pattern()
+                group, group_size = [], 0
+            yield pattern
+            continue
+        size = pattern.regex.groups + 1
+        if group and group_size + size > max_groups:
+            yield make_pattern()
+            group, group_size = [], 0
+        group.append(pattern)
+        group_size += size
+    if group:
+        yield make_pattern()
+
+
+class BaseRegexURLResolver(RegexURLResolver):
+    """URL resolver that resolves paths like
+    :class:`django.core.urlresolvers.RegexURLResolver`, but only
+    tries the candidate patterns returned by :func:`get_candidates`
+    (in order).
+
+    Subclasses can use :attr:`resolve_data` to store the data they
+    need to find candidates, built on first use (for each language,
+    as the regular expressions may be translated) by
+    :func:`build_resolve_data`.
+
+    .. inheritance-diagram:: BaseRegexURLResolver
+
+    >>> from django.conf.urls import url
+    >>>
+    >>> view = lambda: None
+    >>> resolver = BaseRegexURLResolver('^/', [url('^a$', view, name='a')])
+    >>> resolver.resolve('/a').url_name
+    'a'
+    >>> resolver.resolve_data
+    >>> resolver.get_tried('a', [['b']])
+    [['a', 'b']]
+
+    """
+    def __init__(self, *args, **kwargs):
+        """Initialize resolver, with an empty resolve data cache
+
+        .. seealso::
+
+           For arguments, see
+           :class:`django.core.urlresolvers.RegexURLResolver`
+
+        """
+        super().__init__(*args, **kwargs)
+        self._resolve_data_dict = {}
+
+    @property
+    def resolve_data(self):
+        """Return the data returned by :func:`build_resolve_data`, for
+        the current language
+
+        :returns: Resolve data
+        """
+        language_code = get_language()
+        try:
+            return self._resolve_data_dict[language_code]
+        except KeyError:
+            data = self._resolve_data_dict[language_code] = (
+                self.build_resolve_data()
+            )
+            return data
+
+    def build_resolve_data(self):
+        """Return the data used by :func:`get_candidates`. The base
+        implementation returns ``None``.
+
+        :returns: Resolve data
+        """
+        return None
+
+    def get_candidates(self, path):
+        """Return the patterns that may match the given path (in order).
+        The base implementation returns all the URL patterns.
+
+        :argument path: Path to resolve (without the prefix matched by
+                        this resolver)
+        :type path: str
+
+        :returns: Candidate patterns
+        :rtype: iterable
+        """
+        return self.url_patterns
+
+    def get_tried(self, candidate, sub_tried=None):
+        """Return the list of pattern chains tried when resolving a
+        candidate pattern, in the format used by
+        :class:`django.core.urlresolvers.Resolver404`
+
+        :argument candidate: Candidate pattern
+        :argument sub_tried: Pattern chains tried by the candidate, if
+                             it is a resolver
+        :type sub_tried: list
+
+        :returns: Tried pattern chains
+        :rtype: list
+        """
+        if sub_tried is None:
+            return [[candidate]]
+        return [[candidate] + tried for tried in sub_tried]
+
+    def resolve(self, path):
+        """Resolve a path using the patterns returned by
+        :func:`get_candidates`, returning the same match as
+        :func:`django.core.urlresolvers.RegexURLResolver.resolve`
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: Resolver match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :raises Resolver404: If the path could not be resolved
+
+        """
+        tried = []
+        match = self.regex.search(path)
+        if match:
+            new_path = path[match.end():]
+            for candidate in self.get_candidates(new_path):
+                try:
+                    sub_match = candidate.resolve(new_path)
+                except Resolver404 as e:
+                    tried.extend(self.get_tried(
+                        candidate, e.args[0].get('tried')
+                    ))
+                else:
+                    if sub_match:
+                        return self.make_match(match, sub_match)
+                    tried.extend(self.get_tried(candidate))
+            raise Resolver404({'tried': tried, 'path': new_path})
+        raise Resolver404({'path': path})
+
+    def make_match(self, match, sub_match):
+        """Return the resolver match for this resolver, from the match of
+        its regular expression and the match of a sub pattern (as
+        :func:`django.core.urlresolvers.RegexURLResolver.resolve`
+        does)
+
+        :argument match: Match of :attr:`regex`
+        :type match: :class:`re.MatchObject`
+        :argument sub_match: Match of a sub pattern
+        :type sub_match: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :returns: Resolver match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        """
+        sub_match_dict = dict(match.groupdict(), **self.default_kwargs)
+        sub_match_dict.update(sub_match.kwargs)
+        return ResolverMatch(
+            sub_match.func,
+            sub_match.args,
+            sub_match_dict,
+            sub_match.url_name,
+            self.app_name or sub_match.app_name,
+            [self.namespace] + sub_match.namespaces
+        )
+
+
+class FlatRegexURLResolver(BaseRegexURLResolver):
+    r"""URL resolver that resolves paths using the flattened URL pattern
+    tree of its URL patterns (see :func:`flatten_patterns`), so that
+    most URL patterns are resolved using a single regular expression
+    match, instead of a match for each resolver level.
+
+    The flattened URL pattern tree is built on first use (for each
+    language, as the regular expressions may be translated).
+
+    .. inheritance-diagram:: FlatRegexURLResolver
+
+    >>> from django.conf.urls import url, include
+    >>> from django.core.urlresolvers import RegexURLResolver
+    >>>
+    >>> view = lambda: None
+    >>> tree = [
+    ...   url('^a/', include([url('^b/(?P<pk>\d+)$', view, name='c')])),
+    ...   url('^d/', include([url('^e$', view, name='f')], 'ns', 'ns')),
+    ...   url('^(?P<g>\d+)/', include([url('^h$', view, name='h')])),
+    ...   url('i$', view, name='i'),
+    ... ]
+    >>>
+    >>> resolver = RegexURLResolver('^/', tree)
+    >>> flat_resolver = FlatRegexURLResolver('^/', tree)
+    >>>
+    >>> for path in ['/a/b/42', '/d/e', '/7/h', '/zi']:
+    ...   match = resolver.resolve(path)
+    ...   flat_match = flat_resolver.resolve(path)
+    ...   print(flat_match.view_name, flat_match.kwargs)
+    ...   assert match.__dict__ == flat_match.__dict__
+    c {'pk': '42'}
+    ns:f {}
+    h {'g': '7'}
+    i {}
+
+    The flattened tree contains the patterns that could not be
+    flattened (and their parent prefixes) :
+
+    >>> [(pattern.regex.pattern, pattern.flat)
+    ...  for pattern in flat_resolver.flat_patterns]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('^a/b/(?P<pk>\\d+)$', True),
+     ('^d/e$', True),
+     ('^', False),
+     ('^', False)]
+
+    >>> flat_resolver.resolve('/7/x')  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: ...
+    >>> flat_resolver.resolve('x')
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: {'path': 'x'}
+
+    Reversing uses the nested URL patterns :
+
+    >>> flat_resolver.namespace_dict['ns'][0]
+    'd/'
+
+    """
+    @property
+    def flat_patterns(self):
+        """Return the flattened URL pattern tree, for the current language
+
+        :returns: Flat patterns
+        :rtype: list of :class:`FlatPattern`
+        """
+        return self.resolve_data
+
+    def build_resolve_data(self):
+        """Flatten the URL pattern tree
+
+        :returns: Flat patterns
+        :rtype: list of :class:`FlatPattern`
+        """
+        return list(flatten_patterns(self.url_patterns))
+
+    def get_candidates(self, path):
+        """Return the flat patterns (see :attr:`flat_patterns`)
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: Flat patterns
+        :rtype: list of :class:`FlatPattern`
+        """
+        return self.flat_patterns
+
+    def get_tried(self, candidate, sub_tried=None):
+        """Return the pattern chains tried when resolving a flat pattern
+        (see :func:`FlatPattern.get_tried`)
+
+        :argument candidate: Flat pattern
+        :type candidate: :class:`FlatPattern`
+        :argument sub_tried: Pattern chains tried by a non-flat
+                             resolver, if any
+        :type sub_tried: list
+
+        :returns: Tried pattern chains
+        :rtype: list
+        """
+        return candidate.get_tried(sub_tried)
+
+
+class PrefixDispatchRegexURLResolver(BaseRegexURLResolver):
+    r"""URL resolver that dispatches paths on their first segment, using
+    a dictionary of the URL patterns that start with a static prefix
+    (see :func:`get_dispatch_key`), such as the URL patterns of routers
+    that have a static URL part.
+
+    Only the URL patterns that have the same first segment as the
+    path, and the URL patterns that can't be dispatched, are tried
+    (in their original order), so the resolver matches are the same
+    as the ones of :class:`django.core.urlresolvers.RegexURLResolver`.
+
+    .. inheritance-diagram:: PrefixDispatchRegexURLResolver
+
+    >>> from django.conf.urls import url, include
+    >>> from django.core.urlresolvers import RegexURLResolver
+    >>>
+    >>> view = lambda: None
+    >>> tree = [
+    ...   url('^$', view, name='index'),
+    ...   url('^a/', include([url('^b$', view, name='b')], 'a', 'a')),
+    ...   url('^c/', include([url('^d$', view, name='d')], 'c', 'c')),
+    ...   url(r'^(?P<pk>\d+)$', view, name='detail'),
+    ... ]
+    >>>
+    >>> resolver = RegexURLResolver('^/', tree)
+    >>> dispatch_resolver = PrefixDispatchRegexURLResolver('^/', tree)
+    >>>
+    >>> for path in ['/', '/a/b', '/c/d', '/42']:
+    ...   match = resolver.resolve(path)
+    ...   dispatch_match = dispatch_resolver.resolve(path)
+    ...   print(dispatch_match.view_name, dispatch_match.kwargs)
+    ...   assert match.__dict__ == dispatch_match.__dict__
+    index {}
+    a:b {}
+    c:d {}
+    detail {'pk': '42'}
+
+    >>> [pattern.regex.pattern
+    ...  for pattern in dispatch_resolver.get_candidates('c/d')]
+    ['^$', '^c/', '^(?P<pk>\\d+)$']
+    >>> dispatch_resolver.resolve('/c/x')  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: ...
+
+    """
+    def build_resolve_data(self):
+        """Build the dispatch table, that maps first segments to the URL
+        patterns to try (those that have this first segment, and
+        those that can't be dispatched), and the URL patterns to try
+        when the first segment is not in the table (those that can't be
+        dispatched).
+
+        :returns: Dispatch table, and default URL patterns
+        :rtype: 2-tuple
+        """
+        patterns = list(self.url_patterns)
+        keys = [get_dispatch_key(pattern) for pattern in patterns]
+        default = tuple(
+            pattern for pattern, key in zip(patterns, keys) if key is None
+        )
+        table = {}
+        for key in set(keys):
+            if key is not None:
+                table[key] = tuple(
+                    pattern for pattern, _key in zip(patterns, keys)
+                    if _key is None or _key == key
+                )
+        return table, default
+
+    def get_candidates(self, path):
+        """Return the URL patterns that may match the given path (in
+        order), using the dispatch table
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: Candidate patterns
+        :rtype: tuple
+        """
+        table, default = self.resolve_data
+        return table.get(path.split('/', 1)[0], default)
+
+
+class AlternationRegexURLResolver(BaseRegexURLResolver):
+    r"""URL resolver that resolves its consecutive URL patterns (that
+    are not resolvers) using a single regular expression (see
+    :func:`combine_patterns` and :class:`AlternationPattern`), such as
+    the URL patterns of the routes of a model router.
+
+    The resolver matches are the same as the ones of
+    :class:`django.core.urlresolvers.RegexURLResolver`.
+
+    .. inheritance-diagram:: AlternationRegexURLResolver
+
+    >>> from django.conf.urls import url, include
+    >>> from django.core.urlresolvers import RegexURLResolver
+    >>>
+    >>> view = lambda: None
+    >>> tree = [
+    ...   url('^$', view, name='index'),
+    ...   url(r'^(?P<pk>\d+)$', view, name='detail'),
+    ...   url('^a/', include([url('^b$', view, name='b')], 'a', 'a')),
+    ...   url(r'^(\w+)$', view, name='slug'),
+    ... ]
+    >>>
+    >>> resolver = RegexURLResolver('^/', tree, app_name='app')
+    >>> alternation_resolver = AlternationRegexURLResolver(
+    ...   '^/', tree, app_name='app'
+    ... )
+    >>>
+    >>> for path in ['/', '/42', '/a/b', '/slug']:
+    ...   match = resolver.resolve(path)
+    ...   alternation_match = alternation_resolver.resolve(path)
+    ...   print(alternation_match.view_name,
+    ...         alternation_match.args, alternation_match.kwargs)
+    ...   assert match.__dict__ == alternation_match.__dict__
+    index () {}
+    detail () {'pk': '42'}
+    a:b () {}
+    slug ('slug',) {}
+
+    >>> try:
+    ...   resolver.resolve('/a/c')
+    ... except Resolver404 as e:
+    ...   tried = e.args[0]['tried']
+    >>> try:
+    ...   alternation_resolver.resolve('/a/c')
+    ... except Resolver404 as e:
+    ...   tried == e.args[0]['tried']
+    True
+
+    """
+    def build_resolve_data(self):
+        """Combine the URL patterns (see :func:`combine_patterns`)
+
+        :returns: URL patterns and alternation patterns
+        :rtype: list
+        """
+        return list(combine_patterns(self.url_patterns))
+
+    def get_candidates(self, path):
+        """Return the combined URL patterns
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: URL patterns and alternation patterns
+        :rtype: list
+        """
+        return self.resolve_data
+
+    def get_tried(self, candidate, sub_tried=None):
+        """Return the pattern chains tried when resolving a candidate
+        (see :func:`AlternationPattern.get_tried` for alternation
+        patterns)
+
+        :argument candidate: URL pattern or alternation pattern
+        :argument sub_tried: Pattern chains tried by the candidate, if
+                             it is a resolver
+        :type sub_tried: list
+
+        :returns: Tried pattern chains
+        :rtype: list
+        """
+        if isinstance(candidate, AlternationPattern):
+            return candidate.get_tried(sub_tried)
+        return super().get_tried(candidate, sub_tried)
+
+
+class LazyRegexURLResolver(RegexURLResolver):
+    r"""URL resolver that gets the URL resolver it stands for (its regular
+    expression, namespace and application name must be the same) from
+    a callable, on first use : when a path enters its prefix, when
+    reading its URL patterns (such as when reversing an URL name in its
+    namespace) or its reverse table. Until then, the URL patterns do
+    not have to be built.
+
+    Getting the URL resolver is thread-safe (the callable is only
+    called once).
+
+    .. inheritance-diagram:: LazyRegexURLResolver
+
+    :attribute get_resolver: Callable that returns the URL resolver
+    :type get_resolver: callable
+
+    >>> from django.conf.urls import url, include
+    >>> from django.core.urlresolvers import reverse
+    >>>
+    >>> view = lambda: None
+    >>> calls = []
+    >>>
+    >>> def get_resolver():
+    ...   calls.append(None)
+    ...   return url('^a/', include(
+    ...     [url(r'^(?P<pk>\d+)$', view, name='b')], 'a', 'a'
+    ...   ))
+    >>>
+    >>> lazy = LazyRegexURLResolver(
+    ...   '^a/', get_resolver, namespace='a', app_name='a'
+    ... )
+    >>> urlconf = (url('^c$', view, name='c'), lazy)
+    >>> root = RegexURLResolver('^/', urlconf)
+    >>>
+    >>> root.resolve('/c').url_name, lazy.is_built
+    ('c', False)
+    >>> reverse('c', urlconf), lazy.is_built
+    ('/c', False)
+    >>> root.resolve('/a/42').view_name, lazy.is_built
+    ('a:b', True)
+    >>> reverse('a:b', urlconf, kwargs={'pk': 42})
+    '/a/42'
+    >>> len(calls)
+    1
+    >>> lazy.resolve('b/42')  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: ...
+
+    """
+    def __init__(self, regex, get_resolver,
+                 default_kwargs=None, app_name=None, namespace=None):
+        """Initialize lazy resolver
+
+        :argument regex: Regular expression (of the URL resolver)
+        :type regex: str
+        :argument get_resolver: See :attr:`get_resolver`
+        :type get_resolver: callable
+
+        .. seealso::
+
+           For other arguments, see
+           :class:`django.core.urlresolvers.RegexURLResolver`
+
+        """
+        super().__init__(regex, None, default_kwargs, app_name, namespace)
+        self.get_resolver = get_resolver
+        self._resolver = None
+        self._resolver_lock = Lock()
+
+    @property
+    def resolver(self):
+        """Return the URL resolver, getting it from :attr:`get_resolver` if
+        it was not built yet
+
+        :returns: URL resolver
+        :rtype: :class:`django.core.urlresolvers.RegexURLResolver`
+        """
+        resolver = self._resolver
+        if resolver is None:
+            with self._resolver_lock:
+                resolver = self._resolver
+                if resolver is None:
+                    resolver = self._resolver = self.get_resolver()
+        return resolver
+
+    @property
+    def is_built(self):
+        """Return True if the URL resolver was built
+
+        :returns: True if the URL resolver was built
+        :rtype: bool
+        """
+        return self._resolver is not None
+
+    @property
+    def url_patterns(self):
+        """Return the URL patterns of the URL resolver
+
+        :returns: URL patterns
+        :rtype: list
+        """
+        return self.resolver.url_patterns
+
+    @property
+    def reverse_table(self):
+        """Return the reverse table of the URL resolver (see
+        :class:`django_crucrudile.reversers.ReverseTable`), if it has
+        one
+
+        :returns: Reverse table, or ``None``
+        :rtype: :class:`django_crucrudile.reversers.ReverseTable`
+        """
+        return getattr(self.resolver, 'reverse_table', None)
+
+    def resolve(self, path):
+        """Resolve a path using the URL resolver, if the path enters the
+        prefix of this resolver
+
+        :argument path: Path to resolve
+        :type path: str
+
+        :returns: Resolver match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :raises Resolver404: If the path could not be resolved
+
+        """
+        if not self.regex.search(path):
+            raise Resolver404({'path': path})
+        return self.resolver.resolve(path)
+
+
+def warm_patterns(patterns):
+    r"""Build the caches of an URL pattern tree for the current language,
+    that are otherwise built on first use : the compiled regular
+    expressions, the URL resolvers of lazy resolvers, the resolve data
+    of the resolvers (see :attr:`BaseRegexURLResolver.resolve_data`),
+    the reverse dictionaries of the resolvers, and their reverse tables
+    (see :class:`django_crucrudile.reversers.ReverseTable`).
+
+    This can be used before forking worker processes, so that they
+    don't have to build these caches (and don't write in the memory
+    pages they share with their parent process).
+
+    :argument patterns: URL patterns
+    :type patterns: list
+
+    :returns: Number of URL patterns in the tree
+    :rtype: int
+
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = lambda: None
+    >>> lazy = LazyRegexURLResolver(
+    ...   '^b/', lambda: url('^b/', include([url('^c$', view)]))
+    ... )
+    >>> resolver = PrefixDispatchRegexURLResolver(
+    ...   '^/', [url(r'^a/(?P<pk>\d+)$', view, name='a'), lazy]
+    ... )
+    >>>
+    >>> warm_patterns([resolver])
+    4
+    >>> lazy.is_built, resolver.resolve_data is not None
+    (True, True)
+    >>> get_language() in resolver._reverse_dict
+    True
+
+    """
+    count = 0
+    for pattern in patterns:
+        pattern.regex
+        count += 1
+        if isinstance(pattern, LazyRegexURLResolver):
+            pattern.reverse_dict
+            pattern = pattern.resolver
+            pattern.regex
+        if isinstance(pattern, RegexURLResolver):
+            if isinstance(pattern, BaseRegexURLResolver):
+                pattern.resolve_data
+            pattern.reverse_dict
+            reverse_table = getattr(pattern, 'reverse_table', None)
+            if reverse_table is not None:
+                reverse_table.entries
+            count += warm_patterns(pattern.url_patterns)
+    return count
@@ -0,0 +1,413 @@
+"""This module contains the reverse tables built by
+:class:`django_crucrudile.routers.Router` alongside its URL patterns
+(see :func:`django_crucrudile.routers.Router.get_reverse_table`), that
+can be used to reverse URL names without populating the reverse
+dictionaries of Django resolvers (which walks the whole URL pattern
+tree, on the first call to :func:`django.core.urlresolvers.reverse`
+for each resolver and language).
+
+The reverse tables are built as Django would build the reverse
+dictionaries of the resolvers (and of the namespace resolvers used by
+:func:`django.core.urlresolvers.reverse`), and reversing uses the same
+algorithm, so the reversed URLs are the same as the ones Django would
+return.
+
+"""
+import re
+
+from django import VERSION as DJANGO_VERSION
+from django.core.urlresolvers import (
+    LocaleRegexProvider, RegexURLResolver, NoReverseMatch, get_script_prefix
+)
+from django.utils.encoding import force_text, iri_to_uri
+from django.utils.http import urlquote
+from django.utils.regex_helper import normalize
+
+from django_crucrudile.resolvers import LazyRegexURLResolver
+
+__all__ = ['ReverseTable']
+
+
+def _rewrites_scheme_relative_urls(version=DJANGO_VERSION):
+    """Return True if :func:`django.core.urlresolvers.reverse` rewrites
+    the reversed URLs that start with ``//`` (that would be scheme
+    relative) in the given Django version (this was added in Django
+    1.4.20, 1.6.11, 1.7.7 and 1.8)
+
+    :argument version: Django version
+    :type version: tuple
+
+    :rtype: bool
+
+    >>> _rewrites_scheme_relative_urls((1, 6, 10, 'final', 0))
+    False
+    >>> _rewrites_scheme_relative_urls((1, 6, 11, 'final', 0))
+    True
+    >>> _rewrites_scheme_relative_urls((1, 8, 0, 'final', 0))
+    True
+
+    """
+    fixed = {(1, 4): 20, (1, 6): 11, (1, 7): 7}
+    if version[:2] in fixed:
+        return version[2] >= fixed[version[:2]]
+    return version[:2] >= (1, 8)
+
+
+def _combine(parent, matches):
+    """Combine the possibilities of a parent regular expression with the
+    possibilities of a child regular expression (as returned by
+    :func:`django.utils.regex_helper.normalize`)
+
+    """
+    return [
+        (piece + suffix, p_args + args)
+        for piece, p_args in parent
+        for suffix, args in matches
+    ]
+
+
+class ReverseTable:
+    r"""Reverse table of an URL pattern list, that maps URL names (fully
+    namespaced, such as ``namespace:sub-namespace:name``) to the
+    possibilities Django would use to reverse them (format strings and
+    parameter names, regular expression, and default arguments), in the
+    order Django would try them.
+
+    :attribute entries: Reverse entries (list of 3-tuples of
+                        possibilities, regular expression and default
+                        arguments), by URL name
+    :type entries: dict
+
+    >>> from django.conf.urls import url, include
+    >>> from django.core.urlresolvers import reverse
+    >>>
+    >>> view = lambda: None
+    >>> urlpatterns = (
+    ...   url('^$', view, name='index'),
+    ...   url(r'^(?P<pk>\d+)$', view, name='detail'),
+    ...   url('^a/', include([
+    ...     url(r'^(\d+)/(\d+)$', view, name='range'),
+    ...     url('^b/', include([url('^c$', view, name='c')], 'b', 'b')),
+    ...   ], 'a', 'a')),
+    ... )
+    >>> table = ReverseTable.from_patterns(urlpatterns)
+    >>>
+    >>> sorted(table.entries)
+    ['a:b:c', 'a:range', 'detail', 'index']
+    >>> table.reverse('detail', kwargs={'pk': 42})
+    '/42'
+    >>> table.reverse('a:range', args=[4, 2])
+    '/a/4/2'
+    >>> table.reverse('a:b:c', prefix='/app/')
+    '/app/a/b/c'
+    >>>
+    >>> for name, args, kwargs in [
+    ...     ('index', [], {}),
+    ...     ('detail', [42], {}),
+    ...     ('a:range', [4, 2], {}),
+    ...     ('a:b:c', [], {})]:
+    ...   assert (
+    ...     table.reverse(name, args, kwargs) ==
+    ...     reverse(name, urlpatterns, args, kwargs)
+    ...   )
+    >>>
+    >>> table.reverse('detail', kwargs={'pk': 'x'})
+    ... # doctest: +NORMALIZE_WHITESPACE
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.NoReverseMatch: Reverse for 'detail'
+    with arguments '()' and keyword arguments '{'pk': 'x'}' not found.
+    >>> table.reverse('a:missing')
+    ... # doctest: +NORMALIZE_WHITESPACE
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.NoReverseMatch: Reverse for 'a:missing'
+    with arguments '()' and keyword arguments '{}' not found.
+
+    """
+    def __init__(self, entries=None, patterns=None):
+        """Initialize reverse table, from its entries, or from the URL
+        patterns to build them from (on first use)
+
+        :argument entries: See :attr:`entries`
+        :type entries: dict
+        :argument patterns: URL patterns (see :func:`build_entries`)
+        :type patterns: list
+
+        """
+        self._entries = entries
+        self.patterns = patterns
+
+    @property
+    def entries(self):
+        """Return the reverse entries, building them from the URL patterns
+        given to :func:`__init__` if needed (see :func:`build_entries`)
+
+        :returns: Reverse entries
+        :rtype: dict
+        """
+        if self._entries is None:
+            self._entries = self.build_entries(self.patterns)
+        return self._entries
+
+    @property
+    def is_built(self):
+        """Return True if the reverse entries were built
+
+        :returns: True if the reverse entries were built
+        :rtype: bool
+        """
+        return self._entries is not None
+
+    @classmethod
+    def from_patterns(cls, patterns, lazy=None):
+        r"""Return the reverse table of an URL pattern list (see
+        :func:`build_entries`).
+
+        If ``lazy`` is True, the reverse entries are built on first use.
+        If ``lazy`` is None, they are built on first use only if
+        building them would build lazy resolvers (see
+        :class:`django_crucrudile.resolvers.LazyRegexURLResolver`), or
+        the reverse tables of resolvers that are not built yet.
+
+        :argument patterns: URL patterns
+        :type patterns: list
+        :argument lazy: Build the reverse entries on first use
+        :type lazy: bool
+
+        :returns: Reverse table
+        :rtype: :class:`ReverseTable`
+
+        >>> from django.conf.urls import url, include
+        >>> from django_crucrudile.resolvers import LazyRegexURLResolver
+        >>>
+        >>> view = lambda: None
+        >>> patterns = [url('^a$', view, name='a')]
+        >>> ReverseTable.from_patterns(patterns).is_built
+        True
+        >>> ReverseTable.from_patterns(patterns, lazy=True).is_built
+        False
+        >>>
+        >>> lazy_resolver = LazyRegexURLResolver(
+        ...   '^b/', lambda: url('^b/', include(patterns))
+        ... )
+        >>> table = ReverseTable.from_patterns(patterns + [lazy_resolver])
+        >>> table.is_built, lazy_resolver.is_built
+        (False, False)
+        >>> sorted(table.entries)
+        ['a']
+        >>> table.is_built, lazy_resolver.is_built
+        (True, True)
+        >>>
+        >>> lazy_resolver = url('^c/', include([]))
+        >>> lazy_resolver.reverse_table = table
+        >>> ReverseTable.from_patterns([lazy_resolver]).is_built
+        True
+
+        """
+        if lazy is None:
+            lazy = any(
+                isinstance(pattern, LazyRegexURLResolver) or not getattr(
+                    getattr(pattern, 'reverse_table', None), 'is_built', True
+                )
+                for pattern in patterns
+            )
+        if lazy:
+            return cls(patterns=patterns)
+        return cls(cls.build_entries(patterns))
+
+    @classmethod
+    def build_entries(cls, patterns):
+        r"""Build the reverse entries of an URL pattern list. The reverse
+        tables of resolvers are read from their ``reverse_table``
+        attribute if they have one (as the resolvers built by
+        :func:`django_crucrudile.routers.Router.patterns`), and built
+        otherwise.
+
+        The URL names of URL patterns are used as is, the URL names of
+        resolvers without namespace are prefixed by their regular
+        expression, and the URL names of resolvers with a namespace are
+        also namespaced. As in Django, URL patterns defined last are
+        tried first, and only the first resolver with a given
+        namespace is used. Objects that are not URL patterns are
+        ignored.
+
+        Regular expressions are read in the current language.
+
+        :argument patterns: URL patterns
+        :type patterns: list
+
+        :returns: Reverse entries
+        :rtype: dict
+
+        >>> from django.conf.urls import url, include
+        >>>
+        >>> view = lambda: None
+        >>> table = ReverseTable.from_patterns([
+        ...   url('^a$', view, name='a'),
+        ...   url('^b$', view, name='a'),
+        ...   url('^c/', include([url('^d$', view, name='d')]),
+        ...       kwargs={'e': 'f'}),
+        ...   url('^g/', include([url('^h$', view, name='h')], 'i', 'i')),
+        ...   url('^j/', include([url('^k$', view, name='k')], 'i', 'i')),
+        ...   'not a pattern',
+        ... ])
+        >>>
+        >>> [(possibilities, regex)
+        ...  for possibilities, regex, defaults in table.entries['a']]
+        [([('b', [])], 'b$'), ([('a', [])], 'a$')]
+        >>> table.entries['d']
+        [([('c/d', [])], 'c/d$', {'e': 'f'})]
+        >>> table.entries['i:h']
+        [([('g/h', [])], 'g/h$', {})]
+        >>> 'i:k' in table.entries
+        False
+
+        """
+        entries = {}
+        namespaces = {}
+        for pattern in reversed(patterns):
+            if not isinstance(pattern, LocaleRegexProvider):
+                continue
+            regex = pattern.regex.pattern
+            p_regex = regex[1:] if regex.startswith('^') else regex
+            if not isinstance(pattern, RegexURLResolver):
+                if pattern.name is not None:
+                    entries.setdefault(pattern.name, []).append(
+                        (normalize(p_regex), p_regex, pattern.default_args)
+                    )
+                continue
+            table = getattr(pattern, 'reverse_table', None)
+            if table is None:
+                table = cls.from_patterns(pattern.url_patterns)
+            parent = normalize(regex)
+            sub_namespaces = {}
+            for name, sub_entries in table.entries.items():
+                if pattern.namespace:
+                    name = '{}:{}'.format(pattern.namespace, name)
+                if ':' in name:
+                    # the default arguments of resolvers are not used
+                    # when reversing namespaced URL names
+                    target = sub_namespaces.setdefault(
+                        name.split(':', 1)[0], {}
+                    ).setdefault(name, [])
+                    default_kwargs = {}
+                else:
+                    target = entries.setdefault(name, [])
+                    default_kwargs = pattern.default_kwargs
+                target.extend(
+                    (
+                        _combine(parent, possibilities),
+                        p_regex + sub_regex,
+                        dict(defaults, **default_kwargs)
+                    )
+                    for possibilities, sub_regex, defaults in sub_entries
+                )
+            # resolvers defined first override the namespaces of
+            # resolvers defined last
+            namespaces.update(sub_namespaces)
+        for namespace_entries in namespaces.values():
+            entries.update(namespace_entries)
+        return entries
+
+    def reverse(self, name, args=None, kwargs=None, prefix=None):
+        r"""Reverse an URL name, as :func:`django.core.urlresolvers.reverse`
+        would (using :func:`django.core.urlresolvers.get_script_prefix`
+        as default prefix)
+
+        :argument name: URL name (fully namespaced)
+        :type name: str
+        :argument args: Positional arguments
+        :type args: list
+        :argument kwargs: Keyword arguments
+        :type kwargs: dict
+        :argument prefix: Prefix of the URL
+        :type prefix: str
+
+        :returns: URL
+        :rtype: str
+
+        :raises ValueError: If both ``args`` and ``kwargs`` are given
+        :raises NoReverseMatch: If the URL name could not be reversed
+                                with the given arguments
+
+        >>> from django.conf.urls import url
+        >>> from django.core.urlresolvers import reverse
+        >>>
+        >>> view = lambda: None
+        >>> patterns = [
+        ...   url(r'^(\d+)$', view, name='a'),
+        ...   url(r'^(?P<b>\d+)/(?P<c>\d+)$', view, name='b', kwargs={'c': 1}),
+        ...   url(r'^(.*)$', view, name='d'),
+        ... ]
+        >>> table = ReverseTable.from_patterns(patterns)
+        >>>
+        >>> table.reverse('a', [1, 2])  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django.core.urlresolvers.NoReverseMatch: Reverse for 'a' ...
+        >>> table.reverse('b', kwargs={'b': 1, 'c': 1})
+        '/1/1'
+        >>> table.reverse('b', kwargs={'b': 1, 'c': 2})
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django.core.urlresolvers.NoReverseMatch: Reverse for 'b' ...
+        >>> table.reverse('b', kwargs={'e': 1})  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django.core.urlresolvers.NoReverseMatch: Reverse for 'b' ...
+        >>> table.reverse('d', ['/a']) == reverse('d', tuple(patterns), ['/a'])
+        True
+        >>> table.reverse('a', [1], {'b': 2})
+        Traceback (most recent call last):
+          ...
+        ValueError: Don't mix *args and **kwargs in call to reverse()!
+
+        """
+        args = args or []
+        kwargs = kwargs or {}
+        if args and kwargs:
+            raise ValueError(
+                "Don't mix *args and **kwargs in call to reverse()!"
+            )
+        if prefix is None:
+            prefix = get_script_prefix()
+        text_args = [force_text(value) for value in args]
+        text_kwargs = {
+            key: force_text(value) for key, value in kwargs.items()
+        }
+        prefix_norm, prefix_args = normalize(urlquote(prefix))[0]
+        for possibilities, regex, defaults in self.entries.get(name, ()):
+            for result, params in possibilities:
+                if args:
+                    if len(args) != len(params) + len(prefix_args):
+                        continue
+                    candidate_subs = dict(
+                        zip(prefix_args + params, text_args)
+                    )
+                else:
+                    if (set(kwargs) | set(defaults) !=
+                            set(params) | set(defaults) | set(prefix_args)):
+                        continue
+                    if any(kwargs.get(key, value) != value
+                           for key, value in defaults.items()):
+                        continue
+                    candidate_subs = text_kwargs
+                candidate_pat = prefix_norm.replace('%', '%%') + result
+                if re.search('^{}{}'.format(prefix_norm, regex),
+                             candidate_pat % candidate_subs, re.UNICODE):
+                    url = candidate_pat % {
+                        key: urlquote(value)
+                        for key, value in candidate_subs.items()
+                    }
+                    # don't allow construction of scheme relative urls,
+                    # if the Django version doesn't either
+                    if (url.startswith('//') and
+                            _rewrites_scheme_relative_urls()):
+                        url = '/%2F{}'.format(url[2:])
+                    return iri_to_uri(url)
+        raise NoReverseMatch(
+            "Reverse for '{}' with arguments '{}' and keyword "
+            "arguments '{}' not found.".format(name, tuple(args), kwargs)
+        )
@@ -24,6 +24,10 @@ and two implementations adapted to Django models :
    default Django generic views.
 
 """
+import gc
+import json
+from weakref import WeakSet
+
 from django.conf.urls import url, include
 from django.core.urlresolvers import reverse_lazy
 
@@ -36,8 +40,28 @@ from django.views.generic import (
 )
 
 from django_crucrudile.routes import ViewRoute, ModelViewRoute
+from django_crucrudile.routes.base import BaseRoute
 from django_crucrudile.entities import Entity
-from django_crucrudile.entities.store import EntityStore
+from django_crucrudile.entities.store import (
+    EntityStore, _links_parent_stores
+)
+from django_crucrudile.reversers import ReverseTable
+from django_crucrudile.views import ReversedRedirectView, get_view_callback
+from django_crucrudile.routers.snapshot import (
+    SNAPSHOT_VERSION, dump_pattern, load_pattern,
+    get_definition_hash, read_snapshot
+)
+from django_crucrudile.routers.redirects import (
+    RedirectGraph, RedirectCycleError
+)
+from django_crucrudile.resolvers import (
+    FlatRegexURLResolver,
+    PrefixDispatchRegexURLResolver,
+    AlternationRegexURLResolver,
+    LazyRegexURLResolver,
+    get_dispatch_key,
+    warm_patterns
+)
 
 
 __all__ = [
@@ -73,21 +97,60 @@ class Router(EntityStore, Entity):
                          regex when building URL group)
     :type url_part: str
     """
-    redirect = None
-    """
-    :attribute redirect: If defined, :class:`Router` will add a
-                         redirect view to the returned patterns. To
-                         get the redirect target,
-                         :func:`get_redirect_pattern` will follow
-                         ``redirect`` attributes in the stored
-                         entities. The attribute's value is altered by
-                         the :func:`register`, if ``index`` is
-                         ``True`` in its arguments or if the
-                         registered entity
-                         :attr:`django_crucrudile.entities.Entity.index`
-                         attribute is set to True.
-    :type redirect: :class:`django_crucrudile.entities.Entity`
-    """
+    @property
+    def redirect(self):
+        """
+        :attribute redirect: If defined, :class:`Router` will add a
+                             redirect view to the returned patterns. To
+                             get the redirect target,
+                             :func:`get_redirect_pattern` will follow
+                             ``redirect`` attributes in the stored
+                             entities. The attribute's value is altered by
+                             the :func:`register`, if ``index`` is
+                             ``True`` in its arguments or if the
+                             registered entity
+                             :attr:`django_crucrudile.entities.Entity.index`
+                             attribute is set to True.
+        :type redirect: :class:`django_crucrudile.entities.Entity`
+
+        .. note::
+
+           As the index entity may be in the base store, reading this
+           attribute registers the base store if it is still pending
+           (see
+           :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`).
+
+        >>> from mock import Mock
+        >>> index_entity_class = Mock()
+        >>> index_entity_class.return_value.index = True
+        >>>
+        >>> class IndexRouter(Router):
+        ...   pass
+        >>>
+        >>> IndexRouter.register_class(index_entity_class) is not None
+        True
+        >>>
+        >>> router = IndexRouter(lazy_base_store=True)
+        >>> index_entity_class.called
+        False
+        >>> router.redirect is index_entity_class.return_value
+        True
+
+        """
+        if self._pending_base_store is not None:
+            with self._lock:
+                if self._pending_base_store is not None:
+                    self.register_base_store()
+        return self._redirect
+
+    @redirect.setter
+    def redirect(self, value):
+        self._redirect = value
+        if hasattr(self, '_lock'):
+            # the redirect pattern changed (in this router, and maybe
+            # in the routers it is registered in)
+            self.store_changed()
+
     add_redirect = None
     """
     :attribute add_redirect: Add redirect pattern when calling
@@ -121,6 +184,19 @@ class Router(EntityStore, Entity):
                                     is found).
     :type get_redirect_silent: bool
     """
+    redirect_mode = 'lazy'
+    """
+    :attribute redirect_mode: How the redirect pattern serves the
+                              redirect target (see
+                              :func:`get_redirect_callback`) :
+                              ``'lazy'`` redirects to the target URL
+                              (reversed on each request), ``'eager'``
+                              redirects to the target URL (reversed on
+                              the first request for each script prefix
+                              and URLconf), and ``'alias'``
+                              serves the target view directly.
+    :type redirect_mode: str
+    """
     redirect_max_depth = 100
     """
     :attribute redirect_max_depth: Max depth when following redirect
@@ -135,6 +211,81 @@ class Router(EntityStore, Entity):
                         ``Model`` type.
     :type generic: bool
     """
+    flatten = False
+    """
+    :attribute flatten: If True, :func:`patterns` yields a
+                        :class:`django_crucrudile.resolvers.FlatRegexURLResolver`,
+                        that resolves paths using the flattened URL
+                        pattern tree (nested URL patterns are kept, for
+                        reversing).
+    :type flatten: bool
+    """
+    prefix_dispatch = None
+    """
+    :attribute prefix_dispatch: If True, :func:`patterns` yields a
+                                :class:`django_crucrudile.resolvers.PrefixDispatchRegexURLResolver`,
+                                that dispatches paths on their first
+                                segment. If None, it is only used when
+                                all the routers registered in this
+                                router have a static URL part (see
+                                :func:`get_resolver_class`). If False,
+                                Django's resolver is used.
+                                Ignored if :attr:`flatten` or
+                                :attr:`alternation` is True.
+    :type prefix_dispatch: bool
+    """
+    alternation = False
+    """
+    :attribute alternation: If True, :func:`patterns` yields a
+                            :class:`django_crucrudile.resolvers.AlternationRegexURLResolver`,
+                            that resolves the URL patterns of the
+                            routes of this router using a single
+                            regular expression. Ignored if
+                            :attr:`flatten` is True.
+    :type alternation: bool
+    """
+    lazy_include = False
+    """
+    :attribute lazy_include: If True, :func:`patterns` yields a
+                             :class:`django_crucrudile.resolvers.LazyRegexURLResolver`,
+                             that builds the URL patterns of this
+                             router on first use (when a path enters
+                             its URL part, or when an URL name of its
+                             namespace is reversed).
+    :type lazy_include: bool
+    """
+    cache_patterns = True
+    """
+    :attribute cache_patterns: If True, :func:`patterns` caches the
+                               URL patterns it builds (see
+                               :func:`get_patterns_cache_key`),
+                               until the router, or an entity
+                               registered in it, changes (when
+                               entities are registered or removed,
+                               or when an attribute is set, see
+                               :func:`__setattr__`).
+    :type cache_patterns: bool
+    :attribute patterns_cache_hits: Number of times :func:`patterns`
+                                    used cached patterns
+    :type patterns_cache_hits: int
+    :attribute patterns_cache_misses: Number of times :func:`patterns`
+                                      built patterns
+    :type patterns_cache_misses: int
+    """
+    unwatched_attributes = frozenset((
+        'patterns_cache_hits', 'patterns_cache_misses', 'frozen',
+        'redirect'
+    ))
+    """
+    :attribute unwatched_attributes: Public attributes that do not
+                                     invalidate the caches of the
+                                     router when they are set (see
+                                     :func:`__setattr__`), as they
+                                     are not used to build patterns
+                                     (or they invalidate the caches
+                                     themselves).
+    :type unwatched_attributes: frozenset of str
+    """
     def __init__(self,
                  namespace=None,
                  url_part=None,
@@ -173,9 +324,77 @@ class Router(EntityStore, Entity):
         if generic is not None:
             self.generic = generic
 
+        self._patterns_cache = None
+        self._reverse_table = None
+        self._redirect_graph = None
+        self._redirect_dependencies = None
+        self.patterns_cache_hits = 0
+        self.patterns_cache_misses = 0
+        # entities registered as index, in order (see unregister())
+        self._index_entities = []
+
         # call superclass implementation of __init__
         super().__init__(**kwargs)
 
+    def __setattr__(self, name, value):
+        """Set attribute, and invalidate the caches of the router, and of
+        the routers where it is registered (see
+        :func:`django_crucrudile.entities.store.EntityStore.store_changed`),
+        if the attribute is public and not in
+        :attr:`unwatched_attributes` (as the public attributes, such as
+        :attr:`namespace` and :attr:`url_part`, are used to build the
+        patterns).
+
+        :argument name: Attribute name
+        :type name: str
+        :argument value: Attribute value
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> parent, child = Router(), Router(url_part='child')
+        >>> route = CallbackRoute(callback=lambda: None, name='route')
+        >>> parent.register(child) is child
+        True
+        >>> child.register(route) is route
+        True
+        >>>
+        >>> def get_regexs(router):
+        ...   resolver = next(router.patterns())
+        ...   return [
+        ...     (pattern.regex.pattern,
+        ...      [sub.regex.pattern for sub in pattern.url_patterns])
+        ...     for pattern in resolver.url_patterns
+        ...   ]
+        >>>
+        >>> get_regexs(parent)
+        [('^child/', ['^route$'])]
+        >>> child.url_part = 'other'
+        >>> get_regexs(parent)
+        [('^other/', ['^route$'])]
+
+        Routes also invalidate the caches of the routers where they are
+        registered (see
+        :func:`django_crucrudile.routes.base.BaseRoute.__setattr__`) :
+
+        >>> route.url_part = 'other_route'
+        >>> get_regexs(parent)
+        [('^other/', ['^other_route$'])]
+
+        Attributes in :attr:`unwatched_attributes` do not invalidate
+        the caches :
+
+        >>> version = parent._store_version
+        >>> child.patterns_cache_hits += 1
+        >>> parent._store_version == version
+        True
+
+        """
+        super().__setattr__(name, value)
+        if (not name.startswith('_') and
+                name not in self.unwatched_attributes and
+                '_lock' in vars(self)):
+            self.store_changed()
+
     def get_register_map(self):
         """Add two base register mappings (to the mappings returned by the
 super implementation)
@@ -212,6 +431,32 @@ super implementation)
         mapping[View] = ViewRoute
         return mapping
 
+    def get_register_map_cache_key(self):
+        """Add :attr:`generic` to the register map cache key, as it is used
+        in :func:`get_register_map`.
+
+        :returns: Register map cache key
+        :rtype: tuple
+
+        >>> router = Router()
+        >>> generic_router = Router(generic=True)
+        >>>
+        >>> generic_router.get_register_map_cache_key()
+        (True,)
+        >>>
+        >>> mapping = router.get_cached_register_map()
+        >>> generic_mapping = generic_router.get_cached_register_map()
+        >>>
+        >>> generic_mapping[Model].__name__
+        'GenericModelRouter'
+        >>> mapping[Model].__name__
+        'ModelRouter'
+        >>> Router().get_cached_register_map() is mapping
+        True
+
+        """
+        return super().get_register_map_cache_key() + (self.generic,)
+
     def register(self, entity, index=False, map_kwargs=None):
         """Register routed entity, using
         :func:`django_crucrudile.entities.store.EntityStore.register`
@@ -255,14 +500,496 @@ super implementation)
         True
 
         """
-        entity = super().register(
-            entity,
-            map_kwargs=map_kwargs
-        )
-        if index or entity.index:
-            self.redirect = entity
+        with self._lock:
+            entity = super().register(
+                entity,
+                map_kwargs=map_kwargs
+            )
+            if index or entity.index:
+                self._index_entities.append(entity)
+                self.redirect = entity
+
+            return entity
+
+    def register_many(self, entities, map_kwargs=None, index=False):
+        """Register several routed entities, using
+        :func:`django_crucrudile.entities.store.EntityStore.register_many`
+
+        Set as index the last registered entity for which ``index`` or
+        ``entity.index`` is True, as repeated calls to :func:`register`
+        would.
+
+        The arguments are in the same order as in
+        :func:`django_crucrudile.entities.store.EntityStore.register_many`.
+
+        :argument entities: Entities to register
+        :type entities: iterable of :class:`django_crucrudile.entities.Entity`
+        :argument map_kwargs: Optional. Keyword arguments to pass to
+                              mapping value if entities get
+                              transformed.
+        :type map_kwargs: dict
+        :argument index: Register as index (set :attr:`redirect` to the
+                         last entity)
+        :type index: bool
+
+        :returns: The registered entities
+        :rtype: list of :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> router = Router()
+        >>>
+        >>> entities = [Mock(index=False), Mock(index=True), Mock(index=False)]
+        >>>
+        >>> router.register_many(entities) == entities
+        True
+        >>> router._store == entities
+        True
+        >>> router.redirect is entities[1]
+        True
+
+        >>> router.register_many(entities, index=True) == entities
+        True
+        >>> router.redirect is entities[2]
+        True
+
+        :attr:`redirect` is only set once (as it invalidates the caches) :
+
+        >>> from mock import PropertyMock, patch
+        >>>
+        >>> with patch.object(
+        ...   Router, 'redirect', new_callable=PropertyMock
+        ... ) as redirect:
+        ...   router.register_many(entities, None, True) == entities
+        True
+        >>> redirect.call_args_list == [((entities[2],),)]
+        True
+
+        """
+        with self._lock:
+            entities = super().register_many(
+                entities,
+                map_kwargs=map_kwargs
+            )
+            index_entities = [
+                entity for entity in entities
+                if index or entity.index
+            ]
+            if index_entities:
+                self._index_entities.extend(index_entities)
+                # (only set once, as it invalidates the caches)
+                self.redirect = index_entities[-1]
+
+            return entities
+
+    def unregister(self, entity):
+        """Remove a registered entity, using
+        :func:`django_crucrudile.entities.store.EntityStore.unregister`
+
+        If the entity was used as index (:attr:`redirect`), use the last
+        remaining entity that was registered as index instead (using the
+        ``index`` argument of :func:`register`, or because its ``index``
+        attribute was True), or ``None`` if there is none.
+
+        :argument entity: Entity to remove
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: The removed entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> router = Router()
+        >>> entities = [Mock(index=True), Mock(index=False), Mock(index=True)]
+        >>>
+        >>> router.register_many(entities) == entities
+        True
+        >>> router.redirect is entities[2]
+        True
+        >>>
+        >>> router.unregister(entities[2]) is entities[2]
+        True
+        >>> router.redirect is entities[0]
+        True
+        >>> router.unregister(entities[0]) is entities[0]
+        True
+        >>> router.redirect is None
+        True
+
+        >>> entities = [Mock(index=False), Mock(index=False)]
+        >>> router.register(entities[0], index=True) is entities[0]
+        True
+        >>> router.register(entities[1], index=True) is entities[1]
+        True
+        >>> router.unregister(entities[1]) is entities[1]
+        True
+        >>> router.redirect is entities[0]
+        True
+
+        >>> sub_router = Router()
+        >>> router.register(sub_router) is sub_router
+        True
+        >>> router.unregister(sub_router) is sub_router
+        True
+        >>> list(sub_router._parent_stores)
+        []
+
+        """
+        with self._lock:
+            entity = super().unregister(entity)
+            candidates = self._index_entities
+            for position in reversed(range(len(candidates))):
+                if candidates[position] is entity:
+                    del candidates[position]
+                    break
+            if self.redirect is entity:
+                self.redirect = candidates[-1] if candidates else None
+            return entity
+
+    def _replace_index_entity(self, old, new):
+        """Replace ``old`` by ``new`` in the entities registered as index
+        (see :func:`unregister`)
+
+        :returns: True if ``old`` was registered as index
+        :rtype: bool
+        """
+        candidates = self._index_entities
+        for position in reversed(range(len(candidates))):
+            if candidates[position] is old:
+                candidates[position] = new
+                return True
+        return False
+
+    def replace(self, old, new, map_kwargs=None):
+        """Replace a registered entity, using
+        :func:`django_crucrudile.entities.store.EntityStore.replace`
+
+        If the replaced entity was used as index (:attr:`redirect`), or if
+        the new entity ``index`` attribute is True, use the new entity
+        as index.
+
+        :argument old: Entity to replace
+        :type old: :class:`django_crucrudile.entities.Entity`
+        :argument new: Entity to register in place of ``old``
+        :type new: :class:`django_crucrudile.entities.Entity`
+        :argument map_kwargs: Optional. Keyword arguments to pass to
+                              mapping value if the new entity gets
+                              transformed.
+        :type map_kwargs: dict
+
+        :returns: The registered entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> router = Router()
+        >>> entities = [Mock(index=True), Mock(index=False)]
+        >>>
+        >>> router.register_many(entities) == entities
+        True
+        >>>
+        >>> entity = Mock(index=False)
+        >>> router.replace(entities[0], entity) is entity
+        True
+        >>> router._store == [entity, entities[1]]
+        True
+        >>> router.redirect is entity
+        True
+
+        >>> index_entity = Mock(index=True)
+        >>> router.replace(entities[1], index_entity) is index_entity
+        True
+        >>> router.redirect is index_entity
+        True
+        >>> router.unregister(index_entity) is index_entity
+        True
+        >>> router.redirect is entity
+        True
+
+        """
+        with self._lock:
+            new = super().replace(old, new, map_kwargs=map_kwargs)
+            if not self._replace_index_entity(old, new) and new.index:
+                self._index_entities.append(new)
+            if self.redirect is old or new.index:
+                self.redirect = new
+            return new
+
+    def freeze_routes(self, recursive=True):
+        """Replace the routes registered in this router by their records
+        (see :func:`django_crucrudile.routes.base.BaseRoute.to_record`),
+        that use less memory and yield the same URL patterns. The
+        records are immutable, so routes should be frozen once they are
+        configured.
+
+        :argument recursive: If True, also freeze the routes registered
+                             in the routers registered in this router
+        :type recursive: bool
+
+        :returns: Number of frozen routes
+        :rtype: int
+
+        >>> router = Router()
+        >>> child = Router(url_part='child')
+        >>> route = ViewRoute(
+        ...   view_class=RedirectView, name='view', url_part='view',
+        ...   index=True
+        ... )
+        >>> router.register(child) is not None
+        True
+        >>> child.register(route) is route
+        True
+        >>>
+        >>> router.freeze_routes()
+        1
+        >>> child.redirect  # doctest: +ELLIPSIS
+        RouteRecord(name='view', url_name='view', ...)
+        >>> child._store == [child.redirect]
+        True
+        >>> print(router.get_str_tree())
+        ... # doctest: +NORMALIZE_WHITESPACE
+         - Router  @ ^
+           - Router  @ ^child/
+             - view-redirect @ ^$ RedirectView
+             - view @ ^view$ RedirectView
+        >>> router.freeze_routes()
+        0
+
+        """
+        frozen = []
+        with self._lock:
+            # the routes of a frozen store can't be replaced
+            for position, entity in enumerate(
+                    () if self.frozen else self._store):
+                if isinstance(entity, BaseRoute):
+                    record = entity.to_record()
+                    self._store[position] = record
+                    self._replace_index_entity(entity, record)
+                    if self.redirect is entity:
+                        self.redirect = record
+                    frozen.append((entity, record))
+            if frozen:
+                self.store_removed([entity for entity, _ in frozen])
+                self.store_added([record for _, record in frozen])
+        count = len(frozen)
+        if recursive:
+            for entity in self.get_store_snapshot():
+                if isinstance(entity, Router):
+                    count += entity.freeze_routes()
+        return count
+
+    def freeze(self, gc_freeze=False):
+        """Build everything the router tree would build on first use, and
+        freeze it, so that the router tree can be shared by forked
+        processes (such as the workers of a pre-forking server) without
+        writing in the memory pages they share :
+
+        - the routes are replaced by their records (see
+          :func:`freeze_routes`)
+        - the entity stores of the router tree are frozen (see
+          :func:`django_crucrudile.entities.store.EntityStore.freeze_store`),
+          so that registering or removing entities raises
+          :class:`ValueError`
+        - the URL patterns are built and cached (see :func:`patterns`
+          and :attr:`cache_patterns`)
+        - the caches of the URL patterns (compiled regular expressions,
+          reverse dictionaries, lazy resolvers...) are built (see
+          :func:`django_crucrudile.resolvers.warm_patterns`), as well
+          as the reverse table of the router (see
+          :func:`get_reverse_table`) and its redirect graph (see
+          :func:`get_redirect_graph`)
+
+        The caches of the URL patterns are built for the current
+        language. The caches of the Django root URL resolver (that
+        includes the URL patterns) can be built by calling
+        :func:`django.core.urlresolvers.get_resolver` and populating it.
+
+        :argument gc_freeze: If True, collect garbage and move all the
+                             objects tracked by the garbage collector
+                             to its permanent generation (using
+                             :func:`gc.freeze`, on Python 3.7 and
+                             later), so that collections in the forked
+                             processes don't write in their headers
+        :type gc_freeze: bool
+
+        :returns: URL patterns (as returned by :func:`patterns`, called
+                  without arguments)
+        :rtype: tuple
+
+        >>> from mock import patch
+        >>>
+        >>> router = Router()
+        >>> child = Router(namespace='child', url_part='child')
+        >>> router.register(child) is child
+        True
+        >>> child.register(ViewRoute(
+        ...   view_class=RedirectView, name='view', url_part='view',
+        ...   index=True
+        ... )) is not None
+        True
+        >>>
+        >>> with patch('gc.freeze', create=True) as gc_freeze:
+        ...   patterns = router.freeze(gc_freeze=True)
+        >>> gc_freeze.called
+        True
+        >>> patterns == tuple(router.patterns())
+        True
+        >>> child.redirect  # doctest: +ELLIPSIS
+        RouteRecord(name='view', url_name='view', ...)
+        >>> router.reverse('child:view')
+        '/child/view'
+        >>> child.register(ViewRoute(RedirectView, name='other'))
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: <...Router object at ...> is frozen, ...
+        >>> router.freeze() == patterns
+        True
+
+        """
+        self.freeze_routes()
+        self.freeze_store()
+        patterns = tuple(self.patterns())
+        warm_patterns(patterns)
+        self.get_reverse_table().entries
+        self.get_redirect_graph()
+        if gc_freeze:
+            gc.collect()
+            freeze = getattr(gc, 'freeze', None)
+            if freeze is not None:  # Python 3.7 and later
+                freeze()
+        return patterns
+
+    def get_redirect_graph(self):
+        """Return the redirect graph of the router tree (see
+        :class:`django_crucrudile.routers.redirects.RedirectGraph`),
+        where the redirect attributes of this router, and of the routers
+        registered in it (recursively), have been followed in one pass.
+
+        The graph is cached until the router tree changes, and is also
+        used by the routers registered in this router (until they
+        change), so that the redirect attributes of the router tree are
+        only followed once when building the URL patterns. It is
+        invalidated by the same events as the patterns cache (see
+        :attr:`cache_patterns`) : as the entities that the redirect
+        attributes of a router lead to are linked to the router (see
+        :func:`link_redirect_dependencies`), this includes changes to
+        entities outside of its router tree.
+
+        If following the redirect attributes of a router leads to a
+        cycle, :class:`django_crucrudile.routers.redirects.RedirectCycleError`
+        is raised when following them using the graph.
+
+        :returns: Redirect graph
+        :rtype: :class:`django_crucrudile.routers.redirects.RedirectGraph`
+
+        >>> from mock import Mock
+        >>>
+        >>> router = Router()
+        >>> child = Router(namespace='child')
+        >>> router.register(child, index=True) is not None
+        True
+        >>> child.redirect = 'target'
+        >>>
+        >>> graph = router.get_redirect_graph()
+        >>> graph.follow(router.redirect)[:2]
+        (('child',), 'target')
+        >>> child.get_redirect_graph() is graph
+        True
+        >>> router.get_redirect_graph() is graph
+        True
+        >>>
+        >>> child.redirect = router
+        >>> graph = router.get_redirect_graph()
+        >>> graph.follow(router.redirect)
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django_crucrudile.routers.redirects.RedirectCycleError: Redirect \
+graph has a cycle : <...Router object at ...> -> ...
 
-        return entity
+        """
+        cache = self._redirect_graph
+        version = self._store_version
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        def get_namespace(node):
+            if isinstance(node, Router):
+                return node.namespace
+
+        graph = RedirectGraph(get_namespace)
+        # walk the router tree, following the redirect attributes of
+        # each router
+        routers = [(self, version)]
+        seen = {id(self)}
+        index = 0
+        while index < len(routers):
+            router, router_version = routers[index]
+            index += 1
+            try:
+                graph.follow(router.redirect)
+            except RedirectCycleError:
+                # the error is stored in the graph, and raised when
+                # following the redirect attribute of this router
+                pass
+            for entity in router.get_store_snapshot():
+                if isinstance(entity, Router) and id(entity) not in seen:
+                    seen.add(id(entity))
+                    routers.append((entity, entity._store_version))
+
+        # share the graph with the registered routers
+        for router, router_version in routers:
+            router_cache = router._redirect_graph
+            if router_cache is None or router_cache[0] != router_version:
+                router._redirect_graph = router_version, graph
+                router.link_redirect_dependencies()
+        return graph
+
+    def link_redirect_dependencies(self):
+        """Link the entities found when following the redirect attributes
+        of this router to this router, so that their changes invalidate
+        its caches (see
+        :func:`django_crucrudile.entities.Entity.entity_changed`), even
+        if they are not registered in its router tree. The links made
+        by the previous call are removed.
+
+        Entities registered in this router are not linked, as they
+        already invalidate its caches.
+
+        >>> from mock import Mock
+        >>>
+        >>> router, other = Router(), Router()
+        >>> router.redirect = other
+        >>> other.redirect = Mock(redirect='target')
+        >>>
+        >>> router.link_redirect_dependencies()
+        >>> list(other._dependent_stores) == [router]
+        True
+        >>>
+        >>> version = router._store_version
+        >>> other.store_changed()
+        >>> router._store_version == version + 1
+        True
+        >>>
+        >>> router.redirect = 'target'
+        >>> router.link_redirect_dependencies()
+        >>> list(other._dependent_stores)
+        []
+
+        """
+        for node in self._redirect_dependencies or ():
+            node._dependent_stores.discard(self)
+        dependencies = self._redirect_dependencies = []
+        seen = {id(self)}
+        node = self.redirect
+        while (node is not None and not isinstance(node, str) and
+               id(node) not in seen):
+            seen.add(id(node))
+            if (_links_parent_stores(node) and
+                    self not in (node._parent_stores or ())):
+                if node._dependent_stores is None:
+                    node._dependent_stores = WeakSet()
+                node._dependent_stores.add(self)
+                dependencies.append(node)
+            node = node.redirect
 
     def get_redirect_pattern(self, namespaces=None, silent=None,
                              redirect_max_depth=None):
@@ -283,10 +1010,12 @@ super implementation)
                                          :attr:`Router.redirect_max_depth`
         :type redirect_max_depth: int
 
-        :raise OverflowError: If the depth-first search in the graph
-                              made from redirect attributes reaches
-                              the depth in :attr:`redirect_max_depth`
-                              (to intercept graph cycles)
+        :raise RedirectCycleError: If following redirect attributes
+                                   leads to a cycle (see
+                                   :func:`get_redirect_graph`)
+        :raise OverflowError: If more than
+                              :attr:`redirect_max_depth` redirect
+                              attributes have to be followed
         :raise ValueError: If no redirect found when following
                            ``redirect`` attributes, and silent
                            mode is not enabled.
@@ -334,12 +1063,20 @@ super implementation)
         True
         >>>
         >>> router.get_redirect_pattern()
-        ... # doctest: +NORMALIZE_WHITESPACE
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django_crucrudile.routers.redirects.RedirectCycleError: Redirect \
+graph has a cycle : <Mock id=...> -> <Mock name='mock.redirect' id=...> \
+-> <Mock id=...>
+        >>>
+        >>> entity.redirect.redirect = 'redirect_target'
+        >>> router.store_changed()
+        >>> router.get_redirect_pattern(redirect_max_depth=1)
         Traceback (most recent call last):
           ...
-        OverflowError: Depth-first search reached its maximum (100)
-        depth, without returning a leaf item (string).Maybe the
-        redirect graph has a cycle ?
+        OverflowError: Following redirect attributes exceeded the maximum \
+depth (1).
 
         >>> entity = Mock()
         >>> entity.__str__ = lambda x: 'mock redirect'
@@ -366,50 +1103,22 @@ super implementation)
         if namespaces is None:
             namespaces = []
         else:
-            # need to copy because _follow_redirect appends namespaces
-            # found when following redirect attributes
+            # need to copy because we append the namespaces found
+            # when following redirect attributes
             namespaces = list(namespaces)
 
-        # used if following redirect attributes failed, to provide
-        # information in the exception.
-        _last_redirect_found = None
-
-        redirect = self.redirect
-        for i in range(redirect_max_depth):
-            # loop through redirect attributes
-            if isinstance(redirect, str):
-                break
-            elif redirect is None:
-                break
-            elif redirect is not None:
-                # not a string and not None, check if it's a Router so
-                # we can append its namespace to the namespaces list
-
-                # maybe it's better to just getattr(redirect,
-                # 'namespace') and to handle the exception (or
-                # getattr(redirect, 'namespace', None))
-
-                # can't decide either
-                if isinstance(redirect, Router) and redirect.namespace:
-                    namespaces.append(redirect.namespace)
-                # save last redirect in case of exception
-                _last_redirect_found = redirect
-                # NOTE: risk of infinite loop here, if the redirect
-                # attributes keeps being not None and never string
-                # this could happen if case of "redirect loop" :
-                # >>> A, B = [Router() for _ in range(3)]
-                # >>> A.redirect = B
-                # >>> B.redirect = A
-                # >>> _follow_redirect(A)
-                # --- /!\ infinite loop /!\ ---
-                redirect = redirect.redirect
-        else:
+        # get the result of following redirect attributes from the
+        # redirect graph of the router tree
+        redirect_namespaces, redirect, _last_redirect_found, depth = (
+            self.get_redirect_graph().follow(self.redirect)
+        )
+        if depth >= redirect_max_depth:
             raise OverflowError(
-                "Depth-first search reached its maximum ({}) depth"
-                ", without returning a leaf item (string)."
-                "Maybe the redirect graph has a cycle ?"
-                "".format(redirect_max_depth)
+                "Following redirect attributes exceeded the maximum "
+                "depth ({}).".format(redirect_max_depth)
             )
+        namespaces.extend(redirect_namespaces)
+
         if redirect:
             # get the target URL name (by prefixing the redirect URL
             # name with the namespaces)
@@ -426,11 +1135,11 @@ super implementation)
                 redirect,
             )
 
-            # Create a redirect view, that will get the URL to
-            # redirect to lazily (when it's accessed), as the target
-            # URL is not known yet
-            redirect_view = RedirectView.as_view(
-                url=reverse_lazy(target_url_name)
+            # Get a redirect view, that will get the URL to redirect
+            # to when it's accessed (as the target URL is not known
+            # yet), or the target view (see redirect_mode)
+            redirect_view, redirect_kwargs = self.get_redirect_callback(
+                target_url_name, redirect, _last_redirect_found
             )
 
             # Now that we have a redirect view pointing to the target
@@ -438,6 +1147,7 @@ super implementation)
             url_pattern = url(
                 r'^$',
                 redirect_view,
+                redirect_kwargs,
                 name=redirect_url_name
             )
 
@@ -463,8 +1173,105 @@ super implementation)
                 )
             )
 
+    def get_redirect_callback(self, target_url_name,
+                              redirect=None, target=None):
+        """Return the callback (and default keyword arguments) of the
+        redirect pattern, according to :attr:`redirect_mode` :
+
+        - ``'lazy'`` : :class:`django.views.generic.RedirectView`,
+          that reverses the target URL name on each request (using
+          :func:`django.core.urlresolvers.reverse_lazy`)
+        - ``'eager'`` :
+          :class:`django_crucrudile.views.ReversedRedirectView`, that
+          reverses the target URL name on the first request only
+          (for each script prefix and URLconf)
+        - ``'alias'`` : the callback of the target URL pattern (so
+          that the target view is served directly, without a redirect
+          response), found in the patterns of the target entity (the
+          URL pattern named ``redirect``, whose regular expression has
+          no groups). If there is no such URL pattern, use the
+          ``'eager'`` mode.
+
+        :argument target_url_name: Target URL name (with namespaces)
+        :type target_url_name: str
+        :argument redirect: Target URL name (without namespaces)
+        :type redirect: str
+        :argument target: Target entity (last entity found when
+                          following redirect attributes)
+        :type target: :class:`django_crucrudile.entities.Entity`
+
+        :returns: Callback and default keyword arguments
+        :rtype: 2-tuple
+
+        :raises ValueError: If :attr:`redirect_mode` is not valid
+
+        >>> from django.views.generic import View
+        >>>
+        >>> class TargetView(View):
+        ...   pass
+        >>>
+        >>> route = ViewRoute(TargetView)
+        >>> router = Router()
+        >>>
+        >>> callback, kwargs = router.get_redirect_callback(
+        ...   'ns:target', 'target', route
+        ... )
+        >>> callback.__name__, kwargs
+        ('RedirectView', {})
+        >>>
+        >>> router.redirect_mode = 'eager'
+        >>> callback, kwargs = router.get_redirect_callback(
+        ...   'ns:target', 'target', route
+        ... )
+        >>> callback.__name__, kwargs
+        ('ReversedRedirectView', {})
+        >>>
+        >>> router.redirect_mode = 'alias'
+        >>> callback, kwargs = router.get_redirect_callback(
+        ...   'ns:target', 'target', route
+        ... )
+        >>> callback.__name__, kwargs
+        ('TargetView', {})
+        >>> callback, kwargs = router.get_redirect_callback(
+        ...   'ns:target', 'target', None
+        ... )
+        >>> callback.__name__, kwargs
+        ('ReversedRedirectView', {})
+        >>>
+        >>> router.redirect_mode = 'other'
+        >>> router.get_redirect_callback('ns:target')
+        Traceback (most recent call last):
+          ...
+        ValueError: Invalid redirect mode : other (in Router).
+
+        """
+        mode = self.redirect_mode
+        if mode == 'lazy':
+            callback = get_view_callback(
+                RedirectView, url=reverse_lazy(target_url_name)
+            )
+            # the lazy URL can not be serialized, keep the URL name
+            # (see django_crucrudile.routers.snapshot)
+            callback.redirect_url_name = target_url_name
+            return callback, {}
+        elif mode == 'alias':
+            for pattern in getattr(target, 'patterns', lambda: ())():
+                if (getattr(pattern, 'name', None) == redirect and
+                        not pattern.regex.groups):
+                    return pattern.callback, pattern.default_args
+        elif mode != 'eager':
+            raise ValueError(
+                "Invalid redirect mode : {} (in {}).".format(
+                    mode, self.__class__.__name__
+                )
+            )
+        return get_view_callback(
+            ReversedRedirectView, url_name=target_url_name, url_cache={}
+        ), {}
+
     def patterns(self, namespaces=None,
-                 add_redirect=None, add_redirect_silent=None):
+                 add_redirect=None, add_redirect_silent=None,
+                 flatten=None):
         """Read :attr:`_store` and yield a pattern of an URL group (with url part
         and namespace) containing entities's patterns (obtained from
         the entity store), also yield redirect patterns where defined.
@@ -478,6 +1285,9 @@ super implementation)
         :argument add_redirect_silent: Override
                                        :attr:`Router.add_redirect_silent`
         :type add_redirect: bool
+        :argument flatten: Override :attr:`Router.flatten` (only
+                           for this router, not passed recursively)
+        :type flatten: bool
 
         >>> from mock import Mock
         >>> router = Router()
@@ -519,6 +1329,213 @@ super implementation)
           ...
         ValueError: No redirect attribute set (and
         ``add_redirect_silent`` is ``False``).
+
+        The built patterns are cached if :attr:`cache_patterns` is
+        True, until the router (or an entity store registered in it)
+        changes (the cache hits and misses are counted in
+        :attr:`patterns_cache_hits` and :attr:`patterns_cache_misses`) :
+
+        >>> router = Router()
+        >>> router.register(entity_1) is not None
+        True
+        >>> pattern = next(router.patterns())
+        >>> next(router.patterns()) is pattern
+        True
+        >>> router.patterns_cache_hits, router.patterns_cache_misses
+        (1, 1)
+        >>>
+        >>> router.register(entity_2) is not None
+        True
+        >>> next(router.patterns()) is pattern
+        False
+        >>> router.patterns_cache_misses
+        2
+
+        With ``flatten`` :
+
+        >>> list(router.patterns(flatten=True))
+        [<FlatRegexURLResolver <RegexURLPattern list> (None:None) ^>]
+        >>> router.patterns_cache_misses
+        3
+        >>>
+        >>> router.cache_patterns = False
+        >>> next(router.patterns()) is next(router.patterns())
+        False
+        >>> router.patterns_cache_misses
+        3
+        """
+        if flatten is None:
+            flatten = self.flatten
+
+        if not self.cache_patterns:
+            yield self.build_patterns(
+                namespaces, add_redirect, add_redirect_silent, flatten
+            )
+        else:
+            # read the version before building, so that the patterns
+            # are rebuilt if the store changes while they are being
+            # built
+            version = self._store_version
+            key = self.get_patterns_cache_key(
+                namespaces, add_redirect, add_redirect_silent, flatten
+            )
+            cache = self._patterns_cache
+            if cache is None or cache[0] != version:
+                cache = self._patterns_cache = version, {}
+            try:
+                pattern = cache[1][key]
+            except KeyError:
+                pattern = cache[1][key] = self.build_patterns(
+                    namespaces, add_redirect, add_redirect_silent, flatten
+                )
+                self.patterns_cache_misses += 1
+            else:
+                self.patterns_cache_hits += 1
+            yield pattern
+
+    def get_patterns_cache_key(self, namespaces=None,
+                               add_redirect=None, add_redirect_silent=None,
+                               flatten=False):
+        """Return the key used to cache the patterns built with the given
+        arguments (see :func:`patterns`). It contains the arguments,
+        and the router attributes used to build patterns.
+
+        Overriding implementations of :func:`build_patterns` that use
+        other instance attributes *MUST* add these attributes to the
+        returned value.
+
+        :argument namespaces: See :func:`patterns`
+        :type namespaces: list of str
+        :argument add_redirect: See :func:`patterns`
+        :type add_redirect: bool
+        :argument add_redirect_silent: See :func:`patterns`
+        :type add_redirect: bool
+        :argument flatten: See :func:`patterns`
+        :type flatten: bool
+
+        :returns: Patterns cache key
+        :rtype: tuple
+
+        >>> Router(url_part='part').get_patterns_cache_key(['ns'], True)
+        ... # doctest: +NORMALIZE_WHITESPACE
+        (('ns',), True, None, False, None, 'part', None, False, False, 100,
+         'lazy', None, False, False)
+
+        """
+        return (
+            tuple(namespaces) if namespaces is not None else None,
+            add_redirect,
+            add_redirect_silent,
+            flatten,
+            self.namespace,
+            self.url_part,
+            self.add_redirect,
+            self.add_redirect_silent,
+            self.get_redirect_silent,
+            self.redirect_max_depth,
+            self.redirect_mode,
+            self.prefix_dispatch,
+            self.alternation,
+            self.lazy_include,
+        )
+
+    def build_patterns(self, namespaces=None,
+                       add_redirect=None, add_redirect_silent=None,
+                       flatten=False):
+        """Build the URL group pattern yielded by :func:`patterns` (see
+        :func:`patterns` for the arguments). If :attr:`lazy_include` is
+        True, return a
+        :class:`django_crucrudile.resolvers.LazyRegexURLResolver` that
+        calls :func:`build_url_group` on first use, otherwise call
+        :func:`build_url_group`.
+
+        :returns: URL group pattern
+        :rtype: :class:`django.core.urlresolvers.RegexURLResolver`
+
+        >>> from django.core.urlresolvers import resolve
+        >>>
+        >>> router = Router(url_part='base', namespace='base')
+        >>> child = Router(url_part='child', namespace='child')
+        >>> child.lazy_include = True
+        >>> router.register(child) is not None
+        True
+        >>> child.register(ViewRoute(
+        ...   view_class=RedirectView, name='view', url_part='view'
+        ... )) is not None
+        True
+        >>>
+        >>> urlconf = tuple(router.patterns())
+        >>> lazy = urlconf[0].url_patterns[0]
+        >>> lazy.__class__.__name__, lazy.is_built
+        ('LazyRegexURLResolver', False)
+        >>> resolve('/base/child/view', urlconf).view_name
+        'base:child:view'
+        >>> lazy.is_built
+        True
+        >>>
+        >>> print(router.get_str_tree())
+        ... # doctest: +NORMALIZE_WHITESPACE
+         - base @ ^base/
+           - child @ ^child/
+             - view @ ^view$ RedirectView
+        >>>
+        >>> router.reverse('base:child:view')
+        '/base/child/view'
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`django_crucrudile.routers.Router.patterns`
+
+        """
+        if not self.lazy_include:
+            return self.build_url_group(
+                namespaces, add_redirect, add_redirect_silent, flatten
+            )
+        namespace = self.namespace
+        pattern = LazyRegexURLResolver(
+            self.get_url_group_regex(),
+            lambda: self.build_url_group(
+                namespaces, add_redirect, add_redirect_silent, flatten
+            ),
+            namespace=namespace,
+            app_name=namespace
+        )
+        pattern.router = self
+        return pattern
+
+    def get_url_group_regex(self):
+        """Return the regular expression of the URL group pattern, built
+        from :attr:`url_part`
+
+        :returns: Regular expression
+        :rtype: str
+
+        >>> Router(url_part='part').get_url_group_regex()
+        '^part/'
+        >>> Router().get_url_group_regex()
+        '^'
+
+        """
+        url_part = self.url_part
+        return '^{}/'.format(url_part) if url_part else '^'
+
+    def build_url_group(self, namespaces=None,
+                        add_redirect=None, add_redirect_silent=None,
+                        flatten=False):
+        """Build the URL group pattern of the router (see :func:`patterns`
+        for the arguments), with the patterns of the entities in the
+        store, and its reverse table (see
+        :class:`django_crucrudile.reversers.ReverseTable`)
+
+        :returns: URL group pattern
+        :rtype: :class:`django.core.urlresolvers.RegexURLResolver`
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`django_crucrudile.routers.Router.patterns`
+
         """
         # initialize default arguments
 
@@ -547,9 +1564,8 @@ super implementation)
         if add_redirect_silent is None:
             add_redirect_silent = self.add_redirect_silent
 
-        # get url_part and namespace from attributes
+        # get namespace from attributes
         # (needed when building RegexURLResolver)
-        url_part = self.url_part
         namespace = self.namespace
 
         # get redirect (needed if add_redirect is True)
@@ -573,7 +1589,7 @@ super implementation)
                             "".format(self)
                         )
 
-            for entity in self._store:
+            for entity in self.get_store_snapshot():
                 # yield patterns from each entity's patterns function
                 for pattern in entity.patterns(
                         namespaces,
@@ -585,18 +1601,300 @@ super implementation)
         # consume the generator
         pattern_list = list(pattern_reader())
 
-        # make a RegexURLResolver
-        pattern = url(
-            '^{}/'.format(url_part) if url_part else '^',
-            include(
+        # make a RegexURLResolver (or a custom resolver, see
+        # get_resolver_class)
+        regex = self.get_url_group_regex()
+        resolver_class = self.get_resolver_class(pattern_list, flatten)
+        if resolver_class is None:
+            pattern = url(
+                regex,
+                include(
+                    pattern_list,
+                    namespace=namespace,
+                    app_name=namespace
+                )
+            )
+        else:
+            pattern = resolver_class(
+                regex,
                 pattern_list,
                 namespace=namespace,
                 app_name=namespace
             )
-        )
         pattern.router = self
+        # build the reverse table of the URL group (reusing the reverse
+        # tables of the routers it contains)
+        pattern.reverse_table = ReverseTable.from_patterns(pattern_list)
+        return pattern
+
+    def get_resolver_class(self, pattern_list, flatten=False):
+        """Return the resolver class to use for the URL group pattern
+        built by :func:`build_patterns`, or ``None`` to use
+        :class:`django.core.urlresolvers.RegexURLResolver` (through
+        :func:`django.conf.urls.include`).
+
+        If ``flatten`` is True, use
+        :class:`django_crucrudile.resolvers.FlatRegexURLResolver`. If
+        :attr:`alternation` is True, use
+        :class:`django_crucrudile.resolvers.AlternationRegexURLResolver`.
+        Otherwise, use
+        :class:`django_crucrudile.resolvers.PrefixDispatchRegexURLResolver`
+        if :attr:`prefix_dispatch` is True, or if it is None and the URL
+        patterns contain router patterns, that all start with a static
+        prefix (see
+        :func:`django_crucrudile.resolvers.get_dispatch_key`).
+
+        :argument pattern_list: URL patterns of the URL group
+        :type pattern_list: list
+        :argument flatten: See :func:`patterns`
+        :type flatten: bool
+
+        :returns: Resolver class, or ``None``
+        :rtype: subclass of
+                :class:`django.core.urlresolvers.RegexURLResolver`
+
+        >>> from django.conf.urls import url
+        >>>
+        >>> router = Router()
+        >>> static = Router(url_part='static')
+        >>> dynamic = Router(url_part='(?P<pk>\\d+)')
+        >>> router.register(static) is not None
+        True
+        >>> patterns = list(static.patterns())
+        >>>
+        >>> router.get_resolver_class(patterns)
+        <class 'django_crucrudile.resolvers.PrefixDispatchRegexURLResolver'>
+        >>> router.get_resolver_class(patterns, flatten=True)
+        <class 'django_crucrudile.resolvers.FlatRegexURLResolver'>
+        >>> router.get_resolver_class([url('^list$', None)]) is None
+        True
+        >>> router.get_resolver_class(
+        ...   patterns + list(dynamic.patterns())
+        ... ) is None
+        True
+        >>>
+        >>> router.prefix_dispatch = True
+        >>> router.get_resolver_class([url('^list$', None)])
+        <class 'django_crucrudile.resolvers.PrefixDispatchRegexURLResolver'>
+        >>> router.prefix_dispatch = False
+        >>> router.get_resolver_class(patterns) is None
+        True
+        >>>
+        >>> router.alternation = True
+        >>> router.get_resolver_class(patterns)
+        <class 'django_crucrudile.resolvers.AlternationRegexURLResolver'>
+
+        """
+        if flatten:
+            return FlatRegexURLResolver
+        if self.alternation:
+            return AlternationRegexURLResolver
+        prefix_dispatch = self.prefix_dispatch
+        if prefix_dispatch is None:
+            router_patterns = [
+                pattern for pattern in pattern_list
+                if hasattr(pattern, 'router')
+            ]
+            prefix_dispatch = bool(router_patterns) and all(
+                get_dispatch_key(pattern) is not None
+                for pattern in router_patterns
+            )
+        if prefix_dispatch:
+            return PrefixDispatchRegexURLResolver
+        return None
 
-        yield pattern
+    def get_reverse_table(self):
+        """Return the reverse table of the URL patterns returned by
+        :func:`patterns` (as if they were the URL patterns of the root
+        URLconf). The URL group pattern returned by :func:`patterns` is
+        built with the reverse table of its URL patterns (and of the
+        routers it contains), so only the root URL group has to be
+        added to the table, which is cached until the patterns change.
+
+        :returns: Reverse table
+        :rtype: :class:`django_crucrudile.reversers.ReverseTable`
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`django_crucrudile.routers.Router.reverse`
+
+        """
+        pattern = next(self.patterns())
+        cache = self._reverse_table
+        if cache is None or cache[0] is not pattern:
+            cache = self._reverse_table = (
+                pattern, ReverseTable.from_patterns([pattern])
+            )
+        return cache[1]
+
+    def reverse(self, name, *args, **kwargs):
+        """Reverse an URL name (fully namespaced) of the URL patterns
+        returned by :func:`patterns`, using the reverse table returned
+        by :func:`get_reverse_table`. The returned URL is the one
+        :func:`django.core.urlresolvers.reverse` would return if the
+        URL patterns were used as root URLconf, but the reverse
+        dictionaries of Django resolvers are not populated.
+
+        :argument name: URL name
+        :type name: str
+        :argument args: Positional arguments
+        :argument kwargs: Keyword arguments
+
+        :returns: URL
+        :rtype: str
+
+        :raises NoReverseMatch: If the URL name could not be reversed
+                                with the given arguments
+
+        >>> from django.core.urlresolvers import reverse
+        >>> from django.views.generic import View
+        >>>
+        >>> class DocumentView(View):
+        ...   pass
+        >>>
+        >>> router = Router()
+        >>> documents_router = Router(
+        ...   namespace='documents', url_part='documents'
+        ... )
+        >>> router.register(documents_router) is not None
+        True
+        >>> documents_router.register(
+        ...   ViewRoute(DocumentView, url_part='(?P<pk>\\d+)')
+        ... ) is not None
+        True
+        >>>
+        >>> router.reverse('documents:document', pk=42)
+        '/documents/42'
+        >>> router.reverse('documents:document', 42)
+        '/documents/42'
+        >>> router.reverse('documents:document', 42) == reverse(
+        ...   'documents:document', tuple(router.patterns()), [42]
+        ... )
+        True
+        >>> router.get_reverse_table() is router.get_reverse_table()
+        True
+
+        """
+        return self.get_reverse_table().reverse(name, args, kwargs)
+
+    def snapshot(self, path):
+        """Write a snapshot of the URL patterns returned by :func:`patterns`
+        (called without arguments) to a file, that can be loaded by
+        :func:`load_snapshot` to get the same URL patterns without
+        building them (see :mod:`django_crucrudile.routers.snapshot`).
+
+        :argument path: Snapshot file path
+        :type path: str
+
+        :returns: Snapshot content
+        :rtype: dict
+
+        :raises ValueError: If an URL pattern can not be written in the
+                            snapshot (such as when its callback is not
+                            importable), or if the definition of the
+                            router tree can not be described (see
+                            :func:`django_crucrudile.routers.snapshot.get_definition`)
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`django_crucrudile.routers.Router.load_snapshot`
+
+        """
+        from django_crucrudile import __version__
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'crucrudile': __version__,
+            'hash': get_definition_hash(self),
+            'patterns': [dump_pattern(pattern) for pattern in self.patterns()]
+        }
+        with open(path, 'w') as snapshot_file:
+            json.dump(data, snapshot_file, sort_keys=True)
+        return data
+
+    def load_snapshot(self, path):
+        """Return the URL patterns returned by :func:`patterns` (called
+        without arguments), loading them from a snapshot file written
+        by :func:`snapshot` if it was written for the same definition
+        of the router tree (see
+        :func:`django_crucrudile.routers.snapshot.get_definition_hash`),
+        and building them otherwise (or if the snapshot file can not be
+        read, or if the definition of the router tree can not be
+        described).
+
+        The loaded URL patterns are stored in the patterns cache (see
+        :attr:`cache_patterns`).
+
+        :argument path: Snapshot file path
+        :type path: str
+
+        :returns: URL patterns
+        :rtype: list
+
+        >>> import os
+        >>> from tempfile import mkstemp
+        >>> from django.core.urlresolvers import resolve
+        >>>
+        >>> def make_router():
+        ...   router = Router(namespace='base', url_part='base')
+        ...   router.register(ViewRoute(
+        ...     view_class=RedirectView, name='view', index=True
+        ...   ))
+        ...   return router
+        >>>
+        >>> handle, path = mkstemp()
+        >>> os.close(handle)
+        >>> router = make_router()
+        >>> data = router.snapshot(path)
+        >>>
+        >>> router = make_router()
+        >>> urlconf = tuple(router.load_snapshot(path))
+        >>> router.patterns_cache_misses
+        0
+        >>> next(router.patterns()) is urlconf[0]
+        True
+        >>> print(router.get_str_tree())
+        ... # doctest: +NORMALIZE_WHITESPACE
+         - base @ ^base/
+           - view-redirect @ ^$ RedirectView
+           - view @ ^view$ RedirectView
+        >>> resolve('/base/view', urlconf).view_name
+        'base:view'
+        >>> router.reverse('base:view-redirect')
+        '/base/'
+
+        The URL patterns are built if the router tree changed :
+
+        >>> router = make_router()
+        >>> router.url_part = 'other'
+        >>> urlconf = tuple(router.load_snapshot(path))
+        >>> router.patterns_cache_misses
+        1
+        >>> os.remove(path)
+
+        """
+        try:
+            definition_hash = get_definition_hash(self)
+        except ValueError:
+            data = None
+        else:
+            data = read_snapshot(path, definition_hash)
+        if data is None:
+            return list(self.patterns())
+        version = self._store_version
+        callbacks = {}
+        pattern_list = [
+            load_pattern(pattern_data, self, callbacks)
+            for pattern_data in data['patterns']
+        ]
+        if self.cache_patterns:
+            key = self.get_patterns_cache_key(flatten=self.flatten)
+            cache = self._patterns_cache
+            if cache is None or cache[0] != version:
+                cache = self._patterns_cache = version, {}
+            cache[1][key] = pattern_list[0]
+        return pattern_list
 
 from .model import ModelRouter
 from .model.generic import GenericModelRouter
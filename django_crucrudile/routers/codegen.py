@@ -0,0 +1,389 @@
+"""This module contains :class:`URLModuleWriter`, that writes the URL
+patterns of a router as the source of a static URLconf module, made of
+:func:`django.conf.urls.url` and :func:`django.conf.urls.include` calls,
+with the regular expressions and URL names of the URL patterns, and
+that imports the view classes and calls ``as_view`` with literal
+arguments (see :func:`generate_urls_module`, used by the
+``generate_urls`` management command).
+
+The URL patterns are read using
+:func:`django_crucrudile.routers.snapshot.dump_pattern`, so the view
+arguments must be literal values or importable objects (see
+:func:`django_crucrudile.routers.snapshot.encode_value`).
+
+The URL resolvers of the router (such as
+:class:`django_crucrudile.resolvers.PrefixDispatchRegexURLResolver`)
+resolve paths as Django's URL resolver does, so they are all written
+as :func:`django.conf.urls.include` calls.
+
+"""
+import re
+
+from django_crucrudile.routers.snapshot import dump_pattern
+
+__all__ = ['URLModuleWriter', 'generate_urls_module']
+
+
+_callback_name_re = re.compile(r'view_\d+$')
+"""Regular expression that matches the callback variable names (see
+:func:`URLModuleWriter.render_callback`)"""
+
+
+class URLModuleWriter:
+    """Writer of a static URLconf module, from encoded URL patterns (see
+    :func:`django_crucrudile.routers.snapshot.dump_pattern`)
+
+    Imported names are aliased when they clash, and each callback is
+    defined once (as a module-level variable), even when it is used by
+    several URL patterns.
+
+    :attribute indent: Indentation string
+    :type indent: str
+    :attribute imports: Local names of the imported objects, by module
+                        name and object name
+    :type imports: dict
+    :attribute callbacks: Callback variable names and definitions, by
+                          encoded callback
+    :type callbacks: dict
+
+    >>> from django.conf.urls import url, include
+    >>> from django.views.generic import RedirectView
+    >>> from django_crucrudile.views import get_view_callback
+    >>>
+    >>> callback = get_view_callback(RedirectView, url='/target')
+    >>> pattern = url('^ns/', include([
+    ...   url('^a$', callback, {'b': (1,)}, name='a'),
+    ...   url('^(?P<pk>\\\\d+)$', callback, name='b'),
+    ... ], 'ns', 'ns'), {'c': None})
+    >>>
+    >>> print(URLModuleWriter().render([dump_pattern(pattern)]))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    from django.conf.urls import url, include
+    from django.views.generic.base import RedirectView
+    <BLANKLINE>
+    view_0 = RedirectView.as_view(url='/target')
+    <BLANKLINE>
+    urlpatterns = [
+        url('^ns/', include([
+            url('^a$', view_0, {'b': (1,)}, name='a'),
+            url('^(?P<pk>\\\\d+)$', view_0, name='b'),
+        ], namespace='ns', app_name='ns'), {'c': None}),
+    ]
+
+    """
+    indent = '    '
+    reserved_names = {
+        'url': ('django.conf.urls', 'url'),
+        'include': ('django.conf.urls', 'include'),
+        'reverse_lazy': ('django.core.urlresolvers', 'reverse_lazy'),
+        'urlpatterns': None,
+    }
+    """
+    :attribute reserved_names: Names used by the module source, that
+                               imported objects can not use (unless
+                               they are the objects the names are
+                               reserved for, given as module name and
+                               object name). Callback variable names
+                               (``view_N``) are reserved too.
+    :type reserved_names: dict
+    """
+
+    def __init__(self):
+        """Initialize writer"""
+        self.imports = {}
+        self.callbacks = {}
+
+    def get_name(self, path):
+        """Return the local name of an object (importing it)
+
+        :argument path: Module name and qualified name (see
+                        :func:`django_crucrudile.routers.snapshot.get_object_path`)
+        :type path: list of str
+
+        :returns: Local name
+        :rtype: str
+
+        >>> writer = URLModuleWriter()
+        >>> writer.get_name(['module.a', 'View'])
+        'View'
+        >>> writer.get_name(['module.b', 'View.Inner'])
+        'View_1.Inner'
+        >>> writer.get_name(['module.a', 'View'])
+        'View'
+        >>> print(writer.render([]))
+        from django.conf.urls import url, include
+        from module.a import View
+        from module.b import View as View_1
+        <BLANKLINE>
+        urlpatterns = [
+        ]
+        <BLANKLINE>
+
+        Imported objects do not shadow the names used by the module
+        source (see :attr:`reserved_names`) :
+
+        >>> writer.get_name(['module', 'include'])
+        'include_1'
+        >>> writer.get_name(['module', 'view_0'])
+        'view_0_1'
+        >>> writer.get_name(['django.core.urlresolvers', 'reverse_lazy'])
+        'reverse_lazy'
+        >>> writer.get_name(['module', 'reverse_lazy'])
+        'reverse_lazy_1'
+
+        """
+        module_name, qualname = path
+        name, _, attributes = qualname.partition('.')
+        key = module_name, name
+        local_name = self.imports.get(key)
+        if local_name is None:
+            taken = set(self.imports.values())
+            taken.update(
+                reserved for reserved, owner in self.reserved_names.items()
+                if owner != key
+            )
+            local_name, index = name, 0
+            while (local_name in taken or
+                   _callback_name_re.match(local_name)):
+                index += 1
+                local_name = '{}_{}'.format(name, index)
+            self.imports[key] = local_name
+        if attributes:
+            return '{}.{}'.format(local_name, attributes)
+        return local_name
+
+    def render_value(self, data):
+        """Return the source of an encoded value (see
+        :func:`django_crucrudile.routers.snapshot.encode_value`)
+
+        :argument data: Encoded value
+
+        :returns: Value source
+        :rtype: str
+
+        >>> from django_crucrudile.routers.snapshot import encode_value
+        >>>
+        >>> URLModuleWriter().render_value(encode_value(
+        ...   {'a': [None, ('b',), (1, 2)], 'c': URLModuleWriter}
+        ... ))
+        "{'a': [None, ('b',), (1, 2)], 'c': URLModuleWriter}"
+
+        """
+        if isinstance(data, list):
+            return '[{}]'.format(
+                ', '.join(self.render_value(item) for item in data)
+            )
+        elif isinstance(data, dict):
+            if 'tuple' in data:
+                items = [self.render_value(item) for item in data['tuple']]
+                if len(items) == 1:
+                    return '({},)'.format(items[0])
+                return '({})'.format(', '.join(items))
+            elif 'dict' in data:
+                return '{{{}}}'.format(', '.join(
+                    '{}: {}'.format(
+                        self.render_value(key), self.render_value(item)
+                    )
+                    for key, item in data['dict']
+                ))
+            return self.get_name(data['object'])
+        return repr(data)
+
+    def render_callback(self, data):
+        """Return the variable name of an encoded callback (see
+        :func:`django_crucrudile.routers.snapshot.encode_callback`),
+        defining it if needed
+
+        :argument data: Encoded callback
+        :type data: dict
+
+        :returns: Callback variable name
+        :rtype: str
+
+        >>> writer = URLModuleWriter()
+        >>> writer.render_callback({'redirect': 'ns:target'})
+        'view_0'
+        >>> writer.render_callback(
+        ...   {'callable': ['module', 'function']}
+        ... )
+        'function'
+        >>> writer.render_callback({'redirect': 'ns:target'})
+        'view_0'
+        >>> writer.callbacks
+        ... # doctest: +NORMALIZE_WHITESPACE
+        {('redirect', 'ns:target'):
+         ('view_0', "RedirectView.as_view(url=reverse_lazy('ns:target'))")}
+
+        """
+        if 'callable' in data:
+            return self.get_name(data['callable'])
+
+        if 'redirect' in data:
+            key = 'redirect', data['redirect']
+        else:
+            key = 'view', repr(data['view']), repr(data['kwargs'])
+        callback = self.callbacks.get(key)
+        if callback is None:
+            if 'redirect' in data:
+                definition = '{}.as_view(url={}({}))'.format(
+                    self.get_name(
+                        ['django.views.generic.base', 'RedirectView']
+                    ),
+                    self.get_name(
+                        ['django.core.urlresolvers', 'reverse_lazy']
+                    ),
+                    repr(data['redirect'])
+                )
+            else:
+                definition = '{}.as_view({})'.format(
+                    self.get_name(data['view']),
+                    ', '.join(
+                        '{}={}'.format(name, self.render_value(item))
+                        for name, item in data['kwargs']['dict']
+                    )
+                )
+            callback = self.callbacks[key] = (
+                'view_{}'.format(len(self.callbacks)), definition
+            )
+        return callback[0]
+
+    def render_pattern(self, data, level=1):
+        """Yield the source lines of an encoded URL pattern (see
+        :func:`django_crucrudile.routers.snapshot.dump_pattern`)
+
+        :argument data: Encoded URL pattern
+        :type data: dict
+        :argument level: Indentation level
+        :type level: int
+
+        :returns: Source lines
+        :rtype: iterable of str
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :class:`URLModuleWriter`
+
+        """
+        indent = self.indent * level
+        if 'patterns' in data:
+            yield '{}url({}, include(['.format(indent, repr(data['regex']))
+            for sub_data in data['patterns']:
+                for line in self.render_pattern(sub_data, level + 1):
+                    yield line
+            default_kwargs = ''
+            if data['default_kwargs']['dict']:
+                default_kwargs = ', {}'.format(
+                    self.render_value(data['default_kwargs'])
+                )
+            yield '{}], namespace={}, app_name={}){}),'.format(
+                indent,
+                repr(data['namespace']),
+                repr(data['app_name']),
+                default_kwargs
+            )
+        else:
+            arguments = [
+                repr(data['regex']),
+                self.render_callback(data['callback'])
+            ]
+            if data['default_args']['dict']:
+                arguments.append(self.render_value(data['default_args']))
+            if data['name'] is not None:
+                arguments.append('name={}'.format(repr(data['name'])))
+            yield '{}url({}),'.format(indent, ', '.join(arguments))
+
+    def render(self, patterns_data, header=None):
+        """Return the source of the URLconf module, that defines
+        ``urlpatterns`` with the given encoded URL patterns
+
+        :argument patterns_data: Encoded URL patterns
+        :type patterns_data: list of dict
+        :argument header: Comment to write at the beginning of the
+                          module
+        :type header: str
+
+        :returns: Module source
+        :rtype: str
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :class:`URLModuleWriter`
+
+        """
+        pattern_lines = ['urlpatterns = [']
+        for data in patterns_data:
+            pattern_lines.extend(self.render_pattern(data))
+        pattern_lines.append(']')
+
+        lines = []
+        if header:
+            lines.extend('# {}'.format(line) for line in header.splitlines())
+        lines.append('from django.conf.urls import url, include')
+        for (module_name, name), local_name in sorted(self.imports.items()):
+            if local_name == name:
+                lines.append('from {} import {}'.format(module_name, name))
+            else:
+                lines.append('from {} import {} as {}'.format(
+                    module_name, name, local_name
+                ))
+        lines.append('')
+        for variable, definition in sorted(
+                self.callbacks.values(),
+                key=lambda callback: int(callback[0][5:])):
+            lines.append('{} = {}'.format(variable, definition))
+        if self.callbacks:
+            lines.append('')
+        return '\n'.join(lines + pattern_lines) + '\n'
+
+
+def generate_urls_module(router, header=None):
+    """Return the source of a static URLconf module, that defines
+    ``urlpatterns`` with the URL patterns returned by
+    :func:`django_crucrudile.routers.Router.patterns` (called without
+    arguments)
+
+    :argument router: Router
+    :type router: :class:`django_crucrudile.routers.Router`
+    :argument header: Comment to write at the beginning of the module
+    :type header: str
+
+    :returns: Module source
+    :rtype: str
+
+    :raises ValueError: If an URL pattern can not be written (see
+                        :func:`django_crucrudile.routers.snapshot.dump_pattern`)
+
+    >>> from django.views.generic import RedirectView
+    >>> from django_crucrudile.routers import Router
+    >>> from django_crucrudile.routes import ViewRoute
+    >>>
+    >>> router = Router(namespace='base', url_part='base')
+    >>> router.register(ViewRoute(RedirectView, name='view', index=True))
+    ... # doctest: +ELLIPSIS
+    <...ViewRoute object at ...>
+    >>>
+    >>> print(generate_urls_module(router, header='Generated'))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    # Generated
+    from django.conf.urls import url, include
+    from django.core.urlresolvers import reverse_lazy
+    from django.views.generic.base import RedirectView
+    <BLANKLINE>
+    view_0 = RedirectView.as_view(url=reverse_lazy('base:view'))
+    view_1 = RedirectView.as_view()
+    <BLANKLINE>
+    urlpatterns = [
+        url('^base/', include([
+            url('^$', view_0, name='view-redirect'),
+            url('^view$', view_1, name='view'),
+        ], namespace='base', app_name='base')),
+    ]
+
+    """
+    writer = URLModuleWriter()
+    return writer.render(
+        [dump_pattern(pattern) for pattern in router.patterns()],
+        header
+    )
@@ -0,0 +1,179 @@
+"""This module contains the redirect graph used by
+:class:`django_crucrudile.routers.Router` to find the redirect targets
+of the routers of a router tree (see
+:func:`django_crucrudile.routers.Router.get_redirect_graph`).
+
+Redirect attributes make a graph, where each object (router or entity)
+points to its ``redirect`` attribute. Following the ``redirect``
+attributes of an object ends with an URL name (string), with ``None``,
+or with a cycle. As each object has only one ``redirect`` attribute,
+the redirect targets of all the objects of the graph can be found by
+following each edge only once, marking objects that are being
+followed (to detect cycles) and objects whose target is known (to
+reuse it).
+
+"""
+__all__ = ['RedirectCycleError', 'RedirectGraph']
+
+
+class RedirectCycleError(OverflowError):
+    """Raised when following redirect attributes leads to a cycle
+
+    :attribute members: Objects in the cycle (in redirect order)
+    :type members: tuple
+
+    >>> error = RedirectCycleError(('a', 'b'))
+    >>> error.members
+    ('a', 'b')
+    >>> print(error)
+    Redirect graph has a cycle : 'a' -> 'b' -> 'a'
+
+    """
+    def __init__(self, members):
+        """Initialize error, with the members of the cycle
+
+        :argument members: See :attr:`members`
+        :type members: tuple
+
+        """
+        self.members = tuple(members)
+        super().__init__(
+            "Redirect graph has a cycle : {}".format(
+                ' -> '.join(
+                    repr(member)
+                    for member in self.members + self.members[:1]
+                )
+            )
+        )
+
+
+class RedirectGraph:
+    """Graph of redirect attributes, that stores the result of
+    following the redirect attributes of each object it visits (see
+    :func:`follow`).
+
+    The result for an object is a 4-tuple, that contains the
+    namespaces found when following its redirect attributes (including
+    its own namespace), the URL name that ends the chain (or ``None``),
+    the last object whose redirect attribute was followed, and the
+    number of followed redirect attributes.
+
+    :attribute get_namespace: Callable that returns the namespace to
+                              add to the redirect URL name when
+                              following the redirect attribute of an
+                              object (or ``None``)
+    :type get_namespace: callable
+
+    >>> from mock import Mock
+    >>>
+    >>> graph = RedirectGraph(lambda node: getattr(node, 'namespace', None))
+    >>> leaf = Mock(namespace=None, redirect='target')
+    >>> child = Mock(namespace='child', redirect=leaf)
+    >>> parent = Mock(namespace='parent', redirect=child)
+    >>>
+    >>> graph.follow(parent) == (('parent', 'child'), 'target', leaf, 3)
+    True
+    >>> graph.follow(child) == (('child',), 'target', leaf, 2)
+    True
+    >>> graph.follow('target')
+    ((), 'target', None, 0)
+    >>> graph.follow(None)
+    ((), None, None, 0)
+    >>> len(graph)
+    3
+
+    Cycles are detected, and the same error is raised for the objects
+    that lead to a cycle :
+
+    >>> a = Mock(namespace=None, spec=['namespace', 'redirect'])
+    >>> b = Mock(namespace=None, redirect=a)
+    >>> a.redirect = b
+    >>> start = Mock(namespace=None, redirect=a)
+    >>>
+    >>> try:
+    ...   graph.follow(start)
+    ... except RedirectCycleError as error:
+    ...   start_error = error
+    >>> start_error.members == (a, b)
+    True
+    >>> try:
+    ...   graph.follow(b)
+    ... except RedirectCycleError as error:
+    ...   error is start_error
+    True
+
+    """
+    def __init__(self, get_namespace):
+        """Initialize redirect graph
+
+        :argument get_namespace: See :attr:`get_namespace`
+        :type get_namespace: callable
+
+        """
+        self.get_namespace = get_namespace
+        self._results = {}
+        # keep references to the visited objects, so that their ids
+        # are not reused
+        self._nodes = []
+
+    def __len__(self):
+        """Return the number of visited objects
+
+        :returns: Number of visited objects
+        :rtype: int
+        """
+        return len(self._nodes)
+
+    def follow(self, node):
+        """Follow the redirect attributes of an object, reusing the results
+        found for the objects that were already visited
+
+        :argument node: Object, URL name or ``None``
+
+        :returns: Namespaces, URL name (or ``None``), last object whose
+                  redirect attribute was followed, and number of
+                  followed redirect attributes
+        :rtype: 4-tuple
+
+        :raises RedirectCycleError: If following the redirect
+                                    attributes leads to a cycle
+
+        """
+        # objects being followed (by id), with their position in path
+        following = {}
+        path = []
+        current = node
+        while True:
+            if current is None or isinstance(current, str):
+                result = ((), current, None, 0)
+                break
+            key = id(current)
+            if key in self._results:
+                result = self._results[key]
+                break
+            if key in following:
+                result = RedirectCycleError(path[following[key]:])
+                break
+            following[key] = len(path)
+            path.append(current)
+            current = current.redirect
+
+        # store the results of the followed objects (last first)
+        for item in reversed(path):
+            if not isinstance(result, RedirectCycleError):
+                namespaces, target, last, depth = result
+                namespace = self.get_namespace(item)
+                if namespace:
+                    namespaces = (namespace,) + namespaces
+                result = (
+                    namespaces,
+                    target,
+                    item if last is None else last,
+                    depth + 1
+                )
+            self._results[id(item)] = result
+            self._nodes.append(item)
+
+        if isinstance(result, RedirectCycleError):
+            raise result
+        return result
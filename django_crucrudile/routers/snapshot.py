@@ -0,0 +1,734 @@
+"""This module contains the functions used by
+:func:`django_crucrudile.routers.Router.snapshot` and
+:func:`django_crucrudile.routers.Router.load_snapshot`, to write the URL
+pattern tree built by a router to a file, and to rebuild the URL
+patterns from this file (without calling the routes, and without
+building the base stores of the routers that are still pending, see
+:attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`).
+
+A snapshot is a JSON document, that contains :
+
+- the snapshot format version (:data:`SNAPSHOT_VERSION`) and the
+  version of ``django-crucrudile``
+- the hash of the definition of the router tree (see
+  :func:`get_definition_hash`), that must match the hash of the
+  router tree for the snapshot to be used
+- the URL pattern tree (see :func:`dump_pattern`) : the regular
+  expressions, URL names, namespaces and default arguments of the URL
+  patterns, and the callbacks (the dotted path of the view class, with
+  the view arguments, see
+  :func:`django_crucrudile.views.get_view_callback`, or the URL name of
+  the redirect patterns).
+
+Values (view arguments and default arguments) can be JSON values,
+lists, tuples, dictionaries, or importable objects (such as classes,
+see :func:`get_object_path`).
+
+"""
+import hashlib
+import json
+import sys
+from importlib import import_module
+from types import FunctionType
+
+from django.core.urlresolvers import RegexURLResolver, reverse_lazy
+from django.conf.urls import url
+from django.views.generic import RedirectView
+from django.utils.encoding import force_text
+from django.utils.functional import Promise
+
+from django_crucrudile import __version__
+from django_crucrudile.resolvers import LazyRegexURLResolver
+from django_crucrudile.reversers import ReverseTable
+from django_crucrudile.urlutils import intern_regex
+from django_crucrudile.views import get_view_callback
+
+__all__ = [
+    'SNAPSHOT_VERSION',
+    'get_object_path', 'import_object',
+    'encode_value', 'decode_value',
+    'dump_pattern', 'load_pattern',
+    'get_definition', 'get_definition_hash',
+    'read_snapshot',
+]
+
+SNAPSHOT_VERSION = 1
+"""
+:attribute SNAPSHOT_VERSION: Version of the snapshot format
+:type SNAPSHOT_VERSION: int
+"""
+
+
+def get_object_path(obj):
+    """Return the path of an importable object (module name and
+    qualified name)
+
+    :argument obj: Class or function, defined at module-level (or in a
+                   class defined at module-level)
+
+    :returns: Module name and qualified name
+    :rtype: list of str
+
+    :raises ValueError: If the object can not be imported from its
+                        path
+
+    >>> get_object_path(RedirectView)
+    ['django.views.generic.base', 'RedirectView']
+    >>> get_object_path(lambda: None)
+    Traceback (most recent call last):
+      ...
+    ValueError: Can not get the path of <lambda> (not importable).
+
+    """
+    path = [
+        getattr(obj, '__module__', None),
+        getattr(obj, '__qualname__', None)
+    ]
+    try:
+        found = import_object(path)
+    except (ImportError, AttributeError, TypeError):
+        found = None
+    if found is not obj:
+        raise ValueError(
+            "Can not get the path of {} (not importable).".format(
+                getattr(obj, '__qualname__', obj)
+            )
+        )
+    return path
+
+
+def import_object(path):
+    """Import an object from its path (see :func:`get_object_path`)
+
+    :argument path: Module name and qualified name
+    :type path: list of str
+
+    :returns: Imported object
+
+    >>> import_object(['django.views.generic.base', 'RedirectView'])
+    <class 'django.views.generic.base.RedirectView'>
+
+    """
+    module_name, qualname = path
+    obj = sys.modules.get(module_name)
+    if obj is None:
+        obj = import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def encode_value(value):
+    """Encode a value, so that it can be written in a JSON document
+    (see :func:`decode_value`)
+
+    :argument value: Value to encode
+
+    :returns: Encoded value
+
+    :raises ValueError: If the value can not be encoded
+
+    >>> encode_value({'model': RedirectView, 'args': (1, [None])})
+    ... # doctest: +NORMALIZE_WHITESPACE
+    {'dict': [['args', {'tuple': [1, [None]]}],
+              ['model', {'object': ['django.views.generic.base',
+                                    'RedirectView']}]]}
+    >>> encode_value(object())  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    ValueError: Can not get the path of <object object at ...> ...
+
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, list):
+        return [encode_value(item) for item in value]
+    elif isinstance(value, tuple):
+        return {'tuple': [encode_value(item) for item in value]}
+    elif isinstance(value, dict):
+        return {'dict': sorted(
+            [encode_value(key), encode_value(item)]
+            for key, item in value.items()
+        )}
+    return {'object': get_object_path(value)}
+
+
+def decode_value(data):
+    """Decode a value encoded by :func:`encode_value`
+
+    :argument data: Encoded value
+
+    :returns: Value
+
+    >>> decode_value(encode_value({'model': RedirectView, 'args': (1,)}))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    {'args': (1,), 'model': <class 'django.views.generic.base.RedirectView'>}
+    >>> decode_value(encode_value([None, (1, 'a')]))
+    [None, (1, 'a')]
+
+    """
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    elif isinstance(data, dict):
+        if 'tuple' in data:
+            return tuple(decode_value(item) for item in data['tuple'])
+        elif 'dict' in data:
+            return {
+                decode_value(key): decode_value(item)
+                for key, item in data['dict']
+            }
+        return import_object(data['object'])
+    return data
+
+
+def encode_callback(callback):
+    """Encode the callback of an URL pattern
+
+    :argument callback: URL pattern callback
+
+    :returns: Encoded callback
+    :rtype: dict
+
+    :raises ValueError: If the callback can not be encoded
+
+    >>> from django_crucrudile.views import get_view_callback
+    >>>
+    >>> encode_callback(get_view_callback(RedirectView, url='/target'))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    {'view': ['django.views.generic.base', 'RedirectView'],
+     'kwargs': {'dict': [['url', '/target']]}}
+
+    """
+    redirect_url_name = getattr(callback, 'redirect_url_name', None)
+    if redirect_url_name is not None:
+        return {'redirect': redirect_url_name}
+    view_class = getattr(callback, 'view_class', None)
+    if view_class is not None:
+        return {
+            'view': get_object_path(view_class),
+            'kwargs': encode_value(callback.view_initkwargs)
+        }
+    return {'callable': get_object_path(callback)}
+
+
+def decode_callback(data):
+    """Decode a callback encoded by :func:`encode_callback`
+
+    :argument data: Encoded callback
+    :type data: dict
+
+    :returns: URL pattern callback
+    :rtype: callable
+
+    >>> callback = decode_callback({'redirect': 'target'})
+    >>> callback.__name__, callback.redirect_url_name
+    ('RedirectView', 'target')
+    >>> decode_callback(encode_callback(import_object)) is import_object
+    True
+
+    """
+    if 'redirect' in data:
+        callback = get_view_callback(
+            RedirectView, url=reverse_lazy(data['redirect'])
+        )
+        callback.redirect_url_name = data['redirect']
+        return callback
+    elif 'view' in data:
+        return get_view_callback(
+            import_object(data['view']), **decode_value(data['kwargs'])
+        )
+    return import_object(data['callable'])
+
+
+def dump_pattern(pattern):
+    """Encode an URL pattern (recursively, for URL resolvers)
+
+    :argument pattern: URL pattern
+    :type pattern: :class:`django.core.urlresolvers.RegexURLPattern` or
+                   :class:`django.core.urlresolvers.RegexURLResolver`
+
+    :returns: Encoded URL pattern
+    :rtype: dict
+
+    :raises ValueError: If the URL pattern can not be encoded
+
+    >>> from django.utils.translation import ugettext_lazy
+    >>>
+    >>> dump_pattern(url(ugettext_lazy('^a$'), None))
+    ... # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    ValueError: Can not dump translated regular expression of <...>.
+
+    .. seealso::
+
+       For doctests that use this member, see
+       :func:`load_pattern`
+
+    """
+    if not isinstance(pattern._regex, str):
+        raise ValueError(
+            "Can not dump translated regular expression of {}.".format(
+                pattern
+            )
+        )
+    data = {'regex': pattern._regex}
+    if isinstance(pattern, RegexURLResolver):
+        data['lazy'] = isinstance(pattern, LazyRegexURLResolver)
+        if data['lazy']:
+            pattern = pattern.resolver
+        data.update(
+            resolver=get_object_path(type(pattern)),
+            namespace=pattern.namespace,
+            app_name=pattern.app_name,
+            default_kwargs=encode_value(pattern.default_kwargs),
+            router=hasattr(pattern, 'router'),
+            patterns=[
+                dump_pattern(sub_pattern)
+                for sub_pattern in pattern.url_patterns
+            ]
+        )
+    else:
+        data.update(
+            name=pattern.name,
+            callback=encode_callback(pattern.callback),
+            default_args=encode_value(pattern.default_args)
+        )
+    return data
+
+
+def _get_store_routers(router):
+    """Return the routers registered in the store of ``router``, in
+    order, without registering its base store if it is still pending
+    and can not contain routers.
+
+    :argument router: Router (or None)
+    :type router: :class:`django_crucrudile.routers.Router`
+
+    :returns: Registered routers
+    :rtype: tuple
+
+    >>> from django_crucrudile.routers import Router
+    >>> from django_crucrudile.routes import ViewRoute
+    >>>
+    >>> class BaseRouter(Router):
+    ...   pass
+    >>>
+    >>> route_class = ViewRoute.make_for_view(RedirectView)
+    >>> BaseRouter.register_class(route_class) is route_class
+    True
+    >>>
+    >>> router = BaseRouter(lazy_base_store=True)
+    >>> _get_store_routers(router)
+    ()
+    >>> router._pending_base_store is not None
+    True
+    >>>
+    >>> child = router.register(Router(url_part='child'))
+    >>> _get_store_routers(router) == (child,)
+    True
+    >>> _get_store_routers(None)
+    ()
+
+    """
+    from django_crucrudile.routers import Router
+    pending = getattr(router, '_pending_base_store', None)
+    if pending is not None and not any(
+            isinstance(item, type) and issubclass(item, Router)
+            for item in pending[0]
+    ):
+        entities = tuple(router._entities)
+    else:
+        entities = getattr(router, 'get_store_snapshot', tuple)()
+    return tuple(
+        entity for entity in entities
+        if isinstance(entity, Router)
+    )
+
+
+def load_pattern(data, router=None, callbacks=None):
+    """Decode an URL pattern encoded by :func:`dump_pattern`
+    (recursively, for URL resolvers). The URL resolvers get a reverse
+    table (see :class:`django_crucrudile.reversers.ReverseTable`),
+    and, if they were built by a router, the router (from the routers
+    registered in ``router``, in order).
+
+    :argument data: Encoded URL pattern
+    :type data: dict
+    :argument router: Router that built the URL pattern (if any)
+    :type router: :class:`django_crucrudile.routers.Router`
+    :argument callbacks: Decoded callbacks, by encoded callback (to
+                         share callbacks between URL patterns)
+    :type callbacks: dict
+
+    :returns: URL pattern
+    :rtype: :class:`django.core.urlresolvers.RegexURLPattern` or
+            :class:`django.core.urlresolvers.RegexURLResolver`
+
+    >>> from django.conf.urls import url, include
+    >>> from django_crucrudile.views import get_view_callback
+    >>>
+    >>> callback = get_view_callback(RedirectView, url='/target')
+    >>> pattern = url('^ns/', include(
+    ...   [url('^a$', callback, {'b': 1}, name='a')], 'ns', 'ns'
+    ... ))
+    >>> data = dump_pattern(pattern)
+    >>> data['patterns'][0]['callback']['view']
+    ['django.views.generic.base', 'RedirectView']
+    >>>
+    >>> loaded = load_pattern(data)
+    >>> loaded
+    <RegexURLResolver <RegexURLPattern list> (ns:ns) ^ns/>
+    >>> loaded.url_patterns
+    [<RegexURLPattern a ^a$>]
+    >>> loaded.url_patterns[0].default_args
+    {'b': 1}
+    >>> dump_pattern(loaded) == data
+    True
+
+    """
+    if callbacks is None:
+        callbacks = {}
+    regex = data['regex']
+    if 'patterns' not in data:
+        key = json.dumps(data['callback'], sort_keys=True)
+        callback = callbacks.get(key)
+        if callback is None:
+            callback = callbacks[key] = decode_callback(data['callback'])
+        return intern_regex(url(
+            regex, callback, decode_value(data['default_args']),
+            name=data['name']
+        ))
+
+    routers = iter(_get_store_routers(router))
+
+    def get_resolver():
+        pattern_list = [
+            load_pattern(
+                sub_data,
+                next(routers, None) if sub_data.get('router') else None,
+                callbacks
+            )
+            for sub_data in data['patterns']
+        ]
+        resolver = import_object(data['resolver'])(
+            regex,
+            pattern_list,
+            decode_value(data['default_kwargs']),
+            app_name=data['app_name'],
+            namespace=data['namespace']
+        )
+        # (the reverse table is only built when it is used)
+        resolver.reverse_table = ReverseTable.from_patterns(
+            pattern_list, lazy=True
+        )
+        if router is not None:
+            resolver.router = router
+        return resolver
+
+    if not data['lazy']:
+        return get_resolver()
+    resolver = LazyRegexURLResolver(
+        regex, get_resolver,
+        app_name=data['app_name'],
+        namespace=data['namespace']
+    )
+    if router is not None:
+        resolver.router = router
+    return resolver
+
+
+def _get_definition_value(value):
+    """Return the representation of an attribute value used in entity
+    definitions (see :func:`get_definition`). Lazy strings (such as
+    the strings returned by
+    :func:`django.utils.translation.ugettext_lazy`) are resolved.
+
+    :argument value: Attribute value
+
+    :returns: Value representation
+
+    :raises ValueError: If the value can not be represented (the
+                        definition would not change when the value
+                        changes)
+
+    >>> from django.utils.translation import ugettext_lazy
+    >>>
+    >>> _get_definition_value({'part': ugettext_lazy('part')})
+    [['part', 'part']]
+    >>> _get_definition_value(object())  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    ValueError: Can not describe <object object at ...> in the entity \
+definition.
+
+    """
+    if isinstance(value, Promise):
+        value = force_text(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, (list, tuple)):
+        return [_get_definition_value(item) for item in value]
+    elif isinstance(value, dict):
+        return sorted(
+            [str(key), _get_definition_value(item)]
+            for key, item in value.items()
+        )
+    elif isinstance(value, type):
+        return _get_class_definition(value)
+    elif isinstance(value, (classmethod, staticmethod)):
+        return _get_definition_value(value.__func__)
+    elif isinstance(value, property):
+        return [
+            _get_definition_value(value.fget),
+            _get_definition_value(value.fset),
+            _get_definition_value(value.fdel)
+        ]
+    view_class = getattr(value, 'view_class', None)
+    if isinstance(value, FunctionType) and view_class is not None:
+        # view callbacks (see get_view_callback) have the same path
+        return [
+            _get_definition_value(view_class),
+            _get_definition_value(getattr(value, 'view_initkwargs', None))
+        ]
+    if not isinstance(value, FunctionType):
+        raise ValueError(
+            "Can not describe {} in the entity definition.".format(value)
+        )
+    return '{}.{}'.format(value.__module__, value.__qualname__)
+
+
+def _get_class_definition(cls):
+    """Return the representation of a class used in entity definitions
+    (see :func:`get_definition`) : the class path if the class can be
+    found at its path (in an imported module), and otherwise (for the
+    classes made at runtime, such as the classes made by
+    :func:`django_crucrudile.routes.mixins.view.ViewMixin.make_for_view`),
+    the class path, the definitions of its bases and its public
+    attributes.
+
+    :argument cls: Class
+    :type cls: class
+
+    :returns: Class representation
+    :rtype: str or list
+
+    >>> _get_class_definition(RedirectView)
+    'django.views.generic.base.RedirectView'
+    >>> _get_class_definition(type('View', (RedirectView,), {'url': '/a'}))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['django_crucrudile.routers.snapshot.View',
+     ['django.views.generic.base.RedirectView'],
+     [['url', '/a']]]
+
+    """
+    path = '{}.{}'.format(cls.__module__, cls.__qualname__)
+    found = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split('.'):
+        found = getattr(found, name, None)
+    if found is cls:
+        return path
+    return [
+        path,
+        [_get_class_definition(base) for base in cls.__bases__],
+        _get_definition_value({
+            name: value for name, value in vars(cls).items()
+            if not name.startswith('_')
+        })
+    ]
+
+
+def get_definition(entity):
+    """Return the definition of an entity, that contains the source
+    definitions used to build its URL patterns (recursively, for
+    routers), without instantiating the entities that are not built
+    yet :
+
+    - for routers, the router class (see
+      :func:`_get_class_definition`), the patterns cache key (see
+      :func:`django_crucrudile.routers.Router.get_patterns_cache_key`),
+      the redirect target, and either the definitions of the
+      registered entities, or, if the base store is still pending
+      (see
+      :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`),
+      the entity classes of the base store and the arguments they will
+      be instantiated with
+    - for other entities, their class (with its public attributes for
+      the classes made at runtime, such as the classes made by
+      :func:`django_crucrudile.routes.mixins.view.ViewMixin.make_for_view`)
+      and their public instance attributes
+
+    :argument entity: Entity
+    :type entity: :class:`django_crucrudile.entities.Entity`
+
+    :returns: Entity definition
+    :rtype: list
+
+    :raises ValueError: If an attribute value can not be described
+                        (see :func:`_get_definition_value`)
+
+    .. seealso::
+
+       For doctests that use this member, see
+       :func:`get_definition_hash`
+
+    """
+    from django_crucrudile.routers import Router
+    entity_type = _get_class_definition(type(entity))
+    if isinstance(entity, Router):
+        pending = entity._pending_base_store
+        if pending is not None:
+            # do not register the base store (reading the entity store
+            # or the redirect attribute would)
+            classes, kwargs = pending
+            entities = ['base', _get_definition_value(list(classes)),
+                        _get_definition_value(kwargs)]
+            redirect = _get_definition_value(entity._redirect)
+        else:
+            stored = entity.get_store_snapshot()
+            entities = [get_definition(item) for item in stored]
+            redirect = entity.redirect
+            if not (redirect is None or isinstance(redirect, str)):
+                position = next(
+                    (position for position, item in enumerate(stored)
+                     if item is redirect),
+                    None
+                )
+                redirect = (_get_definition_value(redirect)
+                            if position is None else position)
+        return [
+            entity_type,
+            _get_definition_value(entity.get_patterns_cache_key()),
+            entity.flatten,
+            redirect,
+            entities
+        ]
+    as_dict = getattr(entity, '_asdict', None)
+    attributes = as_dict() if as_dict is not None else vars(entity)
+    return [entity_type, _get_definition_value({
+        name: value for name, value in attributes.items()
+        if not name.startswith('_')
+    })]
+
+
+def get_definition_hash(router):
+    """Return the hash of the definition of a router tree (see
+    :func:`get_definition`), and of the versions of the snapshot format
+    and of ``django-crucrudile``
+
+    :argument router: Router
+    :type router: :class:`django_crucrudile.routers.Router`
+
+    :returns: Definition hash
+    :rtype: str
+
+    :raises ValueError: If the router tree definition can not be
+                        described (see :func:`get_definition`)
+
+    >>> from django_crucrudile.routers import Router
+    >>> from django_crucrudile.routes import ViewRoute
+    >>>
+    >>> router = Router()
+    >>> route = ViewRoute(RedirectView, name='view')
+    >>> router.register(route) is route
+    True
+    >>> get_definition(route)
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['django_crucrudile.routes.ViewRoute',
+     [['arguments', []], ['arguments_spec', []], ['name', 'view'],
+      ['redirect', 'view'], ['url_part', 'view'],
+      ['view_class', 'django.views.generic.base.RedirectView']]]
+    >>> get_definition(route.to_record())
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['django_crucrudile.routes.record.RouteRecord',
+     [['callback', ['django.views.generic.base.RedirectView', []]],
+      ['index', False], ['model', None], ['name', 'view'],
+      ['names', ['view']], ['redirect', 'view'], ['regexs', ['^view$']],
+      ['url_name', 'view'],
+      ['view_class', 'django.views.generic.base.RedirectView']]]
+
+    The view class of the routes made by
+    :func:`django_crucrudile.routes.mixins.view.ViewMixin.make_for_view`
+    is a class-level attribute :
+
+    >>> from django.views.generic import View
+    >>>
+    >>> route_class = ViewRoute.make_for_view(RedirectView)
+    >>>
+    >>> class RedirectView(View):
+    ...   pass
+    >>>
+    >>> get_definition(route_class()) == (
+    ...   get_definition(ViewRoute.make_for_view(RedirectView)())
+    ... )
+    False
+    >>>
+    >>> definition_hash = get_definition_hash(router)
+    >>> get_definition_hash(router) == definition_hash
+    True
+    >>> route.url_part = 'other'
+    >>> get_definition_hash(router) == definition_hash
+    False
+
+    The entity classes of pending base stores (see
+    :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`)
+    are described without being instantiated :
+
+    >>> class BaseRouter(Router):
+    ...   @property
+    ...   def url_part(self):
+    ...     return 'base'
+    ...   @classmethod
+    ...   def get_route_class(cls):
+    ...     return route_class
+    >>>
+    >>> BaseRouter.register_class(route_class) is route_class
+    True
+    >>> router = BaseRouter(lazy_base_store=True)
+    >>> get_definition(router)[4]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    ['base',
+     [['abc.RedirectRoute',
+       ['django_crucrudile.routes.ViewRoute'],
+       [['view_class', 'django.views.generic.base.RedirectView']]]],
+     []]
+    >>> router._pending_base_store is not None
+    True
+
+    """
+    definition = [
+        SNAPSHOT_VERSION, __version__, get_definition(router)
+    ]
+    return hashlib.sha256(
+        json.dumps(definition, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def read_snapshot(path, definition_hash):
+    """Read a snapshot file, and return its content if it can be used
+    (if its format version is :data:`SNAPSHOT_VERSION`, and if its
+    definition hash is ``definition_hash``)
+
+    :argument path: Snapshot file path
+    :type path: str
+    :argument definition_hash: Definition hash of the router tree (see
+                               :func:`get_definition_hash`)
+    :type definition_hash: str
+
+    :returns: Snapshot content, or ``None``
+    :rtype: dict
+
+    >>> read_snapshot('/non/existing/path', None) is None
+    True
+
+    """
+    try:
+        with open(path) as snapshot_file:
+            data = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(data, dict) or
+            data.get('version') != SNAPSHOT_VERSION or
+            data.get('hash') != definition_hash):
+        return None
+    return data
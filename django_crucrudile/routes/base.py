@@ -15,7 +15,8 @@ from abc import abstractmethod
 from django.conf.urls import url
 
 from django_crucrudile.entities import Entity
-from django_crucrudile.urlutils import URLBuilder
+from django_crucrudile.urlutils import URLBuilder, intern_regex
+from django_crucrudile.routes.record import RouteRecord
 
 
 class BaseRoute(Entity):
@@ -55,6 +56,17 @@ class BaseRoute(Entity):
     :type auto_url_part: bool
 
     """
+    cache_urls = True
+    """
+    :attribute cache_urls: If True, cache the URL regexs and URL names
+                           returned by :func:`get_urls`, until an
+                           attribute of the route is set (see
+                           :func:`__setattr__`) or
+                           :func:`clear_url_cache` is called.
+    :type cache_urls: bool
+    """
+    _url_cache = None
+
     def __init__(self,
                  name=None, url_part=None,
                  **kwargs):
@@ -117,6 +129,31 @@ class BaseRoute(Entity):
         super().__init__(**kwargs)
         self.redirect = self.get_url_name()
 
+    def __setattr__(self, name, value):
+        """Set attribute. If the attribute is public, clear the URL regexs
+        and URL names cached by :func:`get_urls` (as they are built
+        from the public attributes, such as :attr:`name`,
+        :attr:`url_part`, or the arguments and model of the route
+        mixins), and invalidate the caches of the entity stores where
+        the route is registered (see
+        :func:`django_crucrudile.entities.Entity.entity_changed`).
+
+        :argument name: Attribute name
+        :type name: str
+        :argument value: Attribute value
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`get_urls`
+
+        """
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            if self._url_cache is not None:
+                self.clear_url_cache()
+            self.entity_changed()
+
     def patterns(self, parents=None,
                  add_redirect=None,
                  add_redirect_silent=None):
@@ -149,17 +186,118 @@ class BaseRoute(Entity):
         """
         callback = self.get_callback()
 
-        regexs_names = product(
-            self.get_url_regexs(),
-            self.get_url_names()
-        )
+        regexs_names = product(*self.get_urls())
 
         for regex, name in regexs_names:
-                yield url(
+                yield intern_regex(url(
                     regex,
                     callback,
                     name=name
-                )
+                ))
+
+    def get_urls(self):
+        """Return the URL regexs (from :func:`get_url_regexs`) and URL names
+        (from :func:`get_url_names`) used by :func:`patterns`. If
+        :attr:`cache_urls` is True, they are cached until a public
+        attribute of the route is set, or :func:`clear_url_cache` is
+        called.
+
+        :returns: URL regexs and URL names
+        :rtype: 2-tuple of tuple
+
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = Route(name='name', url_part='url_part')
+        >>>
+        >>> route.get_urls()
+        (('^url_part$',), ('name',))
+        >>> route.get_urls() is route.get_urls()
+        True
+        >>> route.url_part = 'other_part'
+        >>> route.get_urls()
+        (('^other_part$',), ('name',))
+        >>> route.name = 'other_name'
+        >>> route.get_urls()
+        (('^other_part$',), ('other_name',))
+
+        Private attributes do not clear the cache :
+
+        >>> urls = route.get_urls()
+        >>> route._private = True
+        >>> route.get_urls() is urls
+        True
+
+        With :attr:`cache_urls` set to ``False`` :
+
+        >>> route.cache_urls = False
+        >>> route.get_urls() is route.get_urls()
+        False
+
+        """
+        urls = self._url_cache
+        if urls is None:
+            urls = (
+                tuple(self.get_url_regexs()),
+                tuple(self.get_url_names())
+            )
+            if self.cache_urls:
+                self._url_cache = urls
+        return urls
+
+    def clear_url_cache(self):
+        """Clear the URL regexs and URL names cached by :func:`get_urls`.
+        This is called when a public attribute of the route is set
+        (see :func:`__setattr__`), and must be called when a value
+        used to build them is changed in place.
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`get_urls`
+
+        """
+        self._url_cache = None
+
+    def to_record(self):
+        """Return the compact and immutable record of this route (see
+        :class:`django_crucrudile.routes.record.RouteRecord`), that
+        yields the same URL patterns as :func:`patterns`, and that can
+        be registered in place of the route.
+
+        :returns: Route record
+        :rtype: :class:`django_crucrudile.routes.record.RouteRecord`
+
+        >>> callback = lambda: None
+        >>>
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...     return callback
+        >>>
+        >>> route = Route(name='name', url_part='url_part')
+        >>> record = route.to_record()
+        >>>
+        >>> record.name, record.redirect, record.regexs, record.names
+        ('name', 'name', ('^url_part$',), ('name',))
+        >>> record.callback is callback
+        True
+        >>> list(record.patterns())
+        [<RegexURLPattern name ^url_part$>]
+
+        """
+        regexs, names = self.get_urls()
+        return RouteRecord(
+            name=self.name,
+            url_name=self.get_url_name(),
+            redirect=self.redirect,
+            index=self.index,
+            model=getattr(self, 'model', None),
+            view_class=getattr(self, 'view_class', None),
+            callback=self.get_callback(),
+            regexs=regexs,
+            names=names
+        )
 
     @abstractmethod
     def get_callback(self):  # pragma: no cover
@@ -2,6 +2,10 @@
 implements :class:`django_crucrudile.routes.base.BaseRoute`.
 
 """
+from collections import Counter
+from weakref import WeakValueDictionary
+
+from django_crucrudile.views import get_view_callback
 
 
 class ViewMixin:
@@ -65,6 +69,58 @@ class ViewMixin:
                                         stripping it of ``View``)
     :type auto_url_name_from_view: bool
     """
+    cache_callback = True
+    """
+    :attribute cache_callback: If True, :func:`get_callback` returns
+                               the callback it built for the same view
+                               class and view arguments (instead of
+                               calling :func:`View.as_view` each time
+                               the URL patterns are built)
+    :type cache_callback: bool
+    """
+    intern_callbacks = False
+    """
+    :attribute intern_callbacks: If True, the callbacks built for
+                                 identical view classes and view
+                                 arguments are shared by all the
+                                 routes, using
+                                 :attr:`callback_intern_table`
+    :type intern_callbacks: bool
+    """
+    callback_intern_table = WeakValueDictionary()
+    """
+    :attribute callback_intern_table: Process-wide table of the
+                                      callbacks built by the routes
+                                      that use
+                                      :attr:`intern_callbacks`, by view
+                                      class and view arguments (a
+                                      callback is removed when no URL
+                                      pattern uses it)
+    :type callback_intern_table: :class:`weakref.WeakValueDictionary`
+    """
+    route_class_cache = WeakValueDictionary()
+    """
+    :attribute route_class_cache: Process-wide table of the route
+                                  classes made by :func:`make_for_view`,
+                                  by base class, view class and class
+                                  attributes (a route class is removed
+                                  when it is not used anymore). The
+                                  cached route classes are shared, and
+                                  must not be modified (subclass them
+                                  instead).
+    :type route_class_cache: :class:`weakref.WeakValueDictionary`
+    :attribute route_class_hits: Number of times :func:`make_for_view`
+                                 returned a cached route class
+    :type route_class_hits: int
+    :attribute route_class_misses: Number of times
+                                   :func:`make_for_view` made a new
+                                   route class
+    :type route_class_misses: int
+    """
+    route_class_hits = 0
+    route_class_misses = 0
+    _callback_cache = None
+
     def __init__(self,
                  view_class=None,
                  name=None,
@@ -127,10 +183,80 @@ class ViewMixin:
         >>> route.get_callback() is callback
         True
 
+        The callback is cached until the view class, or the view
+        arguments, change :
+
+        >>> mock_view.as_view = lambda: Mock()
+        >>> route.get_callback() is callback
+        True
+        >>> route.view_class = Mock(as_view=lambda: callback)
+        >>> route.get_callback() is callback
+        True
+        >>> route.get_view_kwargs = lambda: {'arg': 'value'}
+        >>> route.view_class.as_view = lambda arg: Mock()
+        >>> route.get_callback() is callback
+        False
+
         """
-        return self.view_class.as_view(
-            **self.get_view_kwargs()
-        )
+        view_class = self.view_class
+        view_kwargs = self.get_view_kwargs()
+        cache = self._callback_cache
+        if (self.cache_callback and cache is not None and
+                cache[0] is view_class and cache[1] == view_kwargs):
+            return cache[2]
+        callback = self.build_callback(view_kwargs)
+        if self.cache_callback:
+            self._callback_cache = (view_class, view_kwargs, callback)
+        return callback
+
+    def build_callback(self, view_kwargs):
+        """Build callback using
+        :func:`django_crucrudile.views.get_view_callback` (that calls
+        :func:`django.generic.views.View.as_view`), with the given view
+        arguments. If :attr:`intern_callbacks` is True, reuse the
+        callback in :attr:`callback_intern_table` (if the view
+        arguments are hashable).
+
+        :argument view_kwargs: View arguments (see
+                               :func:`get_view_kwargs`)
+        :type view_kwargs: dict
+
+        :returns: Callback to use in URL pattern
+        :rtype: callable
+
+        >>> from django.views.generic import View
+        >>>
+        >>> class TestView(View):
+        ...   extra = None
+        >>>
+        >>> route = ViewMixin(TestView)
+        >>> other = ViewMixin(TestView)
+        >>> route.build_callback({}) is other.build_callback({})
+        False
+        >>>
+        >>> route.intern_callbacks = other.intern_callbacks = True
+        >>> callback = route.build_callback({})
+        >>> callback is other.build_callback({})
+        True
+        >>> route.build_callback({'extra': []}) is callback
+        False
+
+        """
+        view_class = self.view_class
+        if self.intern_callbacks:
+            try:
+                key = (view_class, frozenset(view_kwargs.items()))
+                hash(key)
+            except TypeError:
+                pass
+            else:
+                callback = self.callback_intern_table.get(key)
+                if callback is None:
+                    callback = self.callback_intern_table[key] = (
+                        get_view_callback(view_class, **view_kwargs)
+                    )
+                return callback
+        return get_view_callback(view_class, **view_kwargs)
 
     def get_view_kwargs(self):
         """Return arguments to use when calling the callback builder.
@@ -170,7 +296,43 @@ class ViewMixin:
         >>> route_class.view_class.__name__
         'TestView'
 
+        Route classes are cached (see :attr:`route_class_cache`), and
+        the same class is returned for the same base class, view class
+        and class attributes (if they are hashable, and of the same
+        type). As the same class can be returned to several callers, it
+        must not be modified (set the attributes in ``kwargs``, or
+        subclass it) :
+
+        >>> ViewMixin.make_for_view(TestView) is route_class
+        True
+        >>> ViewMixin.make_for_view(TestView, name='other') is route_class
+        False
+        >>> ViewMixin.make_for_view(
+        ...   TestView, tags=[]
+        ... ) is ViewMixin.make_for_view(TestView, tags=[])
+        False
+        >>> ViewMixin.make_for_view(
+        ...   TestView, index=True
+        ... ) is ViewMixin.make_for_view(TestView, index=1)
+        False
+        >>> ViewMixin.make_for_view(TestView, index=1).index
+        1
+
         """
+        try:
+            key = (cls, view_class, frozenset(
+                (name, type(value), value)
+                for name, value in kwargs.items()
+            ))
+            hash(key)
+        except TypeError:
+            key = None
+        else:
+            route_class = cls.route_class_cache.get(key)
+            if route_class is not None:
+                ViewMixin.route_class_hits += 1
+                return route_class
+
         view_name = view_class.__name__
         if view_name.endswith('View'):
             view_name = view_name[:-4]
@@ -178,8 +340,48 @@ class ViewMixin:
 
         kwargs['view_class'] = view_class
 
-        return type(
+        route_class = type(
             route_name,
             (cls,),
             kwargs
         )
+        ViewMixin.route_class_misses += 1
+        if key is not None:
+            cls.route_class_cache[key] = route_class
+        return route_class
+
+    @classmethod
+    def get_route_class_report(cls):
+        """Return the number of route classes made by :func:`make_for_view`
+        that still exist (in total, and by base class name), and the
+        number of cache hits and misses of :func:`make_for_view`
+
+        :returns: Route classes report
+        :rtype: dict
+
+        >>> class ReportedView:
+        ...   pass
+        >>>
+        >>> before = ViewMixin.get_route_class_report()
+        >>> route_classes = [
+        ...   ViewMixin.make_for_view(ReportedView) for _ in range(3)
+        ... ]
+        >>> after = ViewMixin.get_route_class_report()
+        >>>
+        >>> after['classes'] - before['classes']
+        1
+        >>> after['hits'] - before['hits'], after['misses'] - before['misses']
+        (2, 1)
+        >>> after['bases']['ViewMixin'] >= 1
+        True
+
+        """
+        bases = Counter(
+            key[0].__name__ for key in list(cls.route_class_cache.keys())
+        )
+        return {
+            'classes': sum(bases.values()),
+            'bases': dict(bases),
+            'hits': ViewMixin.route_class_hits,
+            'misses': ViewMixin.route_class_misses,
+        }
@@ -0,0 +1,114 @@
+"""This module contains :class:`RouteRecord`, a compact and immutable
+representation of a route, that a route can be frozen into (see
+:func:`django_crucrudile.routes.base.BaseRoute.to_record`) once it is
+built, and that can be registered in place of the route (see
+:func:`django_crucrudile.routers.Router.freeze_routes`).
+
+A route record is a tuple, that only contains what is needed to build
+the URL patterns of the route (its callback, URL regexs and URL names),
+to use it as redirect target, and to look it up in the store indexes
+(see
+:func:`django_crucrudile.entities.store.EntityStore.get_index_values`).
+
+"""
+from collections import namedtuple
+from itertools import product
+
+from django.conf.urls import url
+
+from django_crucrudile.entities import Entity
+from django_crucrudile.urlutils import intern_regex
+
+__all__ = ['RouteRecord']
+
+
+class RouteRecord(namedtuple(
+        'RouteRecord',
+        'name url_name redirect index model view_class callback regexs names'
+)):
+    """Compact route record, implements
+    :class:`django_crucrudile.entities.Entity` (it is registered as a
+    virtual subclass, as tuple subclasses can not have instance
+    attributes).
+
+    :attribute name: Route name (see
+                     :attr:`django_crucrudile.routes.base.BaseRoute.name`)
+    :type name: str
+    :attribute url_name: Main URL name (see
+                         :func:`django_crucrudile.routes.base.BaseRoute.get_url_name`)
+    :type url_name: str
+    :attribute redirect: Redirect target of the route (URL name)
+    :type redirect: str
+    :attribute index: See :attr:`django_crucrudile.entities.Entity.index`
+    :type index: bool
+    :attribute model: Model of the route (or ``None``)
+    :type model: subclass of :class:`django.db.models.Model`
+    :attribute view_class: View class of the route (or ``None``)
+    :type view_class: subclass of :class:`django.views.generic.View`
+    :attribute callback: Callback to use in the URL patterns
+    :type callback: callable
+    :attribute regexs: URL regexs
+    :type regexs: tuple of str
+    :attribute names: URL names
+    :type names: tuple of str
+
+    >>> record = RouteRecord(
+    ...   'name', 'model-name', 'model-name', False, None, None,
+    ...   None, ('^list$', '^list/all$'), ('model-name',)
+    ... )
+    >>> isinstance(record, Entity)
+    True
+    >>> record.get_url_name()
+    'model-name'
+    >>> list(record.patterns())
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [<RegexURLPattern model-name ^list$>,
+     <RegexURLPattern model-name ^list/all$>]
+    >>> record.__dict__
+    Traceback (most recent call last):
+      ...
+    AttributeError: 'RouteRecord' object has no attribute '__dict__'
+
+    """
+    __slots__ = ()
+
+    def get_url_name(self):
+        """Return the main URL name of the route (used in the store index)
+
+        :returns: Main URL name
+        :rtype: str
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :class:`RouteRecord`
+
+        """
+        return self.url_name
+
+    def patterns(self, parents=None,
+                 add_redirect=None,
+                 add_redirect_silent=None):
+        """Yield the URL patterns of the route, as
+        :func:`django_crucrudile.routes.base.BaseRoute.patterns` does
+
+        .. note::
+
+           The arguments are not used, see
+           :func:`django_crucrudile.routes.base.BaseRoute.patterns`
+
+        :returns: Django URL patterns
+        :rtype: iterable of ``RegexURLPattern``
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :class:`RouteRecord`
+
+        """
+        callback = self.callback
+        for regex, name in product(self.regexs, self.names):
+            yield intern_regex(url(regex, callback, name=name))
+
+
+Entity.register(RouteRecord)
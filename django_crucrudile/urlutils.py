@@ -104,6 +104,50 @@ def compose(functions, *args, **kwargs):
     return composed
 
 
+regex_intern_table = {}
+"""
+:attribute regex_intern_table: Compiled regular expressions (by
+                               language code) of URL patterns, by
+                               regular expression string, shared by
+                               the URL patterns passed to
+                               :func:`intern_regex`
+:type regex_intern_table: dict
+"""
+
+
+def intern_regex(pattern):
+    """Make an URL pattern share the compiled regular expressions of the
+    URL patterns with the same regular expression string, using
+    :attr:`regex_intern_table`. The regular expression is still
+    compiled on first use, but only once for all these URL patterns
+    (and it does not depend on the size of the cache of the :mod:`re`
+    module).
+
+    Only URL patterns whose regular expression is a string (not
+    translated) are interned.
+
+    :argument pattern: URL pattern
+    :type pattern: :class:`django.core.urlresolvers.RegexURLPattern`
+
+    :returns: URL pattern
+    :rtype: :class:`django.core.urlresolvers.RegexURLPattern`
+
+    >>> from django.conf.urls import url
+    >>>
+    >>> first = intern_regex(url('^interned$', None))
+    >>> second = intern_regex(url('^interned$', None))
+    >>> first.regex is second.regex
+    True
+    >>> first._regex_dict is regex_intern_table['^interned$']
+    True
+
+    """
+    regex = pattern._regex
+    if isinstance(regex, str):
+        pattern._regex_dict = regex_intern_table.setdefault(regex, {})
+    return pattern
+
+
 class Separated:
     """Accepts separator options in :func:`__init__`, and provide
     :func:`get_separator`, that returns the corresponding separator
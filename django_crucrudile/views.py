@@ -0,0 +1,110 @@
+"""This module contains the views used by
+:class:`django_crucrudile.routers.Router` in its redirect patterns (see
+:attr:`django_crucrudile.routers.Router.redirect_mode`), and
+:func:`get_view_callback`, used to get the callbacks of view classes.
+
+"""
+from django.core.urlresolvers import reverse, get_script_prefix, get_urlconf
+from django.views.generic import RedirectView
+
+__all__ = ['ReversedRedirectView', 'get_view_callback']
+
+
+def get_view_callback(view_class, **initkwargs):
+    """Return the callback of a view class (using
+    :func:`django.views.generic.View.as_view`), with the view class and
+    its arguments set on the callback (as ``view_class`` and
+    ``view_initkwargs`` attributes, as in later Django versions), so
+    that the callback can be serialized (see
+    :mod:`django_crucrudile.routers.snapshot`).
+
+    :argument view_class: View class
+    :type view_class: subclass of :class:`django.views.generic.View`
+
+    :returns: View callback
+    :rtype: callable
+
+    >>> callback = get_view_callback(RedirectView, url='/target')
+    >>> callback.__name__
+    'RedirectView'
+    >>> callback.view_class is RedirectView, callback.view_initkwargs
+    (True, {'url': '/target'})
+
+    """
+    callback = view_class.as_view(**initkwargs)
+    callback.view_class = view_class
+    callback.view_initkwargs = initkwargs
+    return callback
+
+
+class ReversedRedirectView(RedirectView):
+    """Redirect view that reverses its URL name (:attr:`url_name`) on the
+    first request (when the URLconf is loaded), and then redirects to
+    the reversed URL as a constant URL, instead of reversing it on each
+    request (as
+    ``RedirectView.as_view(url=reverse_lazy(url_name))`` does).
+
+    The reversed URL is stored in :attr:`url_cache`, that is shared by
+    the requests handled by the view function returned by
+    :func:`as_view`. As the reversed URL depends on the script prefix
+    and on the URLconf of the request, it is stored for each script
+    prefix and URLconf.
+
+    :attribute url_name: URL name to reverse
+    :type url_name: str
+    :attribute url_cache: Dictionary where the reversed URLs are stored
+                          (given to :func:`as_view`), by script prefix
+                          and URLconf
+    :type url_cache: dict
+
+    >>> from mock import Mock, patch
+    >>>
+    >>> view = ReversedRedirectView.as_view(url_name='target', url_cache={})
+    >>> view.__name__
+    'ReversedRedirectView'
+    >>>
+    >>> with patch('django_crucrudile.views.reverse') as reverse:
+    ...   reverse.return_value = '/target/url'
+    ...   response = view(Mock(method='GET', META={}))
+    ...   response = view(Mock(method='GET', META={}))
+    >>> response['Location']
+    '/target/url'
+    >>> reverse.call_count
+    1
+
+    Requests with another script prefix (or URLconf) reverse the URL
+    name again :
+
+    >>> with patch('django_crucrudile.views.reverse') as reverse, \\
+    ...      patch('django_crucrudile.views.get_script_prefix') as prefix:
+    ...   prefix.return_value = '/prefix/'
+    ...   reverse.return_value = '/prefix/target/url'
+    ...   response = view(Mock(method='GET', META={}))
+    >>> response['Location']
+    '/prefix/target/url'
+    >>> view(Mock(method='GET', META={}))['Location']
+    '/target/url'
+
+    """
+    url_name = None
+    url_cache = None
+
+    def get_redirect_url(self, *args, **kwargs):
+        """Return the URL to redirect to, reversing :attr:`url_name` if it
+        was not reversed yet
+
+        .. seealso::
+
+           For arguments, see
+           :func:`django.views.generic.RedirectView.get_redirect_url`
+
+        :returns: URL to redirect to
+        :rtype: str
+
+        """
+        key = get_script_prefix(), get_urlconf()
+        url = self.url_cache.get(key)
+        if url is None:
+            url = self.url_cache[key] = reverse(self.url_name)
+        self.url = url
+        return super().get_redirect_url(*args, **kwargs)
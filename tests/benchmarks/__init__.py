@@ -0,0 +1,9 @@
+"""Benchmarks, not collected by the test suite. Each module can be run
+as a script, for example :
+
+.. code-block:: bash
+
+   DJANGO_SETTINGS_MODULE=tests.settings \\
+     python -m tests.benchmarks.class_creation
+
+"""
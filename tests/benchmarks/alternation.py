@@ -0,0 +1,77 @@
+"""Measure the time needed to resolve paths with the resolver built by
+:func:`django_crucrudile.routers.Router.patterns`, with and without
+:attr:`django_crucrudile.routers.Router.alternation`, for routers that
+contain 10, 50 and 100 view routes (each with a ``pk`` and a ``slug``
+argument variant, as the routes of generic model routers).
+
+The resolved paths are the first view, the last view, and a path that
+does not match.
+
+"""
+from timeit import repeat
+
+from django.core.urlresolvers import RegexURLResolver, Resolver404
+from django.views.generic import View
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import ViewRoute
+
+
+class ArgumentsViewRoute(ViewRoute):
+    """View route with ``pk`` and ``slug`` argument variants"""
+    arguments_spec = [['(?P<pk>\\d+)', '(?P<slug>[\\w-]+)']]
+
+
+def make_router(count, alternation):
+    """Return a router that contains ``count`` view routes"""
+    router = Router()
+    router.alternation = alternation
+    router.register_many([
+        ArgumentsViewRoute(type('Leaf{}View'.format(index), (View,), {}))
+        for index in range(count)
+    ])
+    return router
+
+
+def measure(count, alternation, number=2000):
+    """Return the time (in seconds) needed to resolve the first view,
+    the last view, and a path that does not match"""
+    router = make_router(count, alternation)
+    resolver = RegexURLResolver(r'^/', list(router.patterns()))
+    first = '/leaf0/42'
+    last = '/leaf{}/42'.format(count - 1)
+    assert resolver.resolve(last).kwargs == {'pk': '42'}
+
+    def resolve_missing():
+        try:
+            resolver.resolve('/missing')
+        except Resolver404:
+            pass
+
+    return tuple(
+        min(repeat(function, number=number, repeat=3)) / number
+        for function in (
+            lambda: resolver.resolve(first),
+            lambda: resolver.resolve(last),
+            resolve_missing
+        )
+    )
+
+
+def run():
+    """Print the results for 10, 50 and 100 leaves"""
+    for count in (10, 50, 100):
+        for alternation in (False, True):
+            first, last, miss = measure(count, alternation)
+            print(
+                "{:>3} leaves {:<11} {:>7.1f} us/first "
+                "{:>7.1f} us/last {:>7.1f} us/miss".format(
+                    count,
+                    "alternation" if alternation else "regex",
+                    first * 1e6, last * 1e6, miss * 1e6
+                )
+            )
+
+
+if __name__ == '__main__':
+    run()
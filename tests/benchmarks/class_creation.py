@@ -0,0 +1,94 @@
+"""Measure the time and memory needed to define router subclasses, as
+done when generating router classes dynamically (for example, one
+for each model or tenant).
+
+Two class layouts are measured, for the copy-on-write stores (see
+:func:`django_crucrudile.entities.store._share_class_store`), and for
+metaclasses that copy the stores on each class definition (previous
+behaviour) :
+
+ - a deep hierarchy (each class subclasses the previous one)
+ - a flat hierarchy (all classes subclass the same base)
+
+The base router has a populated base store and register maps, as
+generic model routers do.
+
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from django_crucrudile.entities.store import EntityStoreMetaclass
+from django_crucrudile.routers import Router
+
+
+class CopyingEntityStoreMetaclass(EntityStoreMetaclass):
+    """Metaclass that copies the stores on each class definition"""
+    def __init__(cls, name, bases, attrs):
+        super().__init__(name, bases, attrs)
+        cls._base_store_list = cls._base_store_list.copy()
+        cls._base_register_map = cls._base_register_map.copy()
+        cls._base_register_class_map = cls._base_register_class_map.copy()
+
+
+def make_base(metaclass, size):
+    """Return a router class with ``size`` entries in its base store and
+    register maps"""
+    base = metaclass('BaseRouter', (Router,), {})
+    for index in range(size):
+        key = type('Key{}'.format(index), (), {})
+        base.register_class(key)
+        base.set_register_mapping(key, None)
+        base.set_register_class_mapping(key, None)
+    return base
+
+
+def define_classes(base, count, deep):
+    """Define ``count`` subclasses of ``base``, and return them"""
+    classes = []
+    parent = base
+    for index in range(count):
+        cls = type(base)('Router{}'.format(index), (parent,), {})
+        classes.append(cls)
+        if deep:
+            parent = cls
+    return classes
+
+
+def measure(metaclass, size, count, deep):
+    """Return the time and the memory (in bytes) needed per subclass"""
+    base = make_base(metaclass, size)
+
+    gc.collect()
+    start = time.perf_counter()
+    define_classes(base, count, deep)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    classes = define_classes(base, count, deep)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del classes
+
+    return elapsed / count, memory / count
+
+
+def run(size=50, count=500):
+    """Print the results for both metaclasses and class layouts"""
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), count * 10))
+    print("Store size: {}, subclasses: {}".format(size, count))
+    for deep in (True, False):
+        for metaclass in (EntityStoreMetaclass, CopyingEntityStoreMetaclass):
+            per_class, memory = measure(metaclass, size, count, deep)
+            print("{:<8} {:<28} {:>8.1f} us/class {:>8.0f} B/class".format(
+                "deep" if deep else "flat",
+                metaclass.__name__,
+                per_class * 1e6,
+                memory
+            ))
+
+
+if __name__ == '__main__':
+    run()
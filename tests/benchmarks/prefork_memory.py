@@ -0,0 +1,104 @@
+"""Measure the memory (in kB) shared with the master process, and the
+private memory, of forked worker processes that resolve and reverse
+URLs with a router tree built by the master process (5 levels, 20
+routers wide, with 20 view routes in each router, see
+:func:`tests.benchmarks.resolve.make_tree`) :
+
+- ``lazy`` : the master process only registers the entities, the
+  workers build the URL patterns on first use
+- ``built`` : the master process builds the URL patterns
+- ``frozen`` : the master process freezes the router tree (see
+  :func:`django_crucrudile.routers.Router.freeze`, with
+  ``gc_freeze=True``)
+
+Each worker runs a garbage collection after resolving and reversing,
+as collections write in the headers of the tracked objects (unless
+they were moved to the permanent generation by :func:`gc.freeze`,
+available on Python 3.7 and later).
+
+The memory is read from ``/proc/self/smaps_rollup`` (or
+``/proc/self/smaps``), so this only runs on Linux.
+
+"""
+import gc
+import os
+
+from django.core.urlresolvers import RegexURLResolver
+
+from .resolve import make_tree
+
+
+MODES = ('lazy', 'built', 'frozen')
+
+
+def read_memory():
+    """Return the shared and private memory (in kB) of this process"""
+    path = '/proc/self/smaps_rollup'
+    if not os.path.exists(path):
+        path = '/proc/self/smaps'
+    shared = private = 0
+    with open(path) as smaps:
+        for line in smaps:
+            if line.startswith(('Shared_Clean:', 'Shared_Dirty:')):
+                shared += int(line.split()[1])
+            elif line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                private += int(line.split()[1])
+    return shared, private
+
+
+def fork(func, *args):
+    """Call ``func`` in a forked process, and return its result (a tuple
+    of integers)"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            result = func(*args)
+            os.write(write_fd, ' '.join(map(str, result)).encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = tuple(int(value) for value in pipe.read().split())
+    os.waitpid(pid, 0)
+    return result
+
+
+def work(router, path):
+    """Resolve and reverse URLs in a worker process, and return its
+    memory"""
+    resolver = RegexURLResolver(r'^/', list(router.patterns()))
+    match = resolver.resolve(path)
+    router.reverse(match.view_name)
+    gc.collect()
+    return read_memory()
+
+
+def master(mode, workers):
+    """Build the router tree as the master process would in the given
+    mode, and return the average memory of the workers"""
+    router, path = make_tree(5, 20, leaves=20)
+    if mode == 'built':
+        list(router.patterns())
+    elif mode == 'frozen':
+        router.freeze(gc_freeze=True)
+    results = [fork(work, router, path) for _ in range(workers)]
+    return tuple(
+        sum(values) // workers for values in zip(*results)
+    )
+
+
+def run(workers=4):
+    """Print the results for each mode"""
+    for mode in MODES:
+        shared, private = fork(master, mode, workers)
+        print(
+            "{:>6}: shared {:>7} kB, private {:>7} kB per worker".format(
+                mode, shared, private
+            )
+        )
+
+
+if __name__ == '__main__':
+    run()
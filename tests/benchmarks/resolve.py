@@ -0,0 +1,96 @@
+"""Measure the time needed to resolve paths with the nested resolvers
+built by :func:`django_crucrudile.routers.Router.patterns` (with and
+without prefix dispatch), and with the flat resolver
+(``flatten=True``), for 3 and 5 level router trees, 3 and 20 routers
+wide.
+
+Each router level contains a few view routes and a few sub-routers
+(only the last sub-router has children), and the resolved paths are
+the last view of the deepest router, and a path that does not match.
+
+"""
+from timeit import repeat
+
+from django.core.urlresolvers import RegexURLResolver, Resolver404
+from django.views.generic import View
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import ViewRoute
+
+
+def register_leaves(router, count):
+    """Register ``count`` view routes in ``router``"""
+    router.register_many([
+        ViewRoute(type('Leaf{}View'.format(index), (View,), {}))
+        for index in range(count)
+    ])
+
+
+def make_tree(depth, width=3, leaves=5, prefix_dispatch=None):
+    """Return a router tree ``depth`` levels deep, and the path to the
+    last view of the deepest router"""
+    router = Router()
+    router.prefix_dispatch = prefix_dispatch
+    register_leaves(router, leaves)
+    path = ''
+    parent = router
+    for level in range(depth):
+        children = [
+            Router(
+                namespace='level{}-{}'.format(level, index),
+                url_part='level{}-{}'.format(level, index)
+            )
+            for index in range(width)
+        ]
+        for child in children:
+            child.prefix_dispatch = prefix_dispatch
+            register_leaves(child, leaves)
+        parent.register_many(children)
+        path += 'level{}-{}/'.format(level, width - 1)
+        parent = children[-1]
+    return router, '/{}leaf{}'.format(path, leaves - 1)
+
+
+MODES = (
+    ('nested', False, False),
+    ('dispatch', True, False),
+    ('flat', False, True),
+)
+
+
+def measure(depth, width, prefix_dispatch, flatten, number=2000):
+    """Return the time (in seconds) needed to resolve a matching path,
+    and a path that does not match"""
+    router, path = make_tree(depth, width, prefix_dispatch=prefix_dispatch)
+    resolver = RegexURLResolver(r'^/', list(router.patterns(flatten=flatten)))
+    resolver.resolve(path)
+
+    def resolve_missing():
+        try:
+            resolver.resolve(path + '/missing')
+        except Resolver404:
+            pass
+
+    match = min(repeat(lambda: resolver.resolve(path),
+                       number=number, repeat=3)) / number
+    miss = min(repeat(resolve_missing, number=number, repeat=3)) / number
+    return match, miss
+
+
+def run():
+    """Print the results for 3 and 5 level trees, 3 and 20 routers
+    wide"""
+    for depth in (3, 5):
+        for width in (3, 20):
+            for name, prefix_dispatch, flatten in MODES:
+                match, miss = measure(depth, width, prefix_dispatch, flatten)
+                print(
+                    "{} levels {:>2} wide {:<8} "
+                    "{:>8.1f} us/match {:>8.1f} us/miss".format(
+                        depth, width, name, match * 1e6, miss * 1e6
+                    )
+                )
+
+
+if __name__ == '__main__':
+    run()
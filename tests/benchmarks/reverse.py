@@ -0,0 +1,69 @@
+"""Measure the time needed for the first call to
+:func:`django.core.urlresolvers.reverse` (that populates the reverse
+dictionaries of the resolvers) and to
+:func:`django_crucrudile.routers.Router.reverse` (whose reverse table
+is built with the URL patterns), and the time of the next calls, for
+router trees 3 and 5 levels deep, 3 and 20 routers wide.
+
+"""
+from time import perf_counter
+from timeit import repeat
+
+from django.core.urlresolvers import reverse, clear_url_caches
+
+from .resolve import make_tree
+
+
+def measure(depth, width, number=2000):
+    """Return the time (in seconds) needed to build the patterns, for
+    the first Django reverse, the first router reverse, and for the
+    next Django and router reverses"""
+    router, path = make_tree(depth, width)
+    name = ':'.join(
+        ['level{}-{}'.format(level, width - 1) for level in range(depth)] +
+        ['leaf4']
+    )
+
+    start = perf_counter()
+    urlconf = tuple(router.patterns())
+    build = perf_counter() - start
+
+    clear_url_caches()
+    start = perf_counter()
+    url = reverse(name, urlconf)
+    django_first = perf_counter() - start
+
+    start = perf_counter()
+    assert router.reverse(name) == url
+    router_first = perf_counter() - start
+
+    django_next = min(repeat(
+        lambda: reverse(name, urlconf), number=number, repeat=3
+    )) / number
+    router_next = min(repeat(
+        lambda: router.reverse(name), number=number, repeat=3
+    )) / number
+    return build, django_first, router_first, django_next, router_next
+
+
+def run():
+    """Print the results for 3 and 5 level trees, 3 and 20 routers
+    wide"""
+    for depth in (3, 5):
+        for width in (3, 20):
+            build, django_first, router_first, django_next, router_next = (
+                measure(depth, width)
+            )
+            print(
+                "{} levels {:>2} wide: build {:>7.1f} ms, first reverse "
+                "{:>7.1f} ms (django) {:>7.1f} ms (router), next "
+                "{:>5.1f} us (django) {:>5.1f} us (router)".format(
+                    depth, width, build * 1e3,
+                    django_first * 1e3, router_first * 1e3,
+                    django_next * 1e6, router_next * 1e6
+                )
+            )
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,73 @@
+"""Measure the memory (in bytes) used per route, for view routes (with
+their cached URL regexs, URL names and callback) and for the route
+records they can be frozen into (see
+:func:`django_crucrudile.routes.base.BaseRoute.to_record`), for 1000
+and 10000 routes. Route records are also measured with interned
+callbacks (see
+:attr:`django_crucrudile.routes.mixins.view.ViewMixin.intern_callbacks`).
+
+The routes use 5 view classes, and have a ``pk`` and a ``slug``
+argument variant (as the routes of generic model routers).
+
+"""
+import gc
+import tracemalloc
+
+from django.views.generic import View
+
+from .alternation import ArgumentsViewRoute
+
+
+VIEW_CLASSES = [
+    type('Action{}View'.format(index), (View,), {}) for index in range(5)
+]
+
+
+def make_routes(count):
+    """Return ``count`` view routes, with their caches populated"""
+    routes = [
+        ArgumentsViewRoute(
+            VIEW_CLASSES[index % len(VIEW_CLASSES)],
+            name='route{}'.format(index)
+        )
+        for index in range(count)
+    ]
+    for route in routes:
+        route.get_urls()
+        route.get_callback()
+    return routes
+
+
+def measure(count, frozen, interned=False):
+    """Return the memory (in bytes) used per route or route record"""
+    ArgumentsViewRoute.intern_callbacks = interned
+    try:
+        gc.collect()
+        tracemalloc.start()
+        entities = make_routes(count)
+        if frozen:
+            entities = [route.to_record() for route in entities]
+        gc.collect()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del entities
+    finally:
+        del ArgumentsViewRoute.intern_callbacks
+    return memory / count
+
+
+def run():
+    """Print the results for 1000 and 10000 routes"""
+    for count in (1000, 10000):
+        print(
+            "{:>5} routes: {:>6.0f} B/route (routes) "
+            "{:>6.0f} B/route (records) {:>6.0f} B/route (records, "
+            "interned callbacks)".format(
+                count, measure(count, False), measure(count, True),
+                measure(count, True, True)
+            )
+        )
+
+
+if __name__ == '__main__':
+    run()
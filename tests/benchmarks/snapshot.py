@@ -0,0 +1,113 @@
+"""Measure the time needed to get the URL patterns of a router tree
+when building them (:func:`django_crucrudile.routers.Router.patterns`),
+and when loading them from a snapshot
+(:func:`django_crucrudile.routers.Router.load_snapshot`, including the
+definition hash check), for 3 and 5 level router trees, 3 and 20
+routers wide.
+
+Both timings include the construction of the router tree. The routes
+are registered in the base stores of the router classes (as
+``@provides`` does), and the routers are instantiated with
+``lazy_base_store=True``, so the routes of the leaf routers (most of
+the tree) are only instantiated when the URL patterns are built
+(registering the children of a router registers its base store).
+
+The view and router classes must be importable to be written in the
+snapshot, so they are set as attributes of this module.
+
+"""
+import os
+import sys
+from tempfile import mkstemp
+from time import perf_counter
+
+from django.views.generic import View
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import ViewRoute
+
+
+_router_classes = {}
+
+
+def get_router_class(index, leaves):
+    """Return a router class, whose base store contains ``leaves`` view
+    routes (made once, as module-level definitions would be)"""
+    router_class = _router_classes.get((index, leaves))
+    if router_class is None:
+        module = sys.modules[__name__]
+        name = 'Tree{}x{}Router'.format(index, leaves)
+        router_class = type(name, (Router,), {'__module__': __name__})
+        setattr(module, name, router_class)
+        for leaf in range(leaves):
+            view_name = 'Leaf{}x{}View'.format(index, leaf)
+            view_class = type(view_name, (View,), {'__module__': __name__})
+            setattr(module, view_name, view_class)
+            router_class.register_class(
+                ViewRoute.make_for_view(view_class)
+            )
+        _router_classes[index, leaves] = router_class
+    return router_class
+
+
+def make_tree(depth, width=3, leaves=5):
+    """Return a router tree ``depth`` levels deep (see
+    :func:`tests.benchmarks.resolve.make_tree`), whose routers have
+    pending base stores"""
+    router = get_router_class(0, leaves)(lazy_base_store=True)
+    parent = router
+    index = 1
+    for level in range(depth):
+        children = []
+        for position in range(width):
+            children.append(get_router_class(index, leaves)(
+                namespace='level{}-{}'.format(level, position),
+                url_part='level{}-{}'.format(level, position),
+                lazy_base_store=True
+            ))
+            index += 1
+        parent.register_many(children)
+        parent = children[-1]
+    return router
+
+
+def measure(depth, width, repeat=5):
+    """Return the time (in seconds) needed to build the router tree and
+    its URL patterns, and to build the router tree and load its URL
+    patterns from a snapshot (best of ``repeat`` runs)"""
+    handle, path = mkstemp()
+    os.close(handle)
+    try:
+        make_tree(depth, width).snapshot(path)
+
+        build = load = float('inf')
+        for _ in range(repeat):
+            start = perf_counter()
+            router = make_tree(depth, width)
+            list(router.patterns())
+            build = min(build, perf_counter() - start)
+
+            start = perf_counter()
+            router = make_tree(depth, width)
+            router.load_snapshot(path)
+            load = min(load, perf_counter() - start)
+            assert router.patterns_cache_misses == 0
+    finally:
+        os.remove(path)
+    return build, load
+
+
+def run():
+    """Print the results for 3 and 5 level trees, 3 and 20 routers
+    wide"""
+    for depth in (3, 5):
+        for width in (3, 20):
+            build, load = measure(depth, width)
+            print(
+                "{} levels {:>2} wide: build {:>7.1f} ms, load snapshot "
+                "{:>7.1f} ms".format(depth, width, build * 1e3, load * 1e3)
+            )
+
+
+if __name__ == '__main__':
+    run()
@@ -45,6 +45,6 @@ True
      - version @ ^version$ VersionView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<PrefixDispatchRegexURLResolver <RegexURLPattern list> (None:None) ^>]
 
 """
@@ -45,5 +45,5 @@ True
      - book-detail @ ^detail$ DetailView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<PrefixDispatchRegexURLResolver <RegexURLPattern list> (None:None) ^>]
 """
@@ -63,6 +63,6 @@ True
      - app-version @ ^app-version$ VersionView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<PrefixDispatchRegexURLResolver <RegexURLPattern list> (None:None) ^>]
 
 """
@@ -0,0 +1,163 @@
+import os
+from io import StringIO
+from tempfile import mkstemp
+from types import ModuleType
+
+from nose.tools import assert_equal, assert_raises
+from django.conf.urls import url, include
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.urlresolvers import RegexURLResolver
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import CallbackRoute
+from django_crucrudile.routers.codegen import generate_urls_module
+
+from .routers import base_router
+from .test_resolving import ResolveTestCase
+from .test_reversing import ReverseTestCase
+
+
+def get_url_set(patterns, regex='', namespace=None):
+    """Return the full regexs, namespaced URL names, callback names and
+    default arguments of the URL patterns, as a set"""
+    url_set = set()
+    for pattern in patterns:
+        full_regex = regex + pattern.regex.pattern
+        if isinstance(pattern, RegexURLResolver):
+            sub_namespace = namespace
+            if pattern.namespace:
+                sub_namespace = ':'.join(
+                    filter(None, [namespace, pattern.namespace])
+                )
+            url_set.add((full_regex, pattern.namespace, pattern.app_name,
+                         repr(sorted(pattern.default_kwargs.items()))))
+            url_set |= get_url_set(
+                pattern.url_patterns, full_regex, sub_namespace
+            )
+        else:
+            name = pattern.name
+            if namespace and name:
+                name = '{}:{}'.format(namespace, name)
+            url_set.add((full_regex, name, pattern.callback.__name__,
+                         repr(sorted(pattern.default_args.items()))))
+    return url_set
+
+
+def load_urls_module(router):
+    module = ModuleType('generated_urls')
+    exec(generate_urls_module(router), module.__dict__)
+    return module
+
+
+class CodegenResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        self.built = list(self.router.patterns())
+        self.module = load_urls_module(self.router)
+        self.patterns = self.module.urlpatterns
+        self.url = url(
+            '^/',
+            include(self.patterns),
+        )
+
+    def test_url_set(self):
+        assert_equal(
+            get_url_set(self.patterns),
+            get_url_set(self.built)
+        )
+
+    def test_redirects(self):
+        built_url = url('^/', include(self.built))
+        for path in ['/', '/documents/', '/entities/']:
+            match = self.url.resolve(path)
+            built_match = built_url.resolve(path)
+            assert_equal(
+                (match.func.__name__, match.url_name, match.namespace,
+                 match.args, match.kwargs),
+                (built_match.func.__name__, built_match.url_name,
+                 built_match.namespace, built_match.args, built_match.kwargs)
+            )
+
+
+class LazyCodegenResolveTestCase(CodegenResolveTestCase):
+    def setUp(self):
+        Router.lazy_include = True
+        super().setUp()
+
+    def tearDown(self):
+        Router.lazy_include = False
+
+
+class AliasCodegenResolveTestCase(CodegenResolveTestCase):
+    def setUp(self):
+        Router.redirect_mode = 'alias'
+        super().setUp()
+
+    def tearDown(self):
+        Router.redirect_mode = 'lazy'
+
+
+class CodegenReverseTestCase(ReverseTestCase):
+    def setUp(self):
+        self.urlconf = load_urls_module(self.router)
+
+
+class CodegenCommandTestCase:
+    def test_stdout(self):
+        stdout = StringIO()
+        call_command(
+            'generate_urls', 'tests.functional.routers.base_router',
+            stdout=stdout
+        )
+        assert_equal(
+            stdout.getvalue(),
+            generate_urls_module(
+                base_router,
+                header='Generated by django-crucrudile from '
+                       'tests.functional.routers.base_router, do not edit.'
+            )
+        )
+
+    def test_output(self):
+        handle, path = mkstemp()
+        os.close(handle)
+        try:
+            call_command(
+                'generate_urls', 'tests.functional.routers.base_router',
+                output=path
+            )
+            with open(path) as output_file:
+                module = ModuleType('generated_urls')
+                exec(output_file.read(), module.__dict__)
+        finally:
+            os.remove(path)
+        assert_equal(
+            get_url_set(module.urlpatterns),
+            get_url_set(base_router.patterns())
+        )
+
+    def test_errors(self):
+        for args in [
+                (),
+                ('tests.functional.routers.missing',),
+                ('missing',),
+                ('tests.functional.routers.BaseRouter',),
+        ]:
+            assert_raises(
+                CommandError, call_command, 'generate_urls', *args
+            )
+
+    def test_unencodable(self):
+        from . import routers
+        router = Router()
+        router.register(CallbackRoute(
+            callback=lambda request: None, name='lambda'
+        ))
+        routers.unencodable_router = router
+        try:
+            assert_raises(
+                CommandError, call_command, 'generate_urls',
+                'tests.functional.routers.unencodable_router'
+            )
+        finally:
+            del routers.unencodable_router
@@ -0,0 +1,55 @@
+from nose.tools import assert_equal
+from django.core.urlresolvers import resolve, set_urlconf
+from django.test.client import RequestFactory
+
+from django_crucrudile.routers import Router
+
+from .routers import base_router
+
+
+class RedirectTestCase:
+    router = base_router
+    redirect_mode = 'lazy'
+
+    def setUp(self):
+        Router.redirect_mode = self.redirect_mode
+        self.urlconf = tuple(self.router.patterns())
+        set_urlconf(self.urlconf)
+
+    def tearDown(self):
+        set_urlconf(None)
+        Router.redirect_mode = 'lazy'
+
+    def get_response(self, path):
+        match = resolve(path, self.urlconf)
+        return match.func(
+            RequestFactory().get(path), *match.args, **match.kwargs
+        )
+
+    def _test_redirect(self, path, target):
+        response = self.get_response(path)
+        assert_equal(response['Location'], target)
+        # the target URL is the same on the next request
+        response = self.get_response(path)
+        assert_equal(response['Location'], target)
+
+    def test_redirects(self):
+        for path, target in [
+                ('/', '/documents/documentmodel/list'),
+                ('/documents/', '/documents/documentmodel/list'),
+                ('/documents/groupmodel/', '/documents/groupmodel/list')]:
+            yield self._test_redirect, path, target
+
+
+class EagerRedirectTestCase(RedirectTestCase):
+    redirect_mode = 'eager'
+
+
+class AliasRedirectTestCase(RedirectTestCase):
+    redirect_mode = 'alias'
+
+    def _test_redirect(self, path, target):
+        match = resolve(path, self.urlconf)
+        target_match = resolve(target, self.urlconf)
+        assert_equal(match.func.__name__, target_match.func.__name__)
+        assert_equal(match.kwargs, target_match.kwargs)
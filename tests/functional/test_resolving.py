@@ -1,5 +1,6 @@
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 from django.conf.urls import url, include
+from django.core.urlresolvers import RegexURLResolver, Resolver404
 
 from django.views.generic import (
     ListView,
@@ -9,6 +10,14 @@ from django.views.generic import (
     DeleteView
 )
 
+from django_crucrudile.routers import Router
+from django_crucrudile.resolvers import (
+    FlatRegexURLResolver,
+    PrefixDispatchRegexURLResolver,
+    AlternationRegexURLResolver,
+    LazyRegexURLResolver
+)
+
 from .routers import base_router
 from .models import (
     DocumentModel,
@@ -111,3 +120,72 @@ class ResolveTestCase:
                             model_name, action_name,
                             view_name, None, prefix
                         )
+
+
+class FlatResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        self.patterns = list(self.router.patterns(flatten=True))
+        self.url = url(
+            '^/',
+            include(self.patterns),
+        )
+
+    def test_alternation(self):
+        view = lambda: None
+        tree = [url('^x/', include([url('^b$|^c$', view, name='bc')]))]
+        for resolver_class in RegexURLResolver, FlatRegexURLResolver:
+            resolver = resolver_class('^/', tree)
+            assert_equal(resolver.resolve('/x/c').url_name, 'bc')
+            assert_raises(Resolver404, resolver.resolve, '/c')
+
+
+class PrefixDispatchResolveTestCase(ResolveTestCase):
+    def test_quantified_prefix(self):
+        view = lambda: None
+        tree = [url('^a/*b$', view, name='ab'), url('^c/', include([]))]
+        for resolver_class in (RegexURLResolver,
+                               PrefixDispatchRegexURLResolver):
+            resolver = resolver_class('^/', tree)
+            assert_equal(resolver.resolve('/ab').url_name, 'ab')
+            assert_equal(resolver.resolve('/a//b').url_name, 'ab')
+
+    def test_resolver_class(self):
+        assert isinstance(self.patterns[0], PrefixDispatchRegexURLResolver)
+
+
+class RegexResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        Router.prefix_dispatch = False
+        super().setUp()
+
+    def tearDown(self):
+        Router.prefix_dispatch = None
+
+    def test_resolver_class(self):
+        assert not isinstance(
+            self.patterns[0], PrefixDispatchRegexURLResolver
+        )
+
+
+class AlternationResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        Router.alternation = True
+        super().setUp()
+
+    def tearDown(self):
+        Router.alternation = False
+
+    def test_resolver_class(self):
+        assert isinstance(self.patterns[0], AlternationRegexURLResolver)
+
+
+class LazyResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        Router.lazy_include = True
+        super().setUp()
+
+    def tearDown(self):
+        Router.lazy_include = False
+
+    def test_resolver_class(self):
+        assert isinstance(self.patterns[0], LazyRegexURLResolver)
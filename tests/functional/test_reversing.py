@@ -0,0 +1,47 @@
+from nose.tools import assert_equal
+from django.core.urlresolvers import reverse
+
+from django_crucrudile.routers import Router
+
+from .routers import base_router
+from .test_resolving import (
+    MODEL_NAME_DICT,
+    ACTION_NAME_DICT,
+    ACTION_ARGS_DICT
+)
+
+
+class ReverseTestCase:
+    router = base_router
+
+    def setUp(self):
+        self.urlconf = tuple(self.router.patterns())
+
+    def _test_model_view(self, name, args):
+        assert_equal(
+            self.router.reverse(name, *args),
+            reverse(name, self.urlconf, args)
+        )
+
+    def test_model_views(self):
+        for prefix, models in MODEL_NAME_DICT.items():
+            for model_class in models:
+                model_name = model_class._meta.model_name
+                for action_name in ACTION_NAME_DICT:
+                    name = "{}-{}".format(model_name, action_name)
+                    if prefix:
+                        name = "{}:{}".format(prefix, name)
+                    for args in ACTION_ARGS_DICT[action_name] or [None]:
+                        yield (
+                            self._test_model_view,
+                            name, [args] if args else []
+                        )
+
+
+class LazyReverseTestCase(ReverseTestCase):
+    def setUp(self):
+        Router.lazy_include = True
+        super().setUp()
+
+    def tearDown(self):
+        Router.lazy_include = False
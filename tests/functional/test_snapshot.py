@@ -0,0 +1,129 @@
+import os
+from tempfile import mkstemp
+
+from nose.tools import assert_equal, assert_raises
+from django.conf.urls import url, include
+from django.utils.translation import ugettext_lazy
+from django.views.generic import View
+
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import ViewRoute
+from django_crucrudile.routers.snapshot import dump_pattern
+from django_crucrudile.resolvers import LazyRegexURLResolver
+
+from .test_resolving import ResolveTestCase
+
+
+class First:
+    class SwappedView(View):
+        pass
+
+
+class Second:
+    class SwappedView(View):
+        pass
+
+
+class SnapshotResolveTestCase(ResolveTestCase):
+    def setUp(self):
+        handle, self.path = mkstemp()
+        os.close(handle)
+        self.built = list(self.router.patterns())
+        self.built_tree = self.router.get_str_tree()
+        self.router.snapshot(self.path)
+        self.patterns = self.router.load_snapshot(self.path)
+        self.url = url(
+            '^/',
+            include(self.patterns),
+        )
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_loaded(self):
+        assert self.patterns[0] is not self.built[0]
+        assert_equal(
+            [dump_pattern(pattern) for pattern in self.patterns],
+            [dump_pattern(pattern) for pattern in self.built]
+        )
+        assert next(self.router.patterns()) is self.patterns[0]
+        assert_equal(self.router.get_str_tree(), self.built_tree)
+
+
+class LazySnapshotResolveTestCase(SnapshotResolveTestCase):
+    def setUp(self):
+        Router.lazy_include = True
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        Router.lazy_include = False
+
+    def test_lazy_resolver(self):
+        lazy = self.patterns[0].url_patterns[-1]
+        assert isinstance(lazy, LazyRegexURLResolver)
+        assert not lazy.is_built
+
+
+class AliasSnapshotResolveTestCase(SnapshotResolveTestCase):
+    def setUp(self):
+        Router.redirect_mode = 'alias'
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        Router.redirect_mode = 'lazy'
+
+
+class SnapshotInvalidationTestCase:
+    def setUp(self):
+        handle, self.path = mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def make_router(self, view_class):
+        router = Router()
+        router.register(ViewRoute.make_for_view(view_class, name='view')())
+        return router
+
+    def test_swapped_view(self):
+        self.make_router(First.SwappedView).snapshot(self.path)
+
+        router = self.make_router(First.SwappedView)
+        router.load_snapshot(self.path)
+        assert_equal(router.patterns_cache_misses, 0)
+
+        router = self.make_router(Second.SwappedView)
+        patterns = router.load_snapshot(self.path)
+        assert_equal(router.patterns_cache_misses, 1)
+        assert patterns[0].url_patterns[0].callback.view_class is (
+            Second.SwappedView
+        )
+
+    def make_part_router(self, url_part):
+        router = Router(url_part=url_part)
+        router.register(ViewRoute(First.SwappedView, name='view'))
+        return router
+
+    def test_lazy_url_part(self):
+        self.make_part_router(ugettext_lazy('alpha')).snapshot(self.path)
+
+        router = self.make_part_router(ugettext_lazy('alpha'))
+        router.load_snapshot(self.path)
+        assert_equal(router.patterns_cache_misses, 0)
+
+        router = self.make_part_router(ugettext_lazy('beta'))
+        patterns = router.load_snapshot(self.path)
+        assert_equal(router.patterns_cache_misses, 1)
+        assert_equal(patterns[0].regex.pattern, '^beta/')
+
+    def test_undescribable_value(self):
+        self.make_part_router('alpha').snapshot(self.path)
+
+        router = self.make_part_router('alpha')
+        router.get_store_snapshot()[0].extra = object()
+        router.load_snapshot(self.path)
+        assert_equal(router.patterns_cache_misses, 1)
+        assert_raises(ValueError, router.snapshot, self.path)
@@ -1,11 +1,17 @@
 import hashlib
-from nose.tools import assert_equal
+from threading import Thread
+from nose.tools import assert_equal, assert_raises
 
 from django.db import models
 
+from django.views.generic import ListView
+
+from django_crucrudile.entities.store import provides
 from django_crucrudile.routers import (
     Router as BaseRouter,
+    GenericModelRouter,
 )
+from django_crucrudile.routes.mixins.view import ViewMixin
 
 
 class DocumentModel(models.Model):
@@ -106,3 +112,253 @@ class RouterTestCase:
             tree_hash,
             "87e2e955bdf56a63227461d11a05fc6983e426b2b5b9419e1bc271b21a075a02"
         )
+
+    def test_freeze_routes(self):
+        tree = self.base_router.get_str_tree()
+        urlconf = tuple(self.base_router.patterns())
+        url = self.base_router.reverse('documents:documentmodel-list')
+
+        assert self.base_router.freeze_routes() > 0
+        assert_equal(self.base_router.get_str_tree(), tree)
+        assert_equal(
+            self.base_router.reverse('documents:documentmodel-list'), url
+        )
+        assert next(self.base_router.patterns()) is not urlconf[0]
+        assert_equal(
+            [entity.url_name for entity in
+             self.base_router.find(recursive=True, model=DocumentModel)
+             if not isinstance(entity, BaseRouter)],
+            [entity.get_url_name() for entity in
+             self.documents_router._store[0].get_store_snapshot()]
+        )
+
+    def test_freeze(self):
+        tree = self.base_router.get_str_tree()
+        url = self.base_router.reverse('documents:documentmodel-list')
+
+        patterns = self.base_router.freeze()
+        assert_equal(self.base_router.get_str_tree(), tree)
+        assert next(self.base_router.patterns()) is patterns[0]
+        assert self.base_router.patterns_cache_hits > 0
+        assert_equal(
+            self.base_router.reverse('documents:documentmodel-list'), url
+        )
+        assert isinstance(self.documents_router._store, tuple)
+        assert_raises(
+            ValueError, self.documents_router.register, DocumentModel
+        )
+        assert_raises(
+            ValueError, self.base_router.unregister, self.entities_router
+        )
+        assert_equal(self.base_router.freeze_routes(), 0)
+
+    def test_register_many(self):
+        documents_router = Router(
+            namespace="documents",
+            url_part="documents"
+        )
+        documents_router.register_many(
+            [DocumentModel, GroupModel, PhaseModel]
+        )
+        documents_router.register(DocumentModel, index=True)
+
+        assert_equal(
+            [entity.model for entity in documents_router._store],
+            [DocumentModel, GroupModel, PhaseModel, DocumentModel]
+        )
+        assert_equal(
+            documents_router.redirect,
+            documents_router._store[3]
+        )
+
+        base_router = Router()
+        base_router.register_many(
+            [self.documents_router, self.entities_router]
+        )
+        base_router.register_many([CommentModel, TaskModel])
+        base_router.redirect = self.documents_router
+
+        assert_equal(
+            base_router.get_str_tree(),
+            self.base_router.get_str_tree()
+        )
+
+    def test_find(self):
+        model_router = self.documents_router.get(model=DocumentModel)
+
+        assert_equal(
+            self.base_router.find(recursive=True, model=DocumentModel),
+            [model_router] + model_router._store
+        )
+        assert_equal(
+            self.base_router.get(
+                recursive=True,
+                url_name="documentmodel-list"
+            ).view_class.__name__,
+            "ListView"
+        )
+        assert_equal(
+            self.base_router.find(model=DocumentModel),
+            []
+        )
+
+    def test_concurrent_register(self):
+        router = Router()
+        models = [DocumentModel, GroupModel, PhaseModel, EntityModel]
+        errors = []
+
+        def register():
+            for model in models:
+                router.register(model)
+
+        def read():
+            try:
+                for _ in range(20):
+                    list(router.patterns())
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+
+        threads = [Thread(target=register) for _ in range(4)]
+        threads += [Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_equal(errors, [])
+        assert_equal(len(router._store), 4 * len(models))
+        assert_equal(router.get_store_snapshot(), tuple(router._store))
+
+    def test_concurrent_lazy_include(self):
+        router = Router()
+        child = Router(url_part='child', namespace='child')
+        child.lazy_include = True
+        router.register(child)
+        child.register(DocumentModel)
+        calls = []
+        build_url_group = child.build_url_group
+
+        def counting_build_url_group(*args):
+            calls.append(args)
+            return build_url_group(*args)
+
+        child.build_url_group = counting_build_url_group
+        pattern = next(router.patterns())
+        matches = []
+
+        def resolve():
+            matches.append(
+                pattern.resolve('child/documentmodel/list').view_name
+            )
+
+        threads = [Thread(target=resolve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert_equal(len(calls), 1)
+        assert_equal(matches, ['child:documentmodel-list'] * 8)
+
+    def test_shared_route_classes(self):
+        GenericModelRouter.register_deferred_classes()
+        before = ViewMixin.get_route_class_report()
+
+        @provides(ListView, map_kwargs={'index': True})
+        class ListRouter(GenericModelRouter):
+            pass
+
+        ListRouter.register_deferred_classes()
+        assert_equal(
+            ListRouter._base_store[-1],
+            GenericModelRouter._base_store[-1]
+        )
+        after = ViewMixin.get_route_class_report()
+        assert_equal(after['classes'], before['classes'])
+        assert_equal(after['hits'], before['hits'] + 1)
+
+    def test_patterns_cache(self):
+        pattern = next(self.base_router.patterns())
+        assert_equal(next(self.base_router.patterns()), pattern)
+
+        self.documents_router.register(TaskModel)
+        new_pattern = next(self.base_router.patterns())
+        assert new_pattern is not pattern
+
+        self.entities_router.redirect = None
+        assert next(self.base_router.patterns()) is not new_pattern
+
+    def test_patterns_cache_attributes(self):
+        pattern = next(self.base_router.patterns())
+
+        self.documents_router.url_part = "docs"
+        new_pattern = next(self.base_router.patterns())
+        assert new_pattern is not pattern
+        assert_equal(
+            self.base_router.reverse('documents:documentmodel-list'),
+            '/docs/documentmodel/list'
+        )
+
+        route = self.entities_router.find(
+            url_name='entitymodel-list', recursive=True
+        )[0]
+        route.url_part = "all"
+        assert next(self.base_router.patterns()) is not new_pattern
+        assert_equal(
+            self.base_router.reverse('entities:entitymodel-list'),
+            '/entities/entitymodel/all'
+        )
+
+    def test_redirect_graph(self):
+        graph = self.base_router.get_redirect_graph()
+        assert_equal(
+            graph.follow(self.base_router.redirect)[:2],
+            (('documents',), 'documentmodel-list')
+        )
+        assert self.documents_router.get_redirect_graph() is graph
+        assert self.entities_router.get_redirect_graph() is graph
+
+        list(self.base_router.patterns())
+        assert self.base_router.get_redirect_graph() is graph
+
+        self.documents_router.register(TaskModel, index=True)
+        assert self.base_router.get_redirect_graph() is not graph
+        assert_equal(
+            self.base_router.get_redirect_graph().follow(
+                self.base_router.redirect
+            )[:2],
+            (('documents',), 'taskmodel-list')
+        )
+
+    def test_redirect_graph_attributes(self):
+        graph = self.base_router.get_redirect_graph()
+        index = self.documents_router.redirect
+        index.redirect = 'groupmodel-list'
+        assert self.documents_router.get_redirect_graph() is not graph
+        assert_equal(
+            self.base_router.get_redirect_graph().follow(
+                self.base_router.redirect
+            )[:2],
+            (('documents',), 'groupmodel-list')
+        )
+
+    def test_redirect_graph_outside_subtree(self):
+        self.documents_router.redirect = self.entities_router
+        graph = self.base_router.get_redirect_graph()
+        assert_equal(
+            self.documents_router.get_redirect_graph().follow(
+                self.documents_router.redirect
+            )[:2],
+            (('entities',), 'entitymodel-list')
+        )
+        pattern = next(self.documents_router.patterns())
+
+        self.entities_router.register(InterfaceModel, index=True)
+        assert self.documents_router.get_redirect_graph() is not graph
+        assert_equal(
+            self.documents_router.get_redirect_graph().follow(
+                self.documents_router.redirect
+            )[:2],
+            (('entities',), 'interfacemodel-list')
+        )
+        assert next(self.documents_router.patterns()) is not pattern